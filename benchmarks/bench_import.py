@@ -0,0 +1,63 @@
+"""
+Benchmark importing supriya, as tracked by ``python -X importtime``.
+
+Run with ``python benchmarks/bench_import.py``. Imports supriya in fresh
+interpreters and reports the best cumulative import times, the number of UGen
+modules loaded along the way, and the cost of then loading every UGen and
+generating all of their constructors. Best times are least affected by noise.
+"""
+import subprocess
+import sys
+
+script = """
+import sys
+import time
+import supriya
+import supriya.ugens
+ugen_module_count = sum(1 for x in sys.modules if x.startswith("supriya.ugens."))
+start_time = time.perf_counter()
+for name in dir(supriya.ugens):
+    ugen_class = getattr(supriya.ugens, name)
+    if not isinstance(ugen_class, supriya.synthdefs.UGenMeta):
+        continue
+    for method_name in ("__init__", "ar", "kr", "ir", "new"):
+        getattr(ugen_class, method_name, None)
+print(ugen_module_count, time.perf_counter() - start_time, file=sys.stderr)
+"""
+
+
+def measure(module_names):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", script],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    lines = result.stderr.splitlines()
+    import_times = {}
+    for line in lines[:-1]:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        name = name.strip()
+        if name in module_names and name not in import_times:
+            import_times[name] = int(cumulative) / 1e3
+    ugen_module_count, load_seconds = lines[-1].split()
+    return import_times, int(ugen_module_count), float(load_seconds) * 1e3
+
+
+def main(run_count=20, module_names=("supriya", "supriya.synthdefs", "supriya.ugens")):
+    measurements = [measure(module_names) for _ in range(run_count)]
+    for name in module_names:
+        import_times = [x[0][name] for x in measurements if name in x[0]]
+        print("{:<32} {:>10.1f} ms".format(name, min(import_times)))
+    print("{:<32} {:>10}".format("ugen modules loaded", measurements[0][1]))
+    print(
+        "{:<32} {:>10.1f} ms".format(
+            "then load all ugens", min(x[2] for x in measurements)
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Benchmark OSC callback matching against growing numbers of registered callbacks.
+
+Run with ``python benchmarks/bench_osc_callbacks.py``. Matching time should stay
+flat as per-node ``/n_end`` watchers and wildcard callbacks are added.
+"""
+import timeit
+
+from supriya.osc import OscMessage
+from supriya.osc.callbacks import OscCallback, OscCallbackIndex
+
+
+def main(counts=(10, 100, 1000, 10000), number=20000):
+    message = OscMessage("/n_end", 1005, 1, -1, -1, 0)
+    print("{:>10} {:>12} {:>12}".format("callbacks", "match usec", "remove usec"))
+    for count in counts:
+        index = OscCallbackIndex()
+        index.add(OscCallback(pattern=("/{n_go,n_end}",), procedure=print))
+        index.add(OscCallback(pattern=("/b_*",), procedure=print))
+        callbacks = [
+            OscCallback(pattern=("/n_end", 1000 + i), procedure=print, once=True)
+            for i in range(count)
+        ]
+        for callback in callbacks:
+            index.add(callback)
+        seconds = min(
+            timeit.repeat(lambda: list(index.match(message)), number=number, repeat=5)
+        )
+        match_usec = seconds / number * 1e6
+        seconds = timeit.timeit(lambda: index.remove(callbacks.pop()), number=count)
+        print("{:>10} {:>12.2f} {:>12.2f}".format(count, match_usec, seconds / count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark OSC datagram decoding across datagram sizes.
+
+Run with ``python benchmarks/bench_osc_decode.py``. Per-kilobyte timings should
+stay flat as datagrams grow towards the 8192-byte UDP limit.
+"""
+import timeit
+
+from supriya.osc import OscBundle, OscMessage
+
+
+def build_message(size):
+    contents = []
+    osc_message = OscMessage("/c_setn", *contents)
+    while len(osc_message.to_datagram()) < size - 12:
+        contents.extend([len(contents), 0.5])
+        osc_message = OscMessage("/c_setn", *contents)
+    return osc_message
+
+
+def build_bundle(size):
+    contents = []
+    osc_bundle = OscBundle(contents=contents)
+    while len(osc_bundle.to_datagram()) < size - 24:
+        contents.append(OscMessage("/n_set", 1000 + len(contents), "amplitude", 0.5))
+        osc_bundle = OscBundle(contents=contents)
+    return osc_bundle
+
+
+def main(sizes=(1024, 2048, 4096, 8192), number=200):
+    print("{:<8} {:>8} {:>12} {:>12}".format("kind", "bytes", "usec/decode", "usec/KB"))
+    for kind, builder, class_ in (
+        ("message", build_message, OscMessage),
+        ("bundle", build_bundle, OscBundle),
+    ):
+        for size in sizes:
+            datagram = builder(size).to_datagram()
+            seconds = min(
+                timeit.repeat(
+                    lambda: class_.from_datagram(datagram), number=number, repeat=5
+                )
+            )
+            usec = seconds / number * 1e6
+            print(
+                "{:<8} {:>8} {:>12.1f} {:>12.2f}".format(
+                    kind, len(datagram), usec, usec / (len(datagram) / 1024)
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
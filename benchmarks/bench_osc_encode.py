@@ -0,0 +1,61 @@
+"""
+Benchmark OSC message and bundle encoding.
+
+Run with ``python benchmarks/bench_osc_encode.py``. Compares the compiled
+per-signature encoders against the generic value-by-value encoding path.
+"""
+import timeit
+
+from supriya.osc import OscBundle, OscMessage
+from supriya.osc.messages import _compile_encoder
+
+
+def encode_generic(osc_message):
+    encoded_type_tags, encoded_contents = ",", b""
+    for value in osc_message.contents:
+        type_tags, encoded_value = osc_message._encode_value(value)
+        encoded_type_tags += type_tags
+        encoded_contents += encoded_value
+    return (
+        osc_message._encode_string(osc_message.address)
+        + osc_message._encode_string(encoded_type_tags)
+        + encoded_contents
+    )
+
+
+def main(number=20000):
+    messages = {
+        "/s_new": OscMessage(
+            "/s_new", "default", 1000, 0, 1, "amplitude", 0.5, "frequency", 440.0
+        ),
+        "/n_set": OscMessage("/n_set", 1000, "frequency", 443.0, "gate", 0),
+        "/n_free": OscMessage("/n_free", 1000),
+    }
+    print("{:<10} {:>14} {:>14}".format("message", "generic usec", "compiled usec"))
+    for name, osc_message in messages.items():
+        assert encode_generic(osc_message) == osc_message.to_datagram()
+        timings = []
+        for function in (encode_generic, OscMessage.to_datagram):
+            seconds = min(
+                timeit.repeat(lambda: function(osc_message), number=number, repeat=5)
+            )
+            timings.append(seconds / number * 1e6)
+        print("{:<10} {:>14.2f} {:>14.2f}".format(name, *timings))
+    osc_bundle = OscBundle(
+        timestamp=1.5,
+        contents=[
+            OscMessage("/n_set", 1000 + i, "frequency", 443.0, "gate", 0)
+            for i in range(200)
+        ],
+    )
+    seconds = min(
+        timeit.repeat(osc_bundle.to_datagram, number=number // 100, repeat=5)
+    )
+    print(
+        "bundle of 200 /n_set: {:.1f} usec".format(seconds / (number // 100) * 1e6)
+    )
+    print(_compile_encoder.cache_info())
+
+
+if __name__ == "__main__":
+    main()
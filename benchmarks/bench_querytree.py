@@ -0,0 +1,60 @@
+"""
+Benchmark parsing ``/g_queryTree.reply`` messages into query tree objects.
+
+Run with ``python benchmarks/bench_querytree.py``. Per-node timings should stay
+flat as the tree grows, whether the reply is wide or deeply nested.
+"""
+import timeit
+
+from supriya.commands import QueryTreeResponse
+from supriya.osc import OscMessage
+
+CONTROLS = ["out", 0.0, "amplitude", 0.1, "frequency", 440.0, "gate", 1.0, "pan", 0.5]
+
+
+def build_reply(node_count, group_size=100):
+    """
+    Build a reply for ``node_count`` synths with controls, spread across
+    groups of ``group_size`` synths each.
+    """
+    group_count = max(node_count // group_size, 1)
+    contents = [1, 0, group_count]
+    node_id = 1000
+    for group_index in range(group_count):
+        contents.extend([group_index + 1, group_size])
+        for _ in range(group_size):
+            contents.extend([node_id, -1, "default", len(CONTROLS) // 2, *CONTROLS])
+            node_id += 1
+    return OscMessage("/g_queryTree.reply", *contents)
+
+
+def build_deep_reply(depth):
+    contents = [0]
+    for node_id in range(depth):
+        contents.extend([node_id, 1])
+    contents.extend([depth, -1, "default"])
+    return OscMessage("/g_queryTree.reply", *contents)
+
+
+def main(sizes=(1000, 10000, 50000), number=3):
+    print("{:<6} {:>8} {:>12} {:>12}".format("kind", "nodes", "msec/parse", "usec/node"))
+    for kind, builder in (("wide", build_reply), ("deep", build_deep_reply)):
+        for size in sizes:
+            message = builder(size)
+            seconds = min(
+                timeit.repeat(
+                    lambda: QueryTreeResponse.from_osc_message(message),
+                    number=number,
+                    repeat=3,
+                )
+            )
+            msec = seconds / number * 1e3
+            print(
+                "{:<6} {:>8} {:>12.1f} {:>12.2f}".format(
+                    kind, size, msec, msec * 1e3 / size
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark the time and peak memory of building very large SynthDefs.
+
+Run with ``python benchmarks/bench_synthdef_build.py``. Builds additive banks of
+roughly 1k, 10k and 50k UGens, and compares copying their graphs with
+``copy.deepcopy()`` against the linear copy builders now make. Builders copy
+once, and hand those copies to the SynthDef rather than it copying them again.
+"""
+import copy
+import time
+import tracemalloc
+
+from bench_synthdef_compile import build_additive_bank
+
+from supriya.synthdefs import SynthDef
+
+
+def measured(procedure, *args):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    procedure(*args)
+    seconds = time.perf_counter() - start_time
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak_bytes
+
+
+def main(counts=(1000, 10000, 50000)):
+    print(
+        "{:>8} {:>10} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+            "ugens",
+            "build ms",
+            "build MB",
+            "deep ms",
+            "deep MB",
+            "linear ms",
+            "linear MB",
+        )
+    )
+    for count in counts:
+        builder = build_additive_bank(count)
+        ugens = list(builder._parameters.values()) + list(builder._ugens)
+        build_seconds, build_bytes = measured(builder.build)
+        deep_seconds, deep_bytes = measured(copy.deepcopy, ugens)
+        linear_seconds, linear_bytes = measured(SynthDef._copy_ugen_graph, ugens)
+        print(
+            "{:>8} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.1f}".format(
+                len(ugens),
+                build_seconds * 1e3,
+                build_bytes / 2 ** 20,
+                deep_seconds * 1e3,
+                deep_bytes / 2 ** 20,
+                linear_seconds * 1e3,
+                linear_bytes / 2 ** 20,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark SynthDef sorting and compilation for very large UGen graphs.
+
+Run with ``python benchmarks/bench_synthdef_compile.py``. Builds additive banks of
+roughly 1k, 10k and 50k UGens. Per-UGen timings should stay near flat as graphs
+grow, showing linear scaling.
+"""
+import time
+
+import supriya.ugens
+from supriya.synthdefs import SynthDef, SynthDefBuilder, SynthDefCompiler
+
+
+def build_additive_bank(ugen_count):
+    # Each partial is a frequency multiply, a SinOsc and an amplitude multiply,
+    # summed through a tree of Sum4s. Every partial shares the same controls
+    # and brings its own constants.
+    with SynthDefBuilder(frequency=440, amplitude=0.1) as builder:
+        partials = []
+        for i in range(ugen_count // 4):
+            sin_osc = supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+            partials.append(sin_osc * (builder["amplitude"] / (i + 1.5)))
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.Mix.new(partials))
+    return builder
+
+
+def timed(procedure, *args):
+    start_time = time.perf_counter()
+    result = procedure(*args)
+    return result, time.perf_counter() - start_time
+
+
+def main(counts=(1000, 10000, 50000)):
+    print(
+        "{:>8} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+            "ugens", "build ms", "sort ms", "compile ms", "sort us/u", "comp us/u"
+        )
+    )
+    for count in counts:
+        builder = build_additive_bank(count)
+        synthdef, build_seconds = timed(builder.build)
+        _, sort_seconds = timed(SynthDef._sort_ugens_topologically, synthdef.ugens)
+        _, compile_seconds = timed(SynthDefCompiler.compile_ugen_graph, synthdef)
+        ugen_count = len(synthdef.ugens)
+        print(
+            "{:>8} {:>10.1f} {:>10.1f} {:>10.1f} {:>10.2f} {:>10.2f}".format(
+                ugen_count,
+                build_seconds * 1e3,
+                sort_seconds * 1e3,
+                compile_seconds * 1e3,
+                sort_seconds / ugen_count * 1e6,
+                compile_seconds / ugen_count * 1e6,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
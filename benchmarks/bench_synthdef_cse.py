@@ -0,0 +1,57 @@
+"""
+Report how many UGens common-subexpression elimination removes.
+
+Run with ``python benchmarks/bench_synthdef_cse.py``. Builds SynthDefs whose
+blocks repeat the same pure LFOs and arithmetic, and prints their UGen counts
+with dead-code elimination alone, and with opt-in common-subexpression
+elimination too.
+"""
+import supriya.ugens
+from supriya.synthdefs import SynthDefBuilder
+
+
+def build_detuned_voices(voice_count):
+    # Every voice rebuilds the same vibrato LFO and the same scaled frequency.
+    with SynthDefBuilder(frequency=440, amplitude=0.1) as builder:
+        voices = []
+        for i in range(voice_count):
+            lfo = supriya.ugens.SinOsc.kr(frequency=0.25)
+            frequency = builder["frequency"] * (1 + lfo * 0.01)
+            voices.append(supriya.ugens.LFSaw.ar(frequency=frequency * (1 + i * 0.001)))
+        source = supriya.ugens.Mix.new(voices) * builder["amplitude"]
+        supriya.ugens.Out.ar(bus=0, source=source)
+    return builder
+
+
+def build_filter_chain(block_count):
+    # Each signal block builds its own copy of a shared LFO.
+    with SynthDefBuilder(frequency=440) as builder:
+        lfo = supriya.ugens.SinOsc.kr(frequency=0.25)
+        frequency = builder["frequency"] * (1 + lfo * 0.01)
+        source = supriya.ugens.Saw.ar(frequency=frequency)
+        for _ in range(block_count):
+            lfo = supriya.ugens.SinOsc.kr(frequency=0.25)
+            source = supriya.ugens.LPF.ar(source=source, frequency=1000 + lfo * 500)
+        supriya.ugens.Out.ar(bus=0, source=source)
+    return builder
+
+
+def main():
+    print("{:<24} {:>10} {:>10} {:>10}".format("synthdef", "dce", "dce+cse", "removed"))
+    for label, source in [
+        ("detuned voices x8", build_detuned_voices(8)),
+        ("detuned voices x64", build_detuned_voices(64)),
+        ("filter chain x4", build_filter_chain(4)),
+        ("filter chain x16", build_filter_chain(16)),
+    ]:
+        before = len(source.build().ugens)
+        after = len(source.build(eliminate_common_subexpressions=True).ugens)
+        print(
+            "{:<24} {:>10} {:>10} {:>9.0%}".format(
+                label, before, after, (before - after) / before
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
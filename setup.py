@@ -33,12 +33,14 @@ extras_require = {
         "jupyter_nbextensions_configurator",
         "rise",
     ],
+    "numpy": ["numpy"],
     "wave": ["wavefile"],
     "test": [
         "black",
         "flake8",
         "isort",
         "mypy >= 0.720",
+        "numpy",
         "pytest >= 5.0.0",
         "pytest-asyncio >= 0.10.0",
         "pytest-cov >= 2.7.1",
@@ -25,22 +25,25 @@ class ControlBusSetContiguousResponse(Response, collections.Sequence):
     def __len__(self):
         return len(self._items)
 
-    ### PUBLIC METHODS ###
+    ### PRIVATE METHODS ###
 
-    @classmethod
-    def from_osc_message(cls, osc_message):
+    def _parse(self, osc_message):
         items = []
         contents = list(osc_message.contents)
         while contents:
             starting_bus_id = contents[0]
             bus_count = contents[1]
             bus_values = tuple(contents[2 : 2 + bus_count])
-            item = cls.Item(starting_bus_id=starting_bus_id, bus_values=bus_values)
+            item = self.Item(starting_bus_id=starting_bus_id, bus_values=bus_values)
             items.append(item)
             contents = contents[2 + bus_count :]
-        items = tuple(items)
-        response = cls(items=items)
-        return response
+        self._items = tuple(items)
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_osc_message(cls, osc_message):
+        return cls._from_osc_message_lazily(osc_message)
 
     ### PUBLIC PROPERTIES ###
 
@@ -25,16 +25,20 @@ class ControlBusSetResponse(Response, collections.Sequence):
     def __len__(self):
         return len(self._items)
 
+    ### PRIVATE METHODS ###
+
+    def _parse(self, osc_message):
+        items = []
+        for group in self._group_items(osc_message.contents, 2):
+            item = self.Item(*group)
+            items.append(item)
+        self._items = tuple(items)
+
     ### PUBLIC METHODS ###
 
     @classmethod
     def from_osc_message(cls, osc_message):
-        items = []
-        for group in cls._group_items(osc_message.contents, 2):
-            item = cls.Item(*group)
-            items.append(item)
-        response = cls(items=tuple(items))
-        return response
+        return cls._from_osc_message_lazily(osc_message)
 
     ### PUBLIC PROPERTIES ###
 
@@ -90,6 +90,8 @@ class GroupNewRequest(Request):
 
     request_id = RequestId.GROUP_NEW
 
+    _apply_local_bulk = staticmethod(Request._apply_local_node_moves)
+
     ### INITIALIZER ###
 
     def __init__(self, items=None):
@@ -113,6 +115,9 @@ class GroupNewRequest(Request):
     ### PRIVATE METHODS ###
 
     def _apply_local(self, server):
+        Node._move_nodes(self._register_local(server))
+
+    def _register_local(self, server):
         for item in self.items:
             if isinstance(item.node_id, Group):
                 node_id = None
@@ -129,7 +134,7 @@ class GroupNewRequest(Request):
                 node_id_is_permanent=group.node_id_is_permanent,
                 server=server,
             )
-            target_node._move_node(add_action=item.add_action, node=group)
+            yield target_node, item.add_action, group
 
     ### PUBLIC METHODS ###
 
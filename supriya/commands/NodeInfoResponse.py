@@ -1,8 +1,85 @@
+from typing import NamedTuple, Optional, Tuple
+
 from supriya.commands.Response import Response
 from supriya.enums import NodeAction
 
 
+def _coerce_node_id(node_id):
+    if node_id is not None and -1 < node_id:
+        return node_id
+    return None
+
+
+class NodeInfo(NamedTuple):
+    """
+    A lightweight, tuple-based parse of a node notification.
+
+    Used in place of ``NodeInfoResponse`` by server-internal handlers, so that
+    high-rate ``/n_go`` and ``/n_end`` traffic allocates a single tuple.
+
+    ::
+
+        >>> message = supriya.osc.OscMessage("/n_go", 1001, 1, -1, 1000, 0)
+        >>> node_info = supriya.commands.NodeInfo.from_osc_message(message)
+        >>> node_info.action, node_info.node_id, node_info.previous_node_id
+        (NodeAction.NODE_CREATED, 1001, None)
+
+    """
+
+    action: NodeAction
+    node_id: Optional[int]
+    parent_id: Optional[int]
+    previous_node_id: Optional[int]
+    next_node_id: Optional[int]
+    is_group: bool
+    head_node_id: Optional[int] = None
+    tail_node_id: Optional[int] = None
+    synthdef_name: Optional[str] = None
+    synthdef_controls: Optional[Tuple] = None
+
+    @classmethod
+    def from_osc_message(cls, osc_message):
+        contents = osc_message.contents
+        is_group = contents[4]
+        head_node_id = tail_node_id = synthdef_name = synthdef_controls = None
+        if is_group:
+            head_node_id = _coerce_node_id(contents[5])
+            tail_node_id = _coerce_node_id(contents[6])
+        elif len(contents) > 5:
+            synthdef_name = contents[5]
+            synthdef_controls = tuple(
+                (contents[7 + (i * 2)], contents[8 + (i * 2)])
+                for i in range(contents[6])
+            )
+        return cls(
+            NodeAction.from_address(osc_message.address),
+            _coerce_node_id(contents[0]),
+            _coerce_node_id(contents[1]),
+            _coerce_node_id(contents[2]),
+            _coerce_node_id(contents[3]),
+            bool(is_group),
+            head_node_id,
+            tail_node_id,
+            synthdef_name,
+            synthdef_controls,
+        )
+
+
 class NodeInfoResponse(Response):
+    """
+    A node notification response.
+
+    Responses created via ``from_osc_message()`` are lazy: their OSC message
+    is only parsed once one of their fields is first read.
+
+    ::
+
+        >>> message = supriya.osc.OscMessage("/n_go", 1000, 1, -1, -1, 1, -1, -1)
+        >>> response = supriya.commands.NodeInfoResponse.from_osc_message(message)
+        >>> response.is_group, response.parent_id
+        (True, 1)
+
+    """
 
     ### INITIALIZER ###
 
@@ -21,44 +98,35 @@ class NodeInfoResponse(Response):
     ):
         self._action = NodeAction.from_address(action)
         self._is_group = bool(is_group)
-        self._head_node_id = self._coerce_node_id(head_node_id)
-        self._next_node_id = self._coerce_node_id(next_node_id)
-        self._node_id = self._coerce_node_id(node_id)
-        self._parent_id = self._coerce_node_id(parent_id)
-        self._previous_node_id = self._coerce_node_id(previous_node_id)
-        self._tail_node_id = self._coerce_node_id(tail_node_id)
+        self._head_node_id = _coerce_node_id(head_node_id)
+        self._next_node_id = _coerce_node_id(next_node_id)
+        self._node_id = _coerce_node_id(node_id)
+        self._parent_id = _coerce_node_id(parent_id)
+        self._previous_node_id = _coerce_node_id(previous_node_id)
+        self._tail_node_id = _coerce_node_id(tail_node_id)
         self._synthdef_name = synthdef_name
         self._synthdef_controls = synthdef_controls
 
     ### PRIVATE METHODS ###
 
-    def _coerce_node_id(self, node_id):
-        if node_id is not None and -1 < node_id:
-            return node_id
-        return None
+    def _parse(self, osc_message):
+        info = NodeInfo.from_osc_message(osc_message)
+        self._action = info.action
+        self._is_group = info.is_group
+        self._head_node_id = info.head_node_id
+        self._next_node_id = info.next_node_id
+        self._node_id = info.node_id
+        self._parent_id = info.parent_id
+        self._previous_node_id = info.previous_node_id
+        self._tail_node_id = info.tail_node_id
+        self._synthdef_name = info.synthdef_name
+        self._synthdef_controls = info.synthdef_controls
 
     ### PUBLIC METHODS ###
 
     @classmethod
     def from_osc_message(cls, osc_message):
-        arguments = (osc_message.address,) + osc_message.contents
-        kwargs = dict(
-            action=arguments[0],
-            node_id=arguments[1],
-            parent_id=arguments[2],
-            previous_node_id=arguments[3],
-            next_node_id=arguments[4],
-            is_group=arguments[5],
-        )
-        if arguments[5]:
-            kwargs.update(head_node_id=arguments[6], tail_node_id=arguments[7])
-        elif len(arguments) > 6:
-            controls = []
-            for i in range(arguments[7]):
-                controls.append((arguments[8 + (i * 2)], arguments[9 + (i * 2)]))
-            kwargs.update(synthdef_name=arguments[6], synthdef_controls=tuple(controls))
-        response = cls(**kwargs)
-        return response
+        return cls._from_osc_message_lazily(osc_message)
 
     ### PUBLIC PROPERTIES ###
 
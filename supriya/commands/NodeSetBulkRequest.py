@@ -0,0 +1,305 @@
+import supriya.osc
+from supriya.commands.Request import Request
+from supriya.enums import RequestId
+from supriya.osc.messages import BUNDLE_PREFIX
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
+
+class NodeSetBulkRequest(Request):
+    """
+    A columnar /n_set or /n_setn request, setting one control on many nodes.
+
+    Node ids and values are taken as parallel columns, NumPy arrays or plain
+    sequences, and OSC messages are generated directly from them, one per
+    node, without building an intermediate request per node.
+
+    ::
+
+        >>> import numpy
+        >>> request = supriya.commands.NodeSetBulkRequest(
+        ...     node_ids=numpy.arange(1000, 1003),
+        ...     control="frequency",
+        ...     values=numpy.array([440.0, 550.0, 660.0]),
+        ... )
+        >>> request.to_osc()
+        OscBundle(
+            contents=(
+                OscMessage('/n_set', 1000, 'frequency', 440.0),
+                OscMessage('/n_set', 1001, 'frequency', 550.0),
+                OscMessage('/n_set', 1002, 'frequency', 660.0),
+                ),
+            )
+
+    Two-dimensional values set a run of contiguous controls on each node,
+    starting at ``control``, via /n_setn:
+
+    ::
+
+        >>> request = supriya.commands.NodeSetBulkRequest(
+        ...     node_ids=[1000, 1001],
+        ...     control=2,
+        ...     values=[[0.5, 0.25], [1.0, 0.75]],
+        ... )
+        >>> request.request_id
+        RequestId.NODE_SET_CONTIGUOUS
+
+    ::
+
+        >>> for bundle in request.to_osc_bundles(maximum_packet_size=64):
+        ...     bundle
+        ...
+        OscBundle(
+            contents=(
+                OscMessage('/n_setn', 1000, 2, 2, 0.5, 0.25),
+                ),
+            )
+        OscBundle(
+            contents=(
+                OscMessage('/n_setn', 1001, 2, 2, 1.0, 0.75),
+                ),
+            )
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, node_ids, control, values):
+        Request.__init__(self)
+        if len(node_ids) != len(values):
+            raise ValueError(
+                "Expected {} values, got {}".format(len(node_ids), len(values))
+            )
+        if not isinstance(control, (int, str)):
+            raise ValueError(control)
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.ndim not in (1, 2):
+                raise ValueError(values)
+            is_contiguous = values.ndim == 2
+        else:
+            is_contiguous = (
+                bool(len(values))
+                and hasattr(values[0], "__len__")
+                and not isinstance(values[0], str)
+            )
+            if is_contiguous:
+                values = tuple(tuple(x) for x in values)
+        self._node_ids = self._freeze(node_ids)
+        self._control = control
+        self._values = self._freeze(values)
+        self._is_contiguous = is_contiguous
+
+    ### SPECIAL METHODS ###
+
+    def __eq__(self, expr):
+        if type(self) is not type(expr):
+            return False
+        return self._get_key() == expr._get_key()
+
+    def __hash__(self):
+        return hash((type(self), self._get_key()))
+
+    def __len__(self):
+        return len(self._node_ids)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _freeze(column):
+        # Columns are shared with the caller rather than copied, but are never
+        # writable through the request.
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            column = column.view()
+            column.flags.writeable = False
+            return column
+        return tuple(column)
+
+    def _get_key(self):
+        # Arrays and sequences holding the same numbers compare and hash alike.
+        node_ids, values = self._node_ids, self._values
+        if numpy is not None and isinstance(node_ids, numpy.ndarray):
+            node_ids = tuple(node_ids.tolist())
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.tolist()
+            if self._is_contiguous:
+                values = tuple(tuple(x) for x in values)
+            values = tuple(values)
+        return node_ids, self._control, values
+
+    def _apply_local(self, server):
+        import supriya.realtime
+
+        for node_id, value in zip(
+            self._iterate_column(self._node_ids), self._iterate_column(self._values)
+        ):
+            synth = server._nodes.get(node_id)
+            if not isinstance(synth, supriya.realtime.Synth):
+                continue
+            controls = synth.controls
+            if not self._is_contiguous:
+                name = self._get_control_name(controls, self._control)
+                if name is not None:
+                    controls._set(**{name: self._get_local_value(value, server)})
+                continue
+            if isinstance(self._control, str):
+                if self._control not in controls:
+                    continue
+                index = controls[self._control].index
+            else:
+                index = self._control
+            settings = {}
+            for i, x in enumerate(value, index):
+                name = self._get_control_name(controls, i)
+                if name is not None:
+                    settings[name] = self._get_local_value(x, server)
+            controls._set(**settings)
+
+    @staticmethod
+    def _get_control_name(controls, control):
+        if isinstance(control, str):
+            return control if control in controls else None
+        for synth_control in controls._synth_controls:
+            if synth_control.index == control:
+                return synth_control.name
+        return None
+
+    @staticmethod
+    def _get_local_value(value, server):
+        # Bus-mapping strings resolve to buses on this server, not the default.
+        import supriya.realtime
+
+        if not isinstance(value, str):
+            return value
+        match = supriya.realtime.ControlInterface._bus_pattern.match(value)
+        if not match:
+            return value
+        calculation_rate = "control" if match.group("type") == "c" else "audio"
+        return supriya.realtime.Bus(
+            bus_group_or_index=int(match.group("id")),
+            calculation_rate=calculation_rate,
+        ).allocate(server=server)
+
+    def _get_sizes(self):
+        # Numeric arrays encode every value as four bytes, so their sizes
+        # follow from shape alone. Anything else, like bus-mapping strings,
+        # is measured from its encoded messages.
+        if not self._has_numeric_values():
+            return [4 + len(x.to_datagram()) for x in self._iterate_messages()]
+        if isinstance(self._control, str):
+            control_size = (len(self._control.encode("ascii")) // 4 + 1) * 4
+        else:
+            control_size = 4
+        if not self._is_contiguous:
+            return [4 + 8 + 8 + 4 + control_size + 4] * len(self)
+        count = self._values.shape[1]
+        # bundle element length, address, type tags and arguments
+        size = 4 + 8 + ((4 + count) // 4 + 1) * 4 + 8 + control_size + count * 4
+        return [size] * len(self)
+
+    def _handle_async(self, sync, server):
+        maximum_packet_size = server.osc_protocol.maximum_packet_size
+        for bundle in self.to_osc_bundles(maximum_packet_size=maximum_packet_size):
+            server.send(bundle)
+        return True
+
+    def _has_numeric_values(self):
+        return (
+            numpy is not None
+            and isinstance(self._values, numpy.ndarray)
+            and self._values.dtype.kind in "fiu"
+        )
+
+    @staticmethod
+    def _iterate_column(column):
+        if numpy is not None and isinstance(column, numpy.ndarray):
+            return iter(column.tolist())
+        return iter(column)
+
+    def _iterate_messages(self, start=0, stop=None):
+        node_ids = self._node_ids[start:stop]
+        values = self._values[start:stop]
+        if numpy is not None and isinstance(node_ids, numpy.ndarray):
+            node_ids = node_ids.tolist()
+        request_name, control = self.request_name.value, self._control
+        OscMessage = supriya.osc.OscMessage
+        if not self._is_contiguous:
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                values = values.tolist()
+            for node_id, value in zip(node_ids, values):
+                yield OscMessage(request_name, node_id, control, value)
+        elif self._has_numeric_values():
+            # Rows stay arrays, and encode as one run of numbers each.
+            count = values.shape[1]
+            for node_id, row in zip(node_ids, values):
+                yield OscMessage(request_name, node_id, control, count, row)
+        else:
+            if numpy is not None and isinstance(values, numpy.ndarray):
+                values = values.tolist()
+            for node_id, row in zip(node_ids, values):
+                yield OscMessage(request_name, node_id, control, len(row), *row)
+
+    def _iterate_slices(self, maximum_packet_size):
+        return supriya.osc.OscBundle._partition_sizes(
+            self._get_sizes(), maximum_packet_size - len(BUNDLE_PREFIX) - 8
+        )
+
+    def _partition(self, maximum_packet_size):
+        return self.partition(maximum_packet_size)
+
+    ### PUBLIC METHODS ###
+
+    def partition(self, maximum_packet_size=8192):
+        """
+        Partition into requests whose OSC bundles fit ``maximum_packet_size``.
+        """
+        return [
+            type(self)(
+                node_ids=self._node_ids[start:stop],
+                control=self._control,
+                values=self._values[start:stop],
+            )
+            for start, stop in self._iterate_slices(maximum_packet_size)
+        ]
+
+    def to_osc(self, *, with_placeholders=False):
+        return supriya.osc.OscBundle(contents=tuple(self._iterate_messages()))
+
+    def to_osc_bundles(self, *, maximum_packet_size=8192, timestamp=None):
+        """
+        Generate OSC bundles, each fitting within ``maximum_packet_size``.
+        """
+        if not self._has_numeric_values():
+            return supriya.osc.OscBundle.partition(
+                self._iterate_messages(),
+                timestamp=timestamp,
+                maximum_packet_size=maximum_packet_size,
+            )
+        return [
+            supriya.osc.OscBundle(
+                timestamp=timestamp, contents=tuple(self._iterate_messages(start, stop))
+            )
+            for start, stop in self._iterate_slices(maximum_packet_size)
+        ]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def control(self):
+        return self._control
+
+    @property
+    def node_ids(self):
+        return self._node_ids
+
+    @property
+    def request_id(self):
+        if self._is_contiguous:
+            return RequestId.NODE_SET_CONTIGUOUS
+        return RequestId.NODE_SET
+
+    @property
+    def values(self):
+        return self._values
@@ -1,5 +1,5 @@
-import supriya.osc
 from supriya.commands.Request import Request
+from supriya.commands.RequestSchema import RequestSchema
 from supriya.enums import RequestId
 
 
@@ -35,34 +35,12 @@ class NodeSetRequest(Request):
 
     request_id = RequestId.NODE_SET
 
-    ### INITIALIZER ###
-
-    def __init__(self, node_id=None, **kwargs):
-        Request.__init__(self)
-        self._node_id = node_id
-        self._kwargs = kwargs
+    _schema = RequestSchema(("node_id", "node_id"), ("kwargs", "pairs"))
 
     ### SPECIAL METHODS ###
 
     def __getattr__(self, name):
-        if name in self._kwargs:
-            return self._kwargs[name]
-        return object.__getattr__(self, name)
-
-    ### PUBLIC METHODS ###
-
-    def to_osc(self, *, with_placeholders=False):
-        request_id = self.request_name
-        node_id = int(self.node_id)
-        contents = [request_id, node_id]
-        for key, value in sorted(self._kwargs.items()):
-            contents.append(key)
-            contents.append(value)
-        message = supriya.osc.OscMessage(*contents)
-        return message
-
-    ### PUBLIC PROPERTIES ###
-
-    @property
-    def node_id(self):
-        return self._node_id
+        for key, value in self.__dict__.get("_kwargs", ()):
+            if key == name:
+                return value
+        return object.__getattribute__(self, name)
@@ -64,37 +64,52 @@ class QueryTreeResponse(Response):
 
         """
 
-        def recurse(contents, control_flag):
-            node_id = contents.pop(0)
-            child_count = contents.pop(0)
+        # Walk the flat reply once with an index cursor, keeping an explicit
+        # stack of partially-filled groups rather than recursing.
+        contents = osc_message.contents
+        control_flag = bool(contents[0])
+        index = 1
+        query_tree_group = None
+        stack = []  # [node_id, remaining child count, children]
+        while True:
+            node_id, child_count = contents[index], contents[index + 1]
+            index += 2
             if child_count == -1:
-                controls = []
-                synthdef_name = contents.pop(0)
+                synthdef_name = contents[index]
+                index += 1
+                controls = ()
                 if control_flag:
-                    control_count = contents.pop(0)
-                    for i in range(control_count):
-                        control_name_or_index = contents.pop(0)
-                        control_value = contents.pop(0)
-                        control = QueryTreeControl(
-                            control_name_or_index=control_name_or_index,
-                            control_value=control_value,
+                    control_count = contents[index]
+                    index += 1
+                    stop = index + control_count * 2
+                    controls = tuple(
+                        QueryTreeControl(
+                            control_name_or_index=contents[i],
+                            control_value=contents[i + 1],
                         )
-                        controls.append(control)
-                controls = tuple(controls)
-                result = QueryTreeSynth(
+                        for i in range(index, stop, 2)
+                    )
+                    index = stop
+                node = QueryTreeSynth(
                     node_id=node_id, synthdef_name=synthdef_name, controls=controls
                 )
+            elif child_count:
+                stack.append([node_id, child_count, []])
+                continue
             else:
-                children = []
-                for i in range(child_count):
-                    children.append(recurse(contents, control_flag))
-                children = tuple(children)
-                result = QueryTreeGroup(node_id=node_id, children=children)
-            return result
-
-        contents = list(osc_message.contents)
-        control_flag = bool(contents.pop(0))
-        query_tree_group = recurse(contents, control_flag)
+                node = QueryTreeGroup(node_id=node_id, children=())
+            # Attach the completed node, closing any groups it completes.
+            while stack:
+                entry = stack[-1]
+                entry[2].append(node)
+                entry[1] -= 1
+                if entry[1]:
+                    break
+                stack.pop()
+                node = QueryTreeGroup(node_id=entry[0], children=entry[2])
+            if not stack:
+                query_tree_group = node
+                break
         response = cls(
             node_id=query_tree_group.node_id, query_tree_group=query_tree_group
         )
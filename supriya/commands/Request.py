@@ -3,23 +3,60 @@ import abc
 from uqbar.objects import new
 
 from supriya.commands.Requestable import Requestable
+from supriya.osc.messages import OscTemplate
 
 
 class Request(Requestable):
 
+    ### CLASS VARIABLES ###
+
+    _schema = None
+
+    ### SPECIAL METHODS ###
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        schema = cls.__dict__.get("_schema")
+        if schema is not None:
+            schema._install(cls)
+
     ### PRIVATE METHODS ###
 
     def _apply_local(self, server):
         pass
 
+    @staticmethod
+    def _apply_local_bulk(requests, server):
+        """
+        Apply a run of consecutive ``requests`` sharing this bulk applier.
+        """
+        for request in requests:
+            request._apply_local(server)
+
+    @staticmethod
+    def _apply_local_node_moves(requests, server):
+        # Node-creating requests share this applier, so a whole allocated
+        # tree of groups and synths is placed in one pass.
+        from supriya.realtime.nodes import Node
+
+        Node._move_nodes(
+            move for request in requests for move in request._register_local(server)
+        )
+
+    def _get_argument_index(self, name):
+        if isinstance(name, int):
+            return name
+        if self._schema is None:
+            raise ValueError(name)
+        return self._schema._get_argument_index(self, name)
+
     def _get_response_patterns_and_requestable(self, server):
         success_pattern, failure_pattern = self.response_patterns
         return success_pattern, failure_pattern, self
 
     def _handle_async(self, sync, server):
         if not sync or self.response_patterns[0] is None:
-            message = self.to_osc()
-            server.send(message)
+            server._send_request(self)
             return True
 
     def _linearize(self):
@@ -35,6 +72,28 @@ class Request(Requestable):
     def to_osc(self, *, with_placeholders=False):
         raise NotImplementedError
 
+    def to_template(self, *names):
+        """
+        Compile into an OSC template with a patch slot per name in ``names``.
+
+        Names are schema field names, control names for a request's
+        ``**kwargs``, or raw OSC argument indices.
+
+        ::
+
+            >>> request = supriya.commands.SynthNewRequest(
+            ...     synthdef="default", node_id=1000, target_node_id=1, frequency=440.0,
+            ... )
+            >>> template = request.to_template("node_id", "frequency")
+            >>> datagram = template.patch(node_id=1001, frequency=550.0)
+            >>> supriya.osc.OscMessage.from_datagram(datagram)
+            OscMessage('/s_new', 'default', 1001, 0, 1, 'frequency', 550.0)
+
+        """
+        return OscTemplate(
+            self.to_osc(), {name: self._get_argument_index(name) for name in names}
+        )
+
     ### PUBLIC PROPERTIES ###
 
     @property
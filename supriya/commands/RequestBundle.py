@@ -1,9 +1,8 @@
 import threading
-from collections import deque
 
 from supriya.commands.Requestable import Requestable
 from supriya.commands.SyncRequest import SyncRequest
-from supriya.osc.messages import BUNDLE_PREFIX, OscBundle
+from supriya.osc.messages import BUNDLE_PREFIX, OscBundle, OscTemplate
 
 
 class RequestBundle(Requestable):
@@ -59,6 +58,7 @@ class RequestBundle(Requestable):
         else:
             contents = ()
         self._contents = contents
+        self._datagrams = None
         self._response = None
 
     ### PRIVATE METHODS ###
@@ -77,6 +77,16 @@ class RequestBundle(Requestable):
             server.send(message)
             return True
 
+    @classmethod
+    def _iterate_osc_contents(cls, requestables, with_placeholders=False):
+        for x in requestables:
+            osc = x.to_osc(with_placeholders=with_placeholders)
+            # Bulk requests contribute their messages, not a nested bundle.
+            if isinstance(osc, OscBundle) and not isinstance(x, cls):
+                yield from osc.contents
+            else:
+                yield osc
+
     def _linearize(self):
         for x in self.contents:
             yield from x._linearize()
@@ -84,35 +94,114 @@ class RequestBundle(Requestable):
     ### PUBLIC METHODS ###
 
     def to_osc(self, *, with_placeholders=False):
-        contents = []
-        for x in self.contents:
-            if isinstance(x, type(self)):
-                contents.append(x.to_osc(with_placeholders=with_placeholders,))
-            else:
-                contents.append(x.to_osc(with_placeholders=with_placeholders,))
+        if self._datagrams is not None and not with_placeholders:
+            contents, datagrams = self._datagrams
+            bundle = OscBundle(timestamp=self.timestamp, contents=contents)
+            bundle._datagrams = (bundle.contents, datagrams)
+            return bundle
+        contents = list(self._iterate_osc_contents(self.contents, with_placeholders))
         bundle = OscBundle(timestamp=self.timestamp, contents=contents)
         return bundle
 
     @classmethod
-    def partition(cls, requests, timestamp=None):
+    def partition(cls, requests, timestamp=None, *, maximum_packet_size=8192):
+        """
+        Partition ``requests``, in order, into the fewest request bundles
+        whose OSC datagrams fit within ``maximum_packet_size``.
+
+        Each request is encoded once, and the resulting bundles reuse those
+        datagrams when converted to OSC and sent.
+
+        ::
+
+            >>> requests = [
+            ...     supriya.commands.NodeFreeRequest(node_ids=[1000 + i])
+            ...     for i in range(5)
+            ... ]
+            >>> bundles = supriya.commands.RequestBundle.partition(
+            ...     requests, timestamp=1.5, maximum_packet_size=64
+            ... )
+            >>> for bundle in bundles:
+            ...     bundle.to_list()
+            ...
+            [1.5, [['/n_free', 1000], ['/n_free', 1001]]]
+            [1.5, [['/n_free', 1002], ['/n_free', 1003]]]
+            [1.5, [['/n_free', 1004]]]
+
+        """
+        items = []
+        for request in requests:
+            for subrequest in request._partition(maximum_packet_size):
+                contents = list(cls._iterate_osc_contents([subrequest]))
+                datagrams = [x.to_datagram() for x in contents]
+                items.append((subrequest, contents, datagrams))
         bundles = []
-        contents = []
-        requests = deque(requests)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while requests:
-            request = requests.popleft()
-            datagram = request.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(request)
-            else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [request]
-                remaining = maximum
-        if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
+        for start, stop in OscBundle._partition_sizes(
+            [sum(4 + len(x) for x in datagrams) for _, _, datagrams in items],
+            maximum_packet_size - len(BUNDLE_PREFIX) - 8,
+        ):
+            bundle = cls(
+                timestamp=timestamp, contents=[x[0] for x in items[start:stop]]
+            )
+            bundle._datagrams = (
+                tuple(x for item in items[start:stop] for x in item[1]),
+                tuple(x for item in items[start:stop] for x in item[2]),
+            )
+            bundles.append(bundle)
         return bundles
 
+    def to_template(self, **slots):
+        """
+        Compile into an OSC template with patch slots.
+
+        Each slot locates a field, as in ``Request.to_template()``, by
+        ``(content index, field name)``, or a list of those. Templates always
+        have a ``timestamp`` slot.
+
+        ::
+
+            >>> request_bundle = supriya.commands.RequestBundle(
+            ...     timestamp=0.0,
+            ...     contents=[
+            ...         supriya.commands.SynthNewRequest(
+            ...             synthdef="default", node_id=1000, target_node_id=1,
+            ...         ),
+            ...         supriya.commands.NodeSetRequest(node_id=1000, gate=0),
+            ...     ],
+            ... )
+            >>> template = request_bundle.to_template(
+            ...     node_id=[(0, "node_id"), (1, "node_id")]
+            ... )
+            >>> datagram = template.patch(node_id=1001, timestamp=2.5)
+            >>> supriya.osc.OscBundle.from_datagram(datagram)
+            OscBundle(
+                contents=(
+                    OscMessage('/s_new', 'default', 1001, 0, 1),
+                    OscMessage('/n_set', 1001, 'gate', 0),
+                    ),
+                timestamp=2.5,
+                )
+
+        """
+        contents, indices = [], []
+        for requestable in self.contents:
+            indices.append(len(contents))
+            contents.extend(self._iterate_osc_contents([requestable]))
+        locations = {}
+        for name, fields in slots.items():
+            if not isinstance(fields, list):
+                fields = [fields]
+            locations[name] = []
+            for index, field_name in fields:
+                requestable = self.contents[index]
+                if isinstance(requestable, RequestBundle):
+                    raise ValueError((index, field_name))
+                locations[name].append(
+                    (indices[index], requestable._get_argument_index(field_name))
+                )
+        bundle = OscBundle(timestamp=self.timestamp, contents=contents)
+        return OscTemplate(bundle, locations)
+
     ### PUBLIC PROPERTIES ###
 
     @property
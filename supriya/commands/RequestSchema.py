@@ -0,0 +1,340 @@
+import collections
+import operator
+from typing import NamedTuple
+
+import supriya.osc
+from supriya.enums import AddAction
+from supriya.osc.messages import _compile_encoder, _encode_ascii
+
+
+class RequestSchema:
+    """
+    A declarative description of a request's fields.
+
+    Fields are declared once, in OSC argument order, each with a kind
+    controlling how it's coerced on initialization and encoded. From them a
+    request class gets generated ``__init__``, field properties,
+    ``to_osc()``, and a ``to_datagram()`` which packs the request straight to
+    bytes through a compiled struct encoder, without building an
+    ``OscMessage``. Equality, hashing and repr read the fields directly,
+    rather than introspecting the initializer's signature.
+
+    ::
+
+        >>> import supriya.commands
+        >>> supriya.commands.NodeFreeRequest._schema
+        RequestSchema(
+            Field(name='node_ids', kind='node_ids', default=None),
+            )
+
+    ::
+
+        >>> print(supriya.commands.NodeFreeRequest._to_datagram_source)
+        def to_datagram(self, *, with_placeholders=False):
+            signature, values = [], []
+            value = self._node_ids
+            signature.extend("i" * len(value))
+            values.extend(value)
+            return _compile_encoder('/n_free', tuple(signature)).pack(values)
+
+    Kinds are:
+
+    - ``add_action``: an ``AddAction``, encoded as an int
+    - ``float``
+    - ``int``
+    - ``node_id``: an int or node, encoded as an int, or -1 as a placeholder
+    - ``node_ids``: a node id or sequence of node ids, coerced to a tuple
+    - ``pairs``: the request's ``**kwargs``, encoded as sorted key/value pairs
+    - ``string``
+    - ``synthdef``: a SynthDef or SynthDef name, encoded by name
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    class Field(NamedTuple):
+        name: str
+        kind: str
+        default: object = None
+
+    __slots__ = ("_fields",)
+
+    _kinds = frozenset(
+        [
+            "add_action",
+            "float",
+            "int",
+            "node_id",
+            "node_ids",
+            "pairs",
+            "string",
+            "synthdef",
+        ]
+    )
+
+    _coercions = {
+        "add_action": ["value = AddAction.from_expr(value)"],
+        "float": ["value = float(value)"],
+        "int": ["value = int(value)"],
+        "node_ids": [
+            "if not isinstance(value, collections.Sequence):",
+            "    value = (value,)",
+            "value = tuple(int(x) for x in value)",
+        ],
+        "pairs": ["value = tuple(sorted(value.items()))"],
+        "synthdef": [
+            "if not isinstance(value, (str, supriya.synthdefs.SynthDef)):",
+            "    raise ValueError(value)",
+        ],
+    }
+
+    _osc_encoders = {
+        "add_action": ["contents.append(int(value))"],
+        "float": ["contents.append(float(value))"],
+        "int": ["contents.append(int(value))"],
+        "node_id": [
+            "contents.append(self._sanitize_node_id(value, with_placeholders))"
+        ],
+        "node_ids": ["contents.extend(value)"],
+        "pairs": [
+            "for key, value in value:",
+            "    contents.append(key)",
+            "    contents.append(value)",
+        ],
+        "string": ["contents.append(value)"],
+        "synthdef": [
+            "if not isinstance(value, str):",
+            "    value = value.actual_name",
+            "contents.append(value)",
+        ],
+    }
+
+    _datagram_encoders = {
+        "add_action": ['signature.append("i")', "values.append(int(value))"],
+        "float": ['signature.append("f")', "values.append(float(value))"],
+        "int": ['signature.append("i")', "values.append(int(value))"],
+        "node_id": [
+            "if value.__class__ is not int:",
+            "    value = self._sanitize_node_id(value, with_placeholders)",
+            'signature.append("i")',
+            "values.append(value)",
+        ],
+        "node_ids": ['signature.extend("i" * len(value))', "values.extend(value)"],
+        "pairs": [
+            "for key, value in value:",
+            "    key = _encode_ascii(key)",
+            "    signature.append((len(key) // 4 + 1) * 4)",
+            "    values.append(key)",
+            "    if value.__class__ is float:",
+            '        signature.append("f")',
+            "    elif value.__class__ is int:",
+            '        signature.append("i")',
+            "    elif value.__class__ is str:",
+            "        value = _encode_ascii(value)",
+            "        signature.append((len(value) // 4 + 1) * 4)",
+            "    else:",
+            "        # Anything else takes the generic OscMessage path.",
+            "        osc = self.to_osc(with_placeholders=with_placeholders)",
+            "        return osc.to_datagram()",
+            "    values.append(value)",
+        ],
+        "string": [
+            "value = _encode_ascii(value)",
+            "signature.append((len(value) // 4 + 1) * 4)",
+            "values.append(value)",
+        ],
+        "synthdef": [
+            "if not isinstance(value, str):",
+            "    value = value.actual_name",
+            "value = _encode_ascii(value)",
+            "signature.append((len(value) // 4 + 1) * 4)",
+            "values.append(value)",
+        ],
+    }
+
+    ### INITIALIZER ###
+
+    def __init__(self, *fields):
+        fields = tuple(self.Field(*x) for x in fields)
+        for field in fields:
+            if field.kind not in self._kinds:
+                raise ValueError(field)
+        if [x.kind for x in fields[:-1]].count("pairs"):
+            raise ValueError("pairs must be the last field")
+        self._fields = fields
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self):
+        parts = ["{}(".format(type(self).__name__)]
+        parts.extend("    {!r},".format(x) for x in self._fields)
+        parts.append("    )")
+        return "\n".join(parts)
+
+    ### PRIVATE METHODS ###
+
+    def _compile(self, source, name, class_):
+        namespace = {
+            "AddAction": AddAction,
+            "_compile_encoder": _compile_encoder,
+            "_encode_ascii": _encode_ascii,
+            "collections": collections,
+            "supriya": supriya,
+            class_.__bases__[0].__name__: class_.__bases__[0],
+        }
+        source_name = "<auto-generated> {}.py".format(class_.__name__)
+        code = compile(source, source_name, "exec")
+        exec(code, namespace, namespace)
+        return namespace[name]
+
+    def _get_argument_index(self, request, name):
+        """
+        Get the OSC argument index of field ``name`` in ``request``.
+
+        Names a pair's value by its key.
+        """
+        index = 0
+        for field in self._fields:
+            value = getattr(request, "_" + field.name)
+            if field.kind == "pairs":
+                for i, (key, _) in enumerate(value):
+                    if key == name:
+                        return index + i * 2 + 1
+            elif field.name == name and field.kind != "node_ids":
+                return index
+            elif field.kind == "node_ids":
+                index += len(value)
+            else:
+                index += 1
+        raise ValueError(name)
+
+    def _install(self, class_):
+        """
+        Install generated methods and properties on ``class_``.
+
+        Methods and properties already defined on ``class_`` are left alone.
+        """
+        address = class_.request_id.request_name.value
+        names = tuple(x.name for x in self._fields)
+        methods = {
+            "__eq__": self._make_eq(names),
+            "__hash__": self._make_hash(names),
+            "__repr__": self._make_repr(),
+        }
+        for name, source in [
+            ("__init__", self._make_initializer_source(class_)),
+            ("to_datagram", self._make_to_datagram_source(address)),
+            ("to_osc", self._make_to_osc_source(address)),
+        ]:
+            setattr(class_, "_{}_source".format(name.strip("_")), source)
+            methods[name] = self._compile(source, name, class_)
+        for name in names:
+            methods[name] = property(operator.attrgetter("_" + name))
+        for name, method in methods.items():
+            if name not in class_.__dict__:
+                setattr(class_, name, method)
+
+    def _make_eq(self, names):
+        getter = operator.attrgetter(*("_" + x for x in names))
+
+        def __eq__(self, expr):
+            if type(self) is not type(expr):
+                return False
+            return getter(self) == getter(expr)
+
+        return __eq__
+
+    def _make_hash(self, names):
+        getter = operator.attrgetter(*("_" + x for x in names))
+
+        def __hash__(self):
+            return hash((type(self), getter(self)))
+
+        return __hash__
+
+    def _make_initializer_source(self, class_):
+        # Parameters are alphabetical, with any pairs collected as **kwargs.
+        parameters = ["self"]
+        for field in sorted(self._fields, key=lambda x: x.name):
+            if field.kind != "pairs":
+                parameters.append("{}={!r}".format(field.name, field.default))
+        lines = ["{}.__init__(self)".format(class_.__bases__[0].__name__)]
+        for field in self._fields:
+            if field.kind == "pairs":
+                parameters.append("**{}".format(field.name))
+            lines.append("value = {}".format(field.name))
+            lines.extend(self._coercions.get(field.kind, []))
+            lines.append("self._{} = value".format(field.name))
+        return self._make_source("__init__", ", ".join(parameters), lines)
+
+    def _make_repr(self):
+        fields = self._fields
+
+        def __repr__(self):
+            items = []
+            for field in fields:
+                value = getattr(self, "_" + field.name)
+                if field.kind == "pairs":
+                    items.extend(value)
+                elif value != field.default:
+                    items.append((field.name, value))
+            if not items:
+                return "{}()".format(type(self).__name__)
+            parts = ["{}(".format(type(self).__name__)]
+            for key, value in sorted(items, key=lambda x: x[0]):
+                part = "{}={}".format(key, RequestSchema._format_value(value))
+                parts.append("\n".join("    " + x for x in part.splitlines()) + ",")
+            parts.append("    )")
+            return "\n".join(parts)
+
+        return __repr__
+
+    @staticmethod
+    def _format_value(value):
+        if not isinstance(value, (list, tuple)):
+            return repr(value)
+        if all(isinstance(x, (bool, int, float, str, type(None))) for x in value):
+            result = repr(value)
+            if len(result) < 50:
+                return result
+        braces = "[]" if isinstance(value, list) else "()"
+        result = [braces[0]]
+        for x in value:
+            result.extend("    " + line for line in repr(x).splitlines())
+            result[-1] += ","
+        result.append("    " + braces[1])
+        return "\n".join(result)
+
+    @staticmethod
+    def _make_source(name, parameters, lines):
+        return "\n".join(
+            ["def {}({}):".format(name, parameters)] + ["    " + x for x in lines]
+        )
+
+    def _make_to_datagram_source(self, address):
+        lines = ["signature, values = [], []"]
+        for field in self._fields:
+            lines.append("value = self._{}".format(field.name))
+            lines.extend(self._datagram_encoders[field.kind])
+        lines.append(
+            "return _compile_encoder({!r}, tuple(signature)).pack(values)".format(
+                address
+            )
+        )
+        return self._make_source(
+            "to_datagram", "self, *, with_placeholders=False", lines
+        )
+
+    def _make_to_osc_source(self, address):
+        lines = ["contents = [{!r}]".format(address)]
+        for field in self._fields:
+            lines.append("value = self._{}".format(field.name))
+            lines.extend(self._osc_encoders[field.kind])
+        lines.append("return supriya.osc.OscMessage(*contents)")
+        return self._make_source("to_osc", "self, *, with_placeholders=False", lines)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def fields(self):
+        return self._fields
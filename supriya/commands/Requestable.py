@@ -27,6 +27,10 @@ class Requestable(SupriyaValueObject):
     def _linearize(self):
         raise NotImplementedError
 
+    def _partition(self, maximum_packet_size):
+        # Requestables too large for one packet may split into several.
+        return (self,)
+
     def _sanitize_node_id(self, node_id, with_placeholders):
         if not isinstance(node_id, int) and with_placeholders:
             return -1
@@ -54,9 +58,7 @@ class Requestable(SupriyaValueObject):
         assert isinstance(server, supriya.realtime.servers.BaseServer)
         assert server.is_running
         if apply_local:
-            with server._lock:
-                for request in self._linearize():
-                    request._apply_local(server)
+            server._apply_local_requests([self])
         # handle non-sync
         if self._handle_async(sync, server):
             return
@@ -78,7 +80,7 @@ class Requestable(SupriyaValueObject):
             except Exception:
                 print(self)
                 raise
-            server.send(requestable.to_osc())
+            server._send_request(requestable)
             while self.response is None:
                 self.condition.wait(timeout)
                 current_time = time.time()
@@ -107,7 +109,7 @@ class Requestable(SupriyaValueObject):
             procedure=self._set_response_async,
             once=True,
         )
-        server.send(requestable.to_osc())
+        server._send_request(requestable)
         await asyncio.wait_for(self._response_future, timeout=timeout)
         return self._response
 
@@ -1,44 +1,76 @@
 from supriya.system import SupriyaValueObject
 
+_response_classes = {}
+
+
+def _get_response_classes():
+    # Populated on first use, as the response classes import this module.
+    if not _response_classes:
+        import supriya.commands
+
+        _response_classes.update(
+            {
+                "/b_info": supriya.commands.BufferInfoResponse,
+                "/b_set": supriya.commands.BufferSetResponse,
+                "/b_setn": supriya.commands.BufferSetContiguousResponse,
+                "/c_set": supriya.commands.ControlBusSetResponse,
+                "/c_setn": supriya.commands.ControlBusSetContiguousResponse,
+                "/d_removed": supriya.commands.SynthDefRemovedResponse,
+                "/done": supriya.commands.DoneResponse,
+                "/fail": supriya.commands.FailResponse,
+                "/g_queryTree.reply": supriya.commands.QueryTreeResponse,
+                "/n_end": supriya.commands.NodeInfoResponse,
+                "/n_go": supriya.commands.NodeInfoResponse,
+                "/n_info": supriya.commands.NodeInfoResponse,
+                "/n_move": supriya.commands.NodeInfoResponse,
+                "/n_off": supriya.commands.NodeInfoResponse,
+                "/n_on": supriya.commands.NodeInfoResponse,
+                "/n_set": supriya.commands.NodeSetResponse,
+                "/n_setn": supriya.commands.NodeSetContiguousResponse,
+                "/status.reply": supriya.commands.StatusResponse,
+                "/synced": supriya.commands.SyncedResponse,
+                "/tr": supriya.commands.TriggerResponse,
+            }
+        )
+    return _response_classes
+
 
 class Response(SupriyaValueObject):
 
+    ### SPECIAL METHODS ###
+
+    def __getattr__(self, name):
+        # Only reached for missing attributes, i.e. the fields of a lazily
+        # constructed response which haven't been parsed yet.
+        osc_message = self.__dict__.pop("_osc_message", None)
+        if osc_message is None:
+            raise AttributeError(name)
+        self._parse(osc_message)
+        return getattr(self, name)
+
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _from_osc_message_lazily(cls, osc_message):
+        # Defers parsing ``osc_message`` until a field is first read.
+        response = cls.__new__(cls)
+        response._osc_message = osc_message
+        return response
+
     @staticmethod
     def _group_items(items, length):
         iterators = [iter(items)] * length
         iterator = zip(*iterators)
         return iterator
 
+    def _parse(self, osc_message):
+        raise NotImplementedError
+
     ### PUBLIC METHODS ###
 
     @classmethod
     def from_osc_message(cls, message):
-        import supriya.commands
-
-        return {
-            "/b_info": supriya.commands.BufferInfoResponse,
-            "/b_set": supriya.commands.BufferSetResponse,
-            "/b_setn": supriya.commands.BufferSetContiguousResponse,
-            "/c_set": supriya.commands.ControlBusSetResponse,
-            "/c_setn": supriya.commands.ControlBusSetContiguousResponse,
-            "/d_removed": supriya.commands.SynthDefRemovedResponse,
-            "/done": supriya.commands.DoneResponse,
-            "/fail": supriya.commands.FailResponse,
-            "/g_queryTree.reply": supriya.commands.QueryTreeResponse,
-            "/n_end": supriya.commands.NodeInfoResponse,
-            "/n_go": supriya.commands.NodeInfoResponse,
-            "/n_info": supriya.commands.NodeInfoResponse,
-            "/n_move": supriya.commands.NodeInfoResponse,
-            "/n_off": supriya.commands.NodeInfoResponse,
-            "/n_on": supriya.commands.NodeInfoResponse,
-            "/n_set": supriya.commands.NodeSetResponse,
-            "/n_setn": supriya.commands.NodeSetContiguousResponse,
-            "/status.reply": supriya.commands.StatusResponse,
-            "/synced": supriya.commands.SyncedResponse,
-            "/tr": supriya.commands.TriggerResponse,
-        }[message.address].from_osc_message(message)
+        return _get_response_classes()[message.address].from_osc_message(message)
 
     def to_dict(self):
         result = {}
@@ -1,5 +1,5 @@
-import supriya.osc
 from supriya.commands.Request import Request
+from supriya.commands.RequestSchema import RequestSchema
 from supriya.enums import RequestId
 
 
@@ -29,26 +29,10 @@ class SyncRequest(Request):
 
     request_id = RequestId.SYNC
 
-    ### INITIALIZER ###
-
-    def __init__(self, sync_id=None):
-        Request.__init__(self)
-        self._sync_id = int(sync_id)
-
-    ### PUBLIC METHODS ###
-
-    def to_osc(self, *, with_placeholders=False):
-        request_id = self.request_name
-        sync_id = int(self.sync_id)
-        message = supriya.osc.OscMessage(request_id, sync_id)
-        return message
+    _schema = RequestSchema(("sync_id", "int"))
 
     ### PUBLIC PROPERTIES ###
 
     @property
     def response_patterns(self):
-        return ["/synced", self.sync_id], None
-
-    @property
-    def sync_id(self):
-        return self._sync_id
+        return ["/synced", self._sync_id], None
@@ -1,5 +1,5 @@
-from supriya import AddAction
 from supriya.commands.Request import Request
+from supriya.commands.RequestSchema import RequestSchema
 from supriya.enums import RequestId
 from supriya.realtime.nodes import Node, Synth
 
@@ -41,91 +41,41 @@ class SynthNewRequest(Request):
 
     request_id = RequestId.SYNTH_NEW
 
-    ### INITIALIZER ###
-
-    def __init__(
-        self,
-        add_action=None,
-        node_id=None,
-        synthdef=None,
-        target_node_id=None,
-        **kwargs,
-    ):
-        import supriya.realtime
-        import supriya.synthdefs
-
-        Request.__init__(self)
-        self._add_action = AddAction.from_expr(add_action)
-        self._node_id = node_id
-        prototype = (str, supriya.synthdefs.SynthDef)
-        assert isinstance(synthdef, prototype)
-        self._synthdef = synthdef
-        self._target_node_id = target_node_id
-        self._kwargs = tuple(sorted(kwargs.items()))
+    _schema = RequestSchema(
+        ("synthdef", "synthdef"),
+        ("node_id", "node_id"),
+        ("add_action", "add_action"),
+        ("target_node_id", "node_id"),
+        ("kwargs", "pairs"),
+    )
+
+    _apply_local_bulk = staticmethod(Request._apply_local_node_moves)
 
     ### PRIVATE METHODS ###
 
     def _apply_local(self, server):
-        if isinstance(self.node_id, Synth):
+        Node._move_nodes(self._register_local(server))
+
+    def _register_local(self, server):
+        if isinstance(self._node_id, Synth):
             node_id = None
-            synth = self.node_id
+            synth = self._node_id
         else:
-            node_id = self.node_id
-            synth = Synth(synthdef=self.synthdef, **dict(self.kwargs))
-        if isinstance(self.target_node_id, Node):
-            target_node = self.target_node_id
+            node_id = self._node_id
+            synth = Synth(synthdef=self._synthdef, **dict(self._kwargs))
+        if isinstance(self._target_node_id, Node):
+            target_node = self._target_node_id
         else:
-            target_node = server._nodes[self.target_node_id]
+            target_node = server._nodes[self._target_node_id]
         synth._register_with_local_server(
             node_id=node_id,
             node_id_is_permanent=synth.node_id_is_permanent,
             server=server,
         )
-        target_node._move_node(add_action=self.add_action, node=synth)
-
-    ### PUBLIC METHODS ###
-
-    def to_osc(self, *, with_placeholders=False):
-        import supriya.synthdefs
-
-        request_id = self.request_name
-        synthdef = self.synthdef
-        if isinstance(synthdef, supriya.synthdefs.SynthDef):
-            synthdef = synthdef.actual_name
-        node_id = self._sanitize_node_id(self.node_id, with_placeholders)
-        add_action = int(self.add_action)
-        target_node_id = self._sanitize_node_id(self.target_node_id, with_placeholders)
-        if not isinstance(target_node_id, int) and with_placeholders:
-            target_node_id = -1
-        contents = [request_id, synthdef, node_id, add_action, target_node_id]
-        for key, value in self._kwargs:
-            contents.append(key)
-            contents.append(value)
-        message = supriya.osc.OscMessage(*contents)
-        return message
+        yield target_node, self._add_action, synth
 
     ### PUBLIC PROPERTIES ###
 
-    @property
-    def add_action(self):
-        return self._add_action
-
-    @property
-    def kwargs(self):
-        return self._kwargs
-
-    @property
-    def node_id(self):
-        return self._node_id
-
     @property
     def response_patterns(self):
-        return ["/n_go", int(self.node_id)], None
-
-    @property
-    def synthdef(self):
-        return self._synthdef
-
-    @property
-    def target_node_id(self):
-        return self._target_node_id
+        return ["/n_go", int(self._node_id)], None
@@ -10,13 +10,16 @@ class TriggerResponse(Response):
         self._trigger_id = trigger_id
         self._trigger_value = trigger_value
 
+    ### PRIVATE METHODS ###
+
+    def _parse(self, osc_message):
+        TriggerResponse.__init__(self, *osc_message.contents)
+
     ### PUBLIC METHODS ###
 
     @classmethod
     def from_osc_message(cls, osc_message):
-        arguments = osc_message.contents
-        response = cls(*arguments)
-        return response
+        return cls._from_osc_message_lazily(osc_message)
 
     ### PUBLIC PROPERTIES ###
 
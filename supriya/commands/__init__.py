@@ -49,7 +49,7 @@ from .NodeBeforeRequest import NodeBeforeRequest
 from .NodeCommandRequest import NodeCommandRequest
 from .NodeFillRequest import NodeFillRequest
 from .NodeFreeRequest import NodeFreeRequest
-from .NodeInfoResponse import NodeInfoResponse
+from .NodeInfoResponse import NodeInfo, NodeInfoResponse
 from .NodeMapToAudioBusContiguousRequest import NodeMapToAudioBusContiguousRequest
 from .NodeMapToAudioBusRequest import NodeMapToAudioBusRequest
 from .NodeMapToControlBusContiguousRequest import NodeMapToControlBusContiguousRequest
@@ -57,6 +57,7 @@ from .NodeMapToControlBusRequest import NodeMapToControlBusRequest
 from .NodeOrderRequest import NodeOrderRequest
 from .NodeQueryRequest import NodeQueryRequest
 from .NodeRunRequest import NodeRunRequest
+from .NodeSetBulkRequest import NodeSetBulkRequest
 from .NodeSetContiguousRequest import NodeSetContiguousRequest
 from .NodeSetContiguousResponse import NodeSetContiguousResponse
 from .NodeSetRequest import NodeSetRequest
@@ -69,6 +70,7 @@ from .QueryTreeResponse import QueryTreeResponse
 from .QuitRequest import QuitRequest
 from .Request import Request
 from .RequestBundle import RequestBundle
+from .RequestSchema import RequestSchema
 from .Requestable import Requestable
 from .Response import Response
 from .StatusRequest import StatusRequest
@@ -137,6 +139,7 @@ __all__ = [
     "NodeCommandRequest",
     "NodeFillRequest",
     "NodeFreeRequest",
+    "NodeInfo",
     "NodeInfoResponse",
     "NodeMapToAudioBusContiguousRequest",
     "NodeMapToAudioBusRequest",
@@ -145,6 +148,7 @@ __all__ = [
     "NodeOrderRequest",
     "NodeQueryRequest",
     "NodeRunRequest",
+    "NodeSetBulkRequest",
     "NodeSetContiguousRequest",
     "NodeSetContiguousResponse",
     "NodeSetRequest",
@@ -157,6 +161,7 @@ __all__ = [
     "QuitRequest",
     "Request",
     "RequestBundle",
+    "RequestSchema",
     "Requestable",
     "Response",
     "StatusRequest",
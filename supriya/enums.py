@@ -265,16 +265,17 @@ class NodeAction(IntEnumeration):
 
     @classmethod
     def from_address(cls, address):
-        addresses = {
-            "/n_end": cls.NODE_REMOVED,
-            "/n_go": cls.NODE_CREATED,
-            "/n_info": cls.NODE_QUERIED,
-            "/n_move": cls.NODE_MOVED,
-            "/n_off": cls.NODE_DEACTIVATED,
-            "/n_on": cls.NODE_ACTIVATED,
-        }
-        action = addresses[address]
-        return action
+        return _node_actions_by_address[address]
+
+
+_node_actions_by_address = {
+    "/n_end": NodeAction.NODE_REMOVED,
+    "/n_go": NodeAction.NODE_CREATED,
+    "/n_info": NodeAction.NODE_QUERIED,
+    "/n_move": NodeAction.NODE_MOVED,
+    "/n_off": NodeAction.NODE_DEACTIVATED,
+    "/n_on": NodeAction.NODE_ACTIVATED,
+}
 
 
 class ParameterRate(IntEnumeration):
@@ -340,6 +340,15 @@ class Session:
                 mapping[node] = node.session_id
         return mapping
 
+    def _build_node_set_request(self, key, node_ids, values):
+        if len(node_ids) == 1:
+            return supriya.commands.NodeSetRequest(
+                node_id=node_ids[0], **{key: values[0]}
+            )
+        return supriya.commands.NodeSetBulkRequest(
+            node_ids=node_ids, control=key, values=values
+        )
+
     @staticmethod
     def _build_rand_seed_synthdef():
         import supriya.ugens
@@ -628,6 +637,7 @@ class Session:
             type(None),
         )
         buffer_prototype = (supriya.nonrealtime.Buffer, supriya.nonrealtime.BufferGroup)
+        run = None
         for node, settings in node_settings.items():
             parameters = {}
             if isinstance(node, supriya.nonrealtime.Synth):
@@ -653,6 +663,25 @@ class Session:
                     if isinstance(value, buffer_prototype):
                         value = id_mapping[value]
                     n_settings[key] = value
+            if (
+                len(n_settings) == 1
+                and not (a_settings or c_settings)
+                and isinstance(next(iter(n_settings.values())), (int, float))
+            ):
+                # Runs of nodes setting the same lone scalar control become
+                # one columnar request, rather than one request per node.
+                ((key, value),) = n_settings.items()
+                if run and run[0] != key:
+                    requests.append(self._build_node_set_request(*run))
+                    run = None
+                if not run:
+                    run = (key, [], [])
+                run[1].append(node_id)
+                run[2].append(value)
+                continue
+            if run:
+                requests.append(self._build_node_set_request(*run))
+                run = None
             if n_settings:
                 request = supriya.commands.NodeSetRequest(node_id=node_id, **n_settings)
                 requests.append(request)
@@ -666,6 +695,8 @@ class Session:
                     node_id=node_id, **c_settings
                 )
                 requests.append(request)
+        if run:
+            requests.append(self._build_node_set_request(*run))
         return requests
 
     def _collect_requests_at_offset(
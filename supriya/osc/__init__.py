@@ -3,18 +3,22 @@ Tools for sending, receiving and handling OSC messages.
 """
 
 from .captures import Capture, CaptureEntry
-from .messages import OscBundle, OscMessage
+from .messages import OscBundle, OscMessage, OscTemplate
 from .protocols import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
     OscCallback,
     OscProtocol,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
+from .recordings import Recording, ReplayReport
 from .utils import find_free_port
 
 __all__ = [
     "AsyncOscProtocol",
+    "AsyncTcpOscProtocol",
     "Capture",
     "CaptureEntry",
     "HealthCheck",
@@ -22,6 +26,10 @@ __all__ = [
     "OscCallback",
     "OscMessage",
     "OscProtocol",
+    "OscTemplate",
+    "Recording",
+    "ReplayReport",
     "ThreadedOscProtocol",
+    "ThreadedTcpOscProtocol",
     "find_free_port",
 ]
@@ -0,0 +1,228 @@
+import re
+from typing import Callable, NamedTuple, Optional, Tuple, Union
+
+WILDCARD_CHARACTERS = frozenset("*?[{")
+
+
+class OscCallback(NamedTuple):
+    pattern: Tuple[Union[str, int, float], ...]
+    procedure: Callable
+    failure_pattern: Optional[Tuple[Union[str, int, float], ...]] = None
+    once: bool = False
+
+
+def compile_address_pattern(pattern):
+    """
+    Compile an OSC address pattern into a regular expression.
+
+    ::
+
+        >>> from supriya.osc.callbacks import compile_address_pattern
+        >>> regex = compile_address_pattern("/{n_go,n_end}")
+        >>> bool(regex.fullmatch("/n_go")), bool(regex.fullmatch("/n_off"))
+        (True, False)
+
+    ::
+
+        >>> regex = compile_address_pattern("/b_*")
+        >>> bool(regex.fullmatch("/b_info")), bool(regex.fullmatch("/b_info/x"))
+        (True, False)
+
+    ::
+
+        >>> regex = compile_address_pattern("/tr[!0-4]?")
+        >>> bool(regex.fullmatch("/tr5a")), bool(regex.fullmatch("/tr3a"))
+        (True, False)
+
+    """
+    result = []
+    index, length = 0, len(pattern)
+    while index < length:
+        character = pattern[index]
+        if character == "*":
+            result.append("[^/]*")
+        elif character == "?":
+            result.append("[^/]")
+        elif character == "[":
+            stop = pattern.find("]", index + 1)
+            if stop == -1:
+                raise ValueError(f"Unterminated '[' in {pattern!r}")
+            body = pattern[index + 1 : stop]
+            negated = body.startswith("!")
+            if negated:
+                body = body[1:]
+            body = "".join(
+                "-" if x == "-" and 0 < i < len(body) - 1 else re.escape(x)
+                for i, x in enumerate(body)
+            )
+            result.append("[{}{}]".format("^" if negated else "", body))
+            index = stop
+        elif character == "{":
+            stop = pattern.find("}", index + 1)
+            if stop == -1:
+                raise ValueError(f"Unterminated '{{' in {pattern!r}")
+            alternatives = pattern[index + 1 : stop].split(",")
+            result.append("(?:{})".format("|".join(re.escape(x) for x in alternatives)))
+            index = stop
+        else:
+            result.append(re.escape(character))
+        index += 1
+    return re.compile("".join(result))
+
+
+def is_address_pattern(address):
+    return isinstance(address, str) and not WILDCARD_CHARACTERS.isdisjoint(address)
+
+
+class _IndexNode:
+
+    __slots__ = ("callbacks", "children", "key", "parent")
+
+    def __init__(self, key=None, parent=None):
+        self.callbacks = {}
+        self.children = {}
+        self.key = key
+        self.parent = parent
+
+
+class OscCallbackIndex:
+    """
+    An index of OSC callbacks, keyed on message address and arguments.
+
+    Exact addresses and argument values are looked up in a trie, so matching
+    costs time proportional to the message's argument depth. Addresses
+    containing OSC wildcards (``*``, ``?``, ``[a-z]``, ``{a,b}``) are compiled
+    once when registered, and the wildcard roots matching any given address
+    are cached until the set of wildcard patterns changes.
+
+    ::
+
+        >>> from supriya.osc import OscMessage
+        >>> from supriya.osc.callbacks import OscCallback, OscCallbackIndex
+        >>> index = OscCallbackIndex()
+        >>> callback_a = OscCallback(pattern=("/n_end", 1000), procedure=print)
+        >>> callback_b = OscCallback(pattern=("/n_*",), procedure=print)
+        >>> index.add(callback_a)
+        >>> index.add(callback_b)
+        >>> len(index)
+        2
+
+    ::
+
+        >>> [x is callback_a for x in index.match(OscMessage("/n_end", 1000, 1))]
+        [True, False]
+
+    ::
+
+        >>> index.remove(callback_a)
+        >>> [x is callback_b for x in index.match(OscMessage("/n_end", 1000, 1))]
+        [True]
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_locations", "_root", "_wildcard_cache", "_wildcards")
+
+    _maximum_wildcard_cache_size = 4096
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        self._locations = {}
+        self._root = _IndexNode()
+        self._wildcard_cache = {}
+        self._wildcards = {}
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, callback):
+        return id(callback) in self._locations
+
+    def __len__(self):
+        return len(self._locations)
+
+    ### PRIVATE METHODS ###
+
+    def _get_wildcard_nodes(self, address):
+        nodes = self._wildcard_cache.get(address)
+        if nodes is None:
+            nodes = tuple(
+                node
+                for regex, node in self._wildcards.values()
+                if regex.fullmatch(address)
+            )
+            if len(self._wildcard_cache) >= self._maximum_wildcard_cache_size:
+                self._wildcard_cache.clear()
+            self._wildcard_cache[address] = nodes
+        return nodes
+
+    ### PUBLIC METHODS ###
+
+    def add(self, callback: OscCallback):
+        nodes = []
+        for pattern in (callback.pattern, callback.failure_pattern):
+            if not pattern:
+                continue
+            address, arguments = pattern[0], pattern[1:]
+            if is_address_pattern(address):
+                if address not in self._wildcards:
+                    node = _IndexNode(key=address)
+                    self._wildcards[address] = (compile_address_pattern(address), node)
+                    self._wildcard_cache.clear()
+                node = self._wildcards[address][1]
+            else:
+                node = self._root.children.get(address)
+                if node is None:
+                    node = self._root.children[address] = _IndexNode(
+                        key=address, parent=self._root
+                    )
+            for argument in arguments:
+                child = node.children.get(argument)
+                if child is None:
+                    child = node.children[argument] = _IndexNode(
+                        key=argument, parent=node
+                    )
+                node = child
+            node.callbacks[id(callback)] = callback
+            nodes.append(node)
+        self._locations.setdefault(id(callback), []).extend(nodes)
+
+    def match(self, message):
+        """
+        Iterate over callbacks whose patterns match ``message``.
+
+        Shallower patterns are yielded before deeper ones, and exact-address
+        patterns before wildcard patterns.
+        """
+        address = message.address
+        nodes = []
+        node = self._root.children.get(address)
+        if node is not None:
+            nodes.append(node)
+        if self._wildcards and isinstance(address, str):
+            nodes.extend(self._get_wildcard_nodes(address))
+        for node in nodes:
+            yield from node.callbacks.values()
+            for argument in message.contents:
+                try:
+                    node = node.children.get(argument)
+                except TypeError:  # unhashable arguments never match
+                    break
+                if node is None:
+                    break
+                yield from node.callbacks.values()
+
+    def remove(self, callback: OscCallback):
+        for node in self._locations.pop(id(callback), ()):
+            node.callbacks.pop(id(callback), None)
+            # Prune now-empty branches back towards the root.
+            while not node.callbacks and not node.children:
+                if node.parent is None:
+                    if self._wildcards.get(node.key, (None, None))[1] is node:
+                        self._wildcards.pop(node.key)
+                        self._wildcard_cache.clear()
+                    break
+                if node.parent.children.get(node.key) is node:
+                    node.parent.children.pop(node.key)
+                node = node.parent
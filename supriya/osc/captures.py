@@ -1,6 +1,9 @@
+import collections
+import time
 from typing import NamedTuple, Union
 
-from .messages import OscBundle, OscMessage
+from .callbacks import compile_address_pattern, is_address_pattern
+from .messages import BUNDLE_PREFIX, OscBundle, OscMessage
 
 
 class CaptureEntry(NamedTuple):
@@ -10,43 +13,178 @@ class CaptureEntry(NamedTuple):
 
 
 class Capture:
+    """
+    A capture of OSC traffic sent and received by an OSC protocol.
+
+    By default every message is kept, decoded, for the lifetime of the
+    capture, in the ``messages`` list. Passing ``maximum_entries`` and/or
+    ``maximum_bytes`` turns the capture into a ring buffer: it then stores
+    raw datagrams, evicts the oldest entries once either budget is exceeded,
+    and decodes entries only when they're accessed. Either way, entries are
+    stamped with ``time.time()``.
+
+    Passing ``addresses`` restricts the capture to messages, or bundles
+    containing messages, whose address matches one of the given addresses
+    or OSC address patterns.
+
+    ::
+
+        >>> from supriya.osc import Capture, OscBundle, OscMessage
+        >>> capture = Capture(None, addresses=["/n_*"], maximum_entries=2)
+        >>> for i in range(3):
+        ...     capture._record("S", OscMessage("/n_free", 1000 + i))
+        ...
+        >>> capture._record("R", OscMessage("/done", "/sync"))
+        >>> capture._record("R", OscBundle(contents=[OscMessage("/n_go", 1003)]))
+        >>> len(capture), capture.dropped_count
+        (2, 2)
+
+    ::
+
+        >>> for _, label, message in capture:
+        ...     print(label, repr(message))
+        ...
+        S OscMessage('/n_free', 1002)
+        R OscBundle(
+            contents=(
+                OscMessage('/n_go', 1003),
+                ),
+            )
+
+    """
 
     ### INITIALIZER ###
 
-    def __init__(self, osc_protocol):
+    def __init__(
+        self, osc_protocol, *, addresses=None, maximum_bytes=None, maximum_entries=None
+    ):
         self.osc_protocol = osc_protocol
-        self.messages = []
+        self.addresses = tuple(addresses) if addresses is not None else None
+        self.maximum_bytes = maximum_bytes
+        self.maximum_entries = maximum_entries
+        self.byte_count = 0
+        self.dropped_count = 0
+        self._address_set = None
+        self._address_patterns = None
+        if self.addresses is not None:
+            self._address_set = frozenset(
+                x for x in self.addresses if not is_address_pattern(x)
+            )
+            self._address_patterns = tuple(
+                compile_address_pattern(x)
+                for x in self.addresses
+                if is_address_pattern(x)
+            )
+        if self.is_bounded:
+            self._entries = collections.deque()
+        else:
+            self._entries = []
 
     ### SPECIAL METHODS ###
 
     def __enter__(self):
         self.osc_protocol.captures.add(self)
-        self.messages[:] = []
+        self._entries.clear()
+        self.byte_count = 0
+        self.dropped_count = 0
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         self.osc_protocol.captures.remove(self)
 
+    def __getitem__(self, index):
+        return self._decode_entry(self._entries[index])
+
     def __iter__(self):
-        return iter(self.messages)
+        for entry in tuple(self._entries):
+            yield self._decode_entry(entry)
 
     def __len__(self):
-        return len(self.messages)
+        return len(self._entries)
+
+    ### PRIVATE METHODS ###
+
+    def _decode_entry(self, entry):
+        if not self.is_bounded:
+            return entry
+        timestamp, label, datagram = entry
+        if datagram.startswith(BUNDLE_PREFIX):
+            message = OscBundle.from_datagram(datagram)
+        else:
+            message = OscMessage.from_datagram(datagram)
+        return CaptureEntry(timestamp=timestamp, label=label, message=message)
+
+    def _matches_address(self, address):
+        if address in self._address_set:
+            return True
+        if isinstance(address, str):
+            for pattern in self._address_patterns:
+                if pattern.fullmatch(address):
+                    return True
+        return False
+
+    def _record(self, label, message, messages=None, datagram=None):
+        if self.addresses is not None:
+            if messages is None:
+                if isinstance(message, OscBundle):
+                    messages = message.flatten()
+                else:
+                    messages = (message,)
+            for x in messages:
+                if self._matches_address(x.address):
+                    break
+            else:
+                return
+        if not self.is_bounded:
+            self._entries.append(
+                CaptureEntry(timestamp=time.time(), label=label, message=message)
+            )
+            return
+        if datagram is None:
+            datagram = message.to_datagram()
+        self._entries.append((time.time(), label, datagram))
+        self.byte_count += len(datagram)
+        maximum_bytes = self.maximum_bytes
+        maximum_entries = self.maximum_entries
+        while self._entries and (
+            (maximum_entries is not None and len(self._entries) > maximum_entries)
+            or (maximum_bytes is not None and self.byte_count > maximum_bytes)
+        ):
+            self.byte_count -= len(self._entries.popleft()[2])
+            self.dropped_count += 1
 
     ### PUBLIC PROPERTIES ###
 
+    @property
+    def is_bounded(self):
+        return self.maximum_bytes is not None or self.maximum_entries is not None
+
+    @property
+    def messages(self):
+        """
+        The captured entries.
+
+        Unbounded captures return their own list of entries, which may be
+        modified in place. Bounded captures decode a new list on each access.
+        """
+        if not self.is_bounded:
+            return self._entries
+        return list(self)
+
     @property
     def received_messages(self):
         return [
             (timestamp, osc_message)
-            for timestamp, label, osc_message in self.messages
-            if label == "R"
+            for timestamp, label, osc_message in map(
+                self._decode_entry, (x for x in tuple(self._entries) if x[1] == "R")
+            )
         ]
 
     @property
     def sent_messages(self):
         return [
             (timestamp, osc_message)
-            for timestamp, label, osc_message in self.messages
-            if label == "S"
+            for timestamp, label, osc_message in map(
+                self._decode_entry, (x for x in tuple(self._entries) if x[1] == "S")
+            )
         ]
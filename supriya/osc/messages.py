@@ -1,13 +1,21 @@
 import collections
 import datetime
 import enum
+import functools
+import re
 import struct
+import threading
 import time
 
 from supriya.system import SupriyaValueObject
 
 from .utils import format_datagram
 
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None
+
 BUNDLE_PREFIX = b"#bundle\x00"
 IMMEDIATELY = struct.pack(">Q", 1)
 NTP_TIMESTAMP_TO_SECONDS = 1.0 / 2.0 ** 32.0
@@ -15,6 +23,159 @@ SECONDS_TO_NTP_TIMESTAMP = 2.0 ** 32.0
 SYSTEM_EPOCH = datetime.date(*time.gmtime(0)[0:3])
 NTP_EPOCH = datetime.date(1900, 1, 1)
 NTP_DELTA = (SYSTEM_EPOCH - NTP_EPOCH).days * 24 * 3600
+ENCODER_CACHE_SIZE = 1024
+STRING_CACHE_SIZE = 4096
+ARRAY_RUN_THRESHOLD = 8
+
+_INT32 = struct.Struct(">i")
+_UINT32 = struct.Struct(">I")
+_FLOAT32 = struct.Struct(">f")
+_FLOAT64 = struct.Struct(">d")
+_UINT64 = struct.Struct(">Q")
+
+_ARRAY_RUN_PATTERN = re.compile(
+    "f{{{0},}}|i{{{0},}}|.".format(ARRAY_RUN_THRESHOLD), re.DOTALL
+)
+_NUMPY_DTYPES = {"f": ">f4", "i": ">i4"}
+
+
+def _as_buffer(datagram):
+    """
+    Coerce ``datagram`` into a searchable buffer plus a memoryview over it.
+
+    Decoding walks an offset cursor over these without re-slicing the
+    payload; only strings and blobs handed back to the caller are copied.
+    """
+    if not isinstance(datagram, (bytes, bytearray)):
+        datagram = bytes(datagram)
+    return datagram, memoryview(datagram)
+
+
+def _decode_blob_contents(data, view, start, stop):
+    # Only blobs shaped like OSC packets are decoded, so that opaque payloads
+    # such as compiled SynthDefs ("SCgf...") come back as bytes.
+    if data.startswith(BUNDLE_PREFIX, start, stop):
+        classes = (OscBundle, OscMessage)
+    elif data.startswith(b"/", start, stop):
+        classes = (OscMessage,)
+    elif _decode_int_address(data, start, stop) is not None:
+        classes = (OscMessage,)
+    else:
+        classes = ()
+    for class_ in classes:
+        try:
+            return class_._decode(data, view, start, stop)
+        except Exception:
+            pass
+    return bytes(view[start:stop])
+
+
+def _decode_int_address(data, offset, end):
+    # SuperCollider's integer command addresses are small positive int32s,
+    # so start with a zero byte like an empty string address, which is told
+    # apart by being all zeros. Either way, type tags follow.
+    if offset + 8 > end or data[offset] or data[offset + 4] != 0x2C:
+        return None
+    return _INT32.unpack_from(data, offset)[0] or None
+
+
+def _encode_ndarray(value):
+    """
+    Encode a NumPy array as a run of big-endian ``f`` or ``i`` arguments.
+
+    Float arrays encode as float32 and integer arrays as int32, in a single
+    ``tobytes()`` call, byte-swapping only when the array isn't already
+    big-endian. Integers outside the int32 range raise, as they would if
+    encoded one at a time.
+    """
+    kind = value.dtype.kind
+    if kind == "f":
+        type_tag = "f"
+    elif kind in "iu":
+        type_tag = "i"
+        if value.size and not numpy.can_cast(value.dtype, ">i4"):
+            minimum, maximum = int(value.min()), int(value.max())
+            if minimum < -(2 ** 31) or maximum >= 2 ** 31:
+                raise ValueError(
+                    "Cannot encode {} values from {} to {} as int32".format(
+                        value.dtype, minimum, maximum
+                    )
+                )
+    else:
+        raise TypeError("Cannot encode {!r}".format(value))
+    encoded_value = value.astype(_NUMPY_DTYPES[type_tag], copy=False).tobytes()
+    return type_tag, value.size, encoded_value
+
+
+@functools.lru_cache(maxsize=ENCODER_CACHE_SIZE)
+def _tokenize_type_tags(type_tags):
+    tokens = []
+    for run in _ARRAY_RUN_PATTERN.findall(type_tags, 1):
+        if len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.append((run[0], len(run)))
+    return tuple(tokens)
+
+
+@functools.lru_cache(maxsize=STRING_CACHE_SIZE)
+def _encode_ascii(value):
+    return value.encode("ascii")
+
+
+class _OscEncoder:
+    """
+    A compiled encoder for one OSC message shape.
+
+    A shape is an address plus a type-tag signature, where strings and blobs
+    also record their padded width, and NumPy arrays their type tag and
+    length. The address and type tags are baked into the struct as a
+    constant leading field.
+    """
+
+    __slots__ = ("_prefix", "_struct", "size")
+
+    def __init__(self, address, signature):
+        if isinstance(address, str):
+            encoded_address = OscMessage._encode_string(address)
+        else:
+            encoded_address = _INT32.pack(address)
+        type_tags, format_ = [","], []
+        for item in signature:
+            if item.__class__ is int:
+                type_tags.append("s")
+                format_.append(f"{item}s")
+            elif item.__class__ is tuple and item[0] == "b":
+                type_tags.append("b")
+                format_.append(f"I{item[1]}s")
+            elif item.__class__ is tuple:
+                type_tags.append(item[0] * item[1])
+                format_.append(f"{item[1] * 4}s")
+            else:
+                type_tags.append(item)
+                if item in "if":
+                    format_.append(item)
+        self._prefix = encoded_address + OscMessage._encode_string("".join(type_tags))
+        self._struct = struct.Struct(f">{len(self._prefix)}s" + "".join(format_))
+        self.size = self._struct.size
+
+    def pack(self, values):
+        return self._struct.pack(self._prefix, *values)
+
+    def pack_into(self, buffer, offset, values):
+        self._struct.pack_into(buffer, offset, self._prefix, *values)
+
+
+_compile_encoder = functools.lru_cache(maxsize=ENCODER_CACHE_SIZE)(_OscEncoder)
+
+_output_buffers = threading.local()
+
+
+def _get_output_buffer(size):
+    buffer = getattr(_output_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _output_buffers.buffer = bytearray(max(size, 8192))
+    return buffer
 
 
 class OscMessage(SupriyaValueObject):
@@ -85,6 +246,27 @@ class OscMessage(SupriyaValueObject):
                     ),
                 ), ['a', 'b', ['c', 'd']])
 
+    ..  container:: example
+
+        NumPy arrays encode inline as runs of float32 or int32 arguments,
+        rather than as OSC arrays:
+
+        ::
+
+            >>> import numpy
+            >>> osc_message = OscMessage("/b_setn", 1, 0, 8, numpy.arange(8) / 4)
+            >>> OscMessage.from_datagram(osc_message.to_datagram())
+            OscMessage('/b_setn', 1, 0, 8, 0.0, 0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75)
+
+        Long runs of ``f`` or ``i`` arguments can decode into arrays
+        viewing the datagram:
+
+        ::
+
+            >>> decoded = OscMessage.from_datagram(osc_message.to_datagram(), arrays=True)
+            >>> decoded.contents[-1]
+            array([0.  , 0.25, 0.5 , 0.75, 1.  , 1.25, 1.5 , 1.75], dtype=float32)
+
     """
 
     ### CLASS VARIABLES ###
@@ -114,27 +296,84 @@ class OscMessage(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, view, offset, end, arrays=False):
+        address = _decode_int_address(data, offset, end)
+        if address is not None:
+            offset += 4
+        else:
+            address, offset = cls._decode_string(data, view, offset, end)
+        type_tags, offset = cls._decode_string(data, view, offset, end)
+        contents = []
+        array_stack = [contents]
+        if arrays:
+            type_tags = _tokenize_type_tags(type_tags)
+        else:
+            type_tags = type_tags[1:]
+        for type_tag in type_tags:
+            if type_tag == "i":
+                array_stack[-1].append(_INT32.unpack_from(data, offset)[0])
+                offset += 4
+            elif type_tag == "f":
+                array_stack[-1].append(_FLOAT32.unpack_from(data, offset)[0])
+                offset += 4
+            elif type_tag == "d":
+                array_stack[-1].append(_FLOAT64.unpack_from(data, offset)[0])
+                offset += 8
+            elif type_tag == "s":
+                value, offset = cls._decode_string(data, view, offset, end)
+                array_stack[-1].append(value)
+            elif type_tag == "b":
+                start, stop, offset = cls._decode_blob(data, offset, end)
+                array_stack[-1].append(_decode_blob_contents(data, view, start, stop))
+            elif type_tag == "T":
+                array_stack[-1].append(True)
+            elif type_tag == "F":
+                array_stack[-1].append(False)
+            elif type_tag == "N":
+                array_stack[-1].append(None)
+            elif type_tag == "[":
+                array = []
+                array_stack[-1].append(array)
+                array_stack.append(array)
+            elif type_tag == "]":
+                array_stack.pop()
+            elif type_tag.__class__ is tuple:
+                type_tag, count = type_tag
+                if offset + count * 4 > end:
+                    raise ValueError("message overruns datagram")
+                array_stack[-1].append(
+                    numpy.frombuffer(
+                        data, dtype=_NUMPY_DTYPES[type_tag], count=count, offset=offset
+                    )
+                )
+                offset += count * 4
+            else:
+                raise RuntimeError(f"Unable to parse type {type_tag!r}")
+        if offset > end:
+            raise ValueError("message overruns datagram")
+        return cls(address, *contents)
+
     @staticmethod
-    def _decode_blob(data):
-        actual_length, remainder = struct.unpack(">I", data[:4])[0], data[4:]
-        padded_length = actual_length
-        if actual_length % 4 != 0:
-            padded_length = (actual_length // 4 + 1) * 4
-        return remainder[:padded_length][:actual_length], remainder[padded_length:]
+    def _decode_blob(data, offset, end):
+        actual_length = _UINT32.unpack_from(data, offset)[0]
+        offset += 4
+        if offset + actual_length > end:
+            raise ValueError("blob overruns datagram")
+        return offset, offset + actual_length, offset + ((actual_length + 3) & ~3)
 
     @staticmethod
-    def _decode_string(data):
-        actual_length = data.index(b"\x00")
-        padded_length = (actual_length // 4 + 1) * 4
-        return str(data[:actual_length], "ascii"), data[padded_length:]
+    def _decode_string(data, view, offset, end):
+        actual_length = data.find(b"\x00", offset, end) - offset
+        if actual_length < 0:
+            raise ValueError("unterminated string")
+        value = str(view[offset : offset + actual_length], "ascii")
+        return value, offset + (actual_length // 4 + 1) * 4
 
     @staticmethod
     def _encode_string(value):
-        result = bytes(value + "\x00", "ascii")
-        if len(result) % 4 != 0:
-            width = (len(result) // 4 + 1) * 4
-            result = result.ljust(width, b"\x00")
-        return result
+        result = _encode_ascii(value)
+        return result.ljust((len(result) // 4 + 1) * 4, b"\x00")
 
     @staticmethod
     def _encode_blob(value):
@@ -144,6 +383,64 @@ class OscMessage(SupriyaValueObject):
             result = result.ljust(width, b"\x00")
         return result
 
+    def _get_encoder(self):
+        """
+        Get this message's compiled encoder and the values to pack with it.
+
+        Returns ``(None, None)`` when the message contains arrays or values
+        which must go through the generic encoding path.
+        """
+        signature, values = [], []
+        for value in self.contents:
+            type_ = type(value)
+            if type_ is int:
+                signature.append("i")
+                values.append(value)
+                continue
+            elif type_ is float:
+                signature.append("f")
+                values.append(value)
+                continue
+            elif type_ is str:
+                value = _encode_ascii(value)
+                signature.append((len(value) // 4 + 1) * 4)
+                values.append(value)
+                continue
+            elif type_ is bool:
+                signature.append("T" if value else "F")
+                continue
+            elif value is None:
+                signature.append("N")
+                continue
+            if hasattr(value, "to_datagram"):
+                value = value.to_datagram()
+            elif isinstance(value, enum.Enum):
+                value = value.value
+            if isinstance(value, (bytearray, bytes)):
+                signature.append(("b", (len(value) + 3) & ~3))
+                values.extend((len(value), bytes(value)))
+            elif isinstance(value, str):
+                value = _encode_ascii(value)
+                signature.append((len(value) // 4 + 1) * 4)
+                values.append(value)
+            elif isinstance(value, bool):
+                signature.append("T" if value else "F")
+            elif isinstance(value, float):
+                signature.append("f")
+                values.append(value)
+            elif isinstance(value, int):
+                signature.append("i")
+                values.append(value)
+            elif value is None:
+                signature.append("N")
+            elif numpy is not None and isinstance(value, numpy.ndarray):
+                type_tag, count, value = _encode_ndarray(value)
+                signature.append((type_tag, count))
+                values.append(value)
+            else:
+                return None, None
+        return _compile_encoder(self.address, tuple(signature)), values
+
     @classmethod
     def _encode_value(cls, value):
         if hasattr(value, "to_datagram"):
@@ -167,6 +464,9 @@ class OscMessage(SupriyaValueObject):
             encoded_value += struct.pack(">i", value)
         elif value is None:
             type_tags += "N"
+        elif numpy is not None and isinstance(value, numpy.ndarray):
+            type_tag, count, encoded_value = _encode_ndarray(value)
+            type_tags += type_tag * count
         elif isinstance(value, collections.Sequence):
             type_tags += "["
             for sub_value in value:
@@ -182,6 +482,9 @@ class OscMessage(SupriyaValueObject):
     ### PUBLIC METHODS ###
 
     def to_datagram(self):
+        encoder, values = self._get_encoder()
+        if encoder is not None:
+            return encoder.pack(values)
         # address can be a string or (in SuperCollider) an int
         if isinstance(self.address, str):
             encoded_address = self._encode_string(self.address)
@@ -198,49 +501,19 @@ class OscMessage(SupriyaValueObject):
         )
 
     @classmethod
-    def from_datagram(cls, datagram):
-        remainder = datagram
-        address, remainder = cls._decode_string(remainder)
-        type_tags, remainder = cls._decode_string(remainder)
-        contents = []
-        array_stack = [contents]
-        for type_tag in type_tags[1:]:
-            if type_tag == "i":
-                value, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "f":
-                value, remainder = struct.unpack(">f", remainder[:4])[0], remainder[4:]
-                array_stack[-1].append(value)
-            elif type_tag == "d":
-                value, remainder = struct.unpack(">d", remainder[:8])[0], remainder[8:]
-                array_stack[-1].append(value)
-            elif type_tag == "s":
-                value, remainder = cls._decode_string(remainder)
-                array_stack[-1].append(value)
-            elif type_tag == "b":
-                value, remainder = cls._decode_blob(remainder)
-                for class_ in (OscBundle, OscMessage):
-                    try:
-                        value = class_.from_datagram(value)
-                        break
-                    except Exception:
-                        pass
-                array_stack[-1].append(value)
-            elif type_tag == "T":
-                array_stack[-1].append(True)
-            elif type_tag == "F":
-                array_stack[-1].append(False)
-            elif type_tag == "N":
-                array_stack[-1].append(None)
-            elif type_tag == "[":
-                array = []
-                array_stack[-1].append(array)
-                array_stack.append(array)
-            elif type_tag == "]":
-                array_stack.pop()
-            else:
-                raise RuntimeError(f"Unable to parse type {type_tag!r}")
-        return cls(address, *contents)
+    def from_datagram(cls, datagram, *, arrays=False):
+        """
+        Decode an OSC message from ``datagram``.
+
+        When ``arrays`` is true and NumPy is available, runs of at least
+        ``ARRAY_RUN_THRESHOLD`` consecutive ``f`` or ``i`` arguments decode
+        into a single big-endian NumPy array viewing ``datagram``, instead
+        of into individual Python numbers.
+        """
+        data, view = _as_buffer(datagram)
+        return cls._decode(
+            data, view, 0, len(data), arrays=arrays and numpy is not None
+        )
 
     def to_list(self):
         result = [self.address]
@@ -327,7 +600,7 @@ class OscBundle(SupriyaValueObject):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("contents", "timestamp")
+    __slots__ = ("_datagrams", "contents", "timestamp")
 
     ### INITIALIZER ###
 
@@ -339,6 +612,7 @@ class OscBundle(SupriyaValueObject):
             if not isinstance(x, prototype):
                 raise ValueError(contents)
         self.contents = tuple(contents)
+        self._datagrams = None
 
     ### SPECIAL METHODS ###
 
@@ -347,13 +621,67 @@ class OscBundle(SupriyaValueObject):
 
     ### PRIVATE METHODS ###
 
+    @classmethod
+    def _decode(cls, data, view, offset, end):
+        if not data.startswith(BUNDLE_PREFIX, offset, end):
+            raise ValueError("datagram is not a bundle")
+        timestamp, offset = cls._decode_date(data, offset + 8)
+        contents = []
+        while offset < end:
+            length = _INT32.unpack_from(data, offset)[0]
+            offset += 4
+            stop = offset + length
+            if length < 0 or stop > end:
+                raise ValueError("bundle element overruns datagram")
+            if data.startswith(BUNDLE_PREFIX, offset, stop):
+                item = cls._decode(data, view, offset, stop)
+            else:
+                item = OscMessage._decode(data, view, offset, stop)
+            contents.append(item)
+            offset = stop
+        return cls(timestamp=timestamp, contents=tuple(contents))
+
     @staticmethod
-    def _decode_date(data):
-        data, remainder = data[:8], data[8:]
-        if data == IMMEDIATELY:
-            return None, remainder
-        date = (struct.unpack(">Q", data)[0] / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
-        return date, remainder
+    def _decode_date(data, offset):
+        value = _UINT64.unpack_from(data, offset)[0]
+        if value == 1:
+            return None, offset + 8
+        date = (value / SECONDS_TO_NTP_TIMESTAMP) - NTP_DELTA
+        return date, offset + 8
+
+    @staticmethod
+    def _join_datagrams(datagrams, encoded_date=IMMEDIATELY):
+        parts = [BUNDLE_PREFIX, encoded_date]
+        for datagram in datagrams:
+            parts.append(_INT32.pack(len(datagram)))
+            parts.append(datagram)
+        return b"".join(parts)
+
+    @staticmethod
+    def _partition_sizes(sizes, capacity):
+        """
+        Partition ``sizes`` into the fewest consecutive runs each summing to
+        at most ``capacity``, as ``(start, stop)`` index pairs.
+
+        Runs keep the order of ``sizes``, and under that constraint closing
+        each run only once the next size no longer fits is optimal. A size
+        larger than ``capacity`` gets a run to itself.
+
+        ::
+
+            >>> supriya.osc.OscBundle._partition_sizes([3, 4, 2, 9, 1, 1], 6)
+            [(0, 1), (1, 3), (3, 4), (4, 6)]
+
+        """
+        runs, start, total = [], 0, 0
+        for index, size in enumerate(sizes):
+            if index > start and total + size > capacity:
+                runs.append((start, index))
+                start, total = index, 0
+            total += size
+        if start < len(sizes):
+            runs.append((start, len(sizes)))
+        return runs
 
     @staticmethod
     def _encode_date(seconds, realtime=True):
@@ -368,52 +696,250 @@ class OscBundle(SupriyaValueObject):
 
     @classmethod
     def from_datagram(cls, datagram):
-        if not datagram.startswith(BUNDLE_PREFIX):
-            raise ValueError("datagram is not a bundle")
-        remainder = datagram[8:]
-        timestamp, remainder = cls._decode_date(remainder)
-        contents = []
-        while len(remainder):
-            length, remainder = struct.unpack(">i", remainder[:4])[0], remainder[4:]
-            if remainder.startswith(BUNDLE_PREFIX):
-                item = cls.from_datagram(remainder[:length])
+        data, view = _as_buffer(datagram)
+        return cls._decode(data, view, 0, len(data))
+
+    def flatten(self):
+        """
+        Flatten bundle into a list of its messages, depth-first.
+
+        ::
+
+            >>> bundle = supriya.osc.OscBundle(
+            ...     contents=(
+            ...         supriya.osc.OscMessage("/one", 1),
+            ...         supriya.osc.OscBundle(
+            ...             contents=(supriya.osc.OscMessage("/two", 2),),
+            ...         ),
+            ...         supriya.osc.OscMessage("/three", 3),
+            ...     ),
+            ... )
+            >>> for message in bundle.flatten():
+            ...     message
+            ...
+            OscMessage('/one', 1)
+            OscMessage('/two', 2)
+            OscMessage('/three', 3)
+
+        """
+        messages = []
+        stack = [iter(self.contents)]
+        while stack:
+            for content in stack[-1]:
+                if isinstance(content, OscBundle):
+                    stack.append(iter(content.contents))
+                    break
+                messages.append(content)
             else:
-                item = OscMessage.from_datagram(remainder[:length])
-            contents.append(item)
-            remainder = remainder[length:]
-        osc_bundle = cls(timestamp=timestamp, contents=tuple(contents))
-        return osc_bundle
+                stack.pop()
+        return messages
 
     @classmethod
-    def partition(cls, messages, timestamp=None):
+    def partition(cls, messages, timestamp=None, *, maximum_packet_size=8192):
+        """
+        Partition ``messages``, in order, into the fewest bundles whose
+        datagrams fit within ``maximum_packet_size``.
+
+        Each message is encoded once, and the resulting bundles reuse those
+        datagrams when they are themselves encoded.
+
+        ::
+
+            >>> messages = [supriya.osc.OscMessage("/n_free", i) for i in range(5)]
+            >>> bundles = supriya.osc.OscBundle.partition(
+            ...     messages, maximum_packet_size=64
+            ... )
+            >>> [len(x.contents) for x in bundles]
+            [2, 2, 1]
+
+        ::
+
+            >>> [len(x.to_datagram()) for x in bundles]
+            [56, 56, 36]
+
+        """
+        messages = list(messages)
+        datagrams = [x.to_datagram() for x in messages]
         bundles = []
-        contents = []
-        message = collections.deque(messages)
-        remaining = maximum = 8192 - len(BUNDLE_PREFIX) - 4
-        while messages:
-            message = messages.popleft()
-            datagram = message.to_datagram()
-            remaining -= len(datagram) + 4
-            if remaining > 0:
-                contents.append(message)
-            else:
-                bundles.append(cls(timestamp=timestamp, contents=contents))
-                contents = [message]
-                remaining = maximum
-        if contents:
-            bundles.append(cls(timestamp=timestamp, contents=contents))
+        for start, stop in cls._partition_sizes(
+            [4 + len(x) for x in datagrams],
+            maximum_packet_size - len(BUNDLE_PREFIX) - 8,
+        ):
+            bundle = cls(timestamp=timestamp, contents=messages[start:stop])
+            bundle._datagrams = (bundle.contents, tuple(datagrams[start:stop]))
+            bundles.append(bundle)
         return bundles
 
     def to_datagram(self, realtime=True):
-        datagram = BUNDLE_PREFIX
-        datagram += self._encode_date(self.timestamp, realtime=realtime)
+        if self._datagrams is not None and self._datagrams[0] is self.contents:
+            return self._join_datagrams(
+                self._datagrams[1], self._encode_date(self.timestamp, realtime=realtime)
+            )
+        items, size = [], len(BUNDLE_PREFIX) + 8
         for content in self.contents:
-            content_datagram = content.to_datagram()
-            datagram += struct.pack(">i", len(content_datagram))
-            datagram += content_datagram
-        return datagram
+            encoder, payload = None, None
+            if isinstance(content, OscMessage):
+                encoder, payload = content._get_encoder()
+            if encoder is None:
+                payload = content.to_datagram()
+                size += 4 + len(payload)
+            else:
+                size += 4 + encoder.size
+            items.append((encoder, payload))
+        # Nested bundles are encoded above, before claiming the shared buffer.
+        buffer = _get_output_buffer(size)
+        buffer[:8] = BUNDLE_PREFIX
+        buffer[8:16] = self._encode_date(self.timestamp, realtime=realtime)
+        offset = 16
+        for encoder, payload in items:
+            if encoder is None:
+                _INT32.pack_into(buffer, offset, len(payload))
+                buffer[offset + 4 : offset + 4 + len(payload)] = payload
+                offset += 4 + len(payload)
+            else:
+                _INT32.pack_into(buffer, offset, encoder.size)
+                encoder.pack_into(buffer, offset + 4, payload)
+                offset += 4 + encoder.size
+        with memoryview(buffer) as view:
+            return bytes(view[:size])
 
     def to_list(self):
         result = [self.timestamp]
         result.append([x.to_list() for x in self.contents])
         return result
+
+
+class OscTemplate:
+    """
+    A pre-encoded OSC datagram with named patch slots.
+
+    Slots name int or float arguments, located by argument index in an OSC
+    message, or by ``(content index, argument index)`` in a flat OSC bundle.
+    One name may cover several locations. Bundle templates always have a
+    ``timestamp`` slot.
+
+    The datagram is encoded once. Each ``patch()`` packs new values into its
+    buffer in place, and returns that same buffer, ready for
+    ``OscProtocol.send_raw()``.
+
+    ::
+
+        >>> bundle = supriya.osc.OscBundle(
+        ...     timestamp=0.0,
+        ...     contents=[
+        ...         supriya.osc.OscMessage(
+        ...             "/s_new", "default", 1000, 0, 1, "frequency", 440.0
+        ...         ),
+        ...         supriya.osc.OscMessage("/n_set", 1000, "gate", 1),
+        ...     ],
+        ... )
+        >>> template = supriya.osc.OscTemplate(
+        ...     bundle, {"node_id": [(0, 1), (1, 0)], "frequency": (0, 5)}
+        ... )
+        >>> template.slots
+        ('frequency', 'node_id', 'timestamp')
+
+    ::
+
+        >>> datagram = template.patch(node_id=1001, frequency=550.0, timestamp=1.5)
+        >>> supriya.osc.OscBundle.from_datagram(datagram)
+        OscBundle(
+            contents=(
+                OscMessage('/s_new', 'default', 1001, 0, 1, 'frequency', 550.0),
+                OscMessage('/n_set', 1001, 'gate', 1),
+                ),
+            timestamp=1.5,
+            )
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_buffer", "_slots")
+
+    _formats = {"f": _FLOAT32, "i": _INT32}
+
+    ### INITIALIZER ###
+
+    def __init__(self, message, slots=None):
+        self._buffer = bytearray(message.to_datagram())
+        self._slots = {}
+        if isinstance(message, OscBundle):
+            offsets, offset = [], len(BUNDLE_PREFIX) + 8
+            for content in message.contents:
+                offsets.append(offset + 4)
+                offset += 4 + _INT32.unpack_from(self._buffer, offset)[0]
+            self._slots["timestamp"] = (
+                self._encode_timestamp,
+                [(_UINT64.pack_into, len(BUNDLE_PREFIX))],
+            )
+        for name, locations in sorted((slots or {}).items()):
+            if not isinstance(locations, list):
+                locations = [locations]
+            packers = []
+            for location in locations:
+                if isinstance(message, OscBundle):
+                    content_index, argument_index = location
+                    content = message.contents[content_index]
+                    if not isinstance(content, OscMessage):
+                        raise ValueError(location)
+                    offset = offsets[content_index]
+                else:
+                    argument_index, content, offset = location, message, 0
+                packers.append(self._locate(content, argument_index, offset))
+            self._slots[name] = (None, packers)
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _encode_timestamp(seconds):
+        if seconds is None:
+            return 1
+        return int((seconds + NTP_DELTA) * SECONDS_TO_NTP_TIMESTAMP)
+
+    @classmethod
+    def _locate(cls, message, argument_index, offset):
+        encoded = [OscMessage._encode_value(x) for x in message.contents]
+        type_tag = encoded[argument_index][0]
+        if type_tag not in cls._formats:
+            raise ValueError(
+                "Cannot patch {!r} argument {}".format(message.address, argument_index)
+            )
+        if isinstance(message.address, str):
+            offset += len(OscMessage._encode_string(message.address))
+        else:
+            offset += 4
+        type_tags = "," + "".join(x[0] for x in encoded)
+        offset += len(OscMessage._encode_string(type_tags))
+        offset += sum(len(x[1]) for x in encoded[:argument_index])
+        return cls._formats[type_tag].pack_into, offset
+
+    ### PUBLIC METHODS ###
+
+    def patch(self, **values):
+        """
+        Patch slot ``values`` into the datagram, returning its buffer.
+
+        Slots not named keep their last patched value.
+        """
+        buffer = self._buffer
+        for name, value in values.items():
+            encode, packers = self._slots[name]
+            if encode is not None:
+                value = encode(value)
+            for pack_into, offset in packers:
+                pack_into(buffer, offset, value)
+        return buffer
+
+    def to_datagram(self):
+        return bytes(self._buffer)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def size(self):
+        return len(self._buffer)
+
+    @property
+    def slots(self):
+        return tuple(sorted(self._slots))
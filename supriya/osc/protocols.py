@@ -3,18 +3,45 @@ import collections
 import dataclasses
 import logging
 import queue
-import socketserver
+import select
+import socket
+import struct
 import threading
 import time
-from typing import Any, Callable, Dict, NamedTuple, Optional, Set, Tuple, Union
+from typing import Callable, List, Set
 
-from .captures import Capture, CaptureEntry
-from .messages import OscBundle, OscMessage
+from .callbacks import OscCallback, OscCallbackIndex
+from .captures import Capture
+from .messages import BUNDLE_PREFIX, IMMEDIATELY, OscBundle, OscMessage
 
 osc_in_logger = logging.getLogger("supriya.osc.in")
 osc_out_logger = logging.getLogger("supriya.osc.out")
 udp_in_logger = logging.getLogger("supriya.udp.in")
 udp_out_logger = logging.getLogger("supriya.udp.out")
+tcp_in_logger = logging.getLogger("supriya.tcp.in")
+tcp_out_logger = logging.getLogger("supriya.tcp.out")
+
+NONBLOCKING_FLAG = getattr(socket, "MSG_DONTWAIT", 0)
+PACKET_LENGTH = struct.Struct(">i")
+
+
+def _frame_packet(datagram):
+    return PACKET_LENGTH.pack(len(datagram)) + datagram
+
+
+def _unframe_packets(stream):
+    """
+    Pop complete length-prefixed packets off the front of ``stream``.
+    """
+    packets, offset = [], 0
+    while len(stream) - offset >= 4:
+        size = PACKET_LENGTH.unpack_from(stream, offset)[0]
+        if len(stream) - offset - 4 < size:
+            break
+        packets.append(bytes(stream[offset + 4 : offset + 4 + size]))
+        offset += 4 + size
+    del stream[:offset]
+    return packets
 
 
 class OscProtocolOffline(Exception):
@@ -25,11 +52,14 @@ class OscProtocolAlreadyConnected(Exception):
     pass
 
 
-class OscCallback(NamedTuple):
-    pattern: Tuple[Union[str, int, float], ...]
-    procedure: Callable
-    failure_pattern: Optional[Tuple[Union[str, int, float], ...]] = None
-    once: bool = False
+@dataclasses.dataclass
+class CoalescingStatistics:
+    flush_count: int = 0
+    message_count: int = 0
+    packet_count: int = 0
+    byte_count: int = 0
+    last_flush_message_count: int = 0
+    last_flush_packet_count: int = 0
 
 
 @dataclasses.dataclass
@@ -44,10 +74,18 @@ class HealthCheck:
 
 class OscProtocol:
 
+    ### CLASS VARIABLES ###
+
+    maximum_packet_size = 8192
+
+    packet_in_logger = udp_in_logger
+
+    packet_out_logger = udp_out_logger
+
     ### INITIALIZER ###
 
     def __init__(self):
-        self.callbacks: Dict[Any, Any] = {}
+        self.callbacks = OscCallbackIndex()
         self.captures: Set[Capture] = set()
         self.healthcheck = None
         self.healthcheck_osc_callback = None
@@ -59,47 +97,31 @@ class OscProtocol:
     ### PRIVATE METHODS ###
 
     def _add_callback(self, callback: OscCallback):
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            callback_map = self.callbacks
-            for item in pattern:
-                callbacks, callback_map = callback_map.setdefault(item, ([], {}))
-            callbacks.append(callback)
-
-    def _match_callbacks(self, message):
-        items = (message.address,) + message.contents
+        self.callbacks.add(callback)
+
+    def _capture_raw(self, datagram):
+        datagram = bytes(datagram)
+        message, messages = self._decode_datagram(datagram, len(datagram))
+        for capture in tuple(self.captures):
+            capture._record("S", message, messages, datagram)
+
+    def _match_callbacks(self, messages):
         matching_callbacks = []
-        callback_map = self.callbacks
-        for item in items:
-            if item not in callback_map:
-                break
-            callbacks, callback_map = callback_map[item]
-            matching_callbacks.extend(callbacks)
-        for callback in matching_callbacks:
-            if callback.once:
-                self.unregister(callback)
+        once_callbacks = {}
+        for message in messages:
+            for callback in self.callbacks.match(message):
+                if callback.once:
+                    # Fire once-only callbacks at most once per batch.
+                    if id(callback) in once_callbacks:
+                        continue
+                    once_callbacks[id(callback)] = callback
+                matching_callbacks.append((callback, message))
+        for callback in once_callbacks.values():
+            self._remove_callback(callback)
         return matching_callbacks
 
     def _remove_callback(self, callback: OscCallback):
-        def delete(pattern, original_callback_map):
-            key = pattern.pop(0)
-            if key not in original_callback_map:
-                return
-            callbacks, callback_map = original_callback_map[key]
-            if pattern:
-                delete(pattern, callback_map)
-            if callback in callbacks:
-                callbacks.remove(callback)
-            if not callbacks and not callback_map:
-                original_callback_map.pop(key)
-
-        patterns = [callback.pattern]
-        if callback.failure_pattern:
-            patterns.append(callback.failure_pattern)
-        for pattern in patterns:
-            delete(list(pattern), self.callbacks)
+        self.callbacks.remove(callback)
 
     def _reset_attempts(self, message):
         self.attempts = 0
@@ -134,42 +156,74 @@ class OscProtocol:
             once=bool(once),
         )
 
-    def _validate_receive(self, datagram):
-        udp_in_logger.debug(datagram)
-        try:
-            message = OscMessage.from_datagram(datagram)
-        except Exception:
-            raise
+    @staticmethod
+    def _decode_datagram(datagram, size):
+        view = memoryview(datagram)
+        if datagram.startswith(BUNDLE_PREFIX, 0, size):
+            message = OscBundle._decode(datagram, view, 0, size)
+            return message, message.flatten()
+        message = OscMessage._decode(datagram, view, 0, size)
+        return message, (message,)
+
+    def _dispatch_receive(self, message, messages, datagram=None):
         osc_in_logger.debug(repr(message))
-        for callback in self._match_callbacks(message):
-            callback.procedure(message)
-        for capture in self.captures:
-            capture.messages.append(
-                CaptureEntry(timestamp=time.time(), label="R", message=message,)
-            )
+        for callback, callback_message in self._match_callbacks(messages):
+            callback.procedure(callback_message)
+        if self.captures:
+            for capture in tuple(self.captures):
+                capture._record("R", message, messages, datagram)
+
+    def _validate_receive(self, datagram):
+        self.packet_in_logger.debug(datagram)
+        self._dispatch_receive(
+            *self._decode_datagram(datagram, len(datagram)), datagram=datagram
+        )
+
+    def _send_encoded(self, message, datagram):
+        """
+        Send ``message``, already encoded as ``datagram``, as ``send()`` would.
+
+        ``message`` may also be a request, converted to an OSC message only if
+        out-logging or a capture needs one.
+        """
+        self._send_validated(self._validate_send(message, datagram))
+
+    def _send_validated(self, datagram):
+        raise NotImplementedError
 
-    def _validate_send(self, message):
+    def _validate_send(self, message, datagram=None):
         if not self.is_running:
             raise OscProtocolOffline
-        if not isinstance(message, (str, collections.Iterable, OscBundle, OscMessage)):
-            raise ValueError(message)
-        if isinstance(message, str):
-            message = OscMessage(message)
-        elif isinstance(message, collections.Iterable):
-            message = OscMessage(*message)
-        osc_out_logger.debug(repr(message))
-        for capture in self.captures:
-            capture.messages.append(
-                CaptureEntry(timestamp=time.time(), label="S", message=message)
-            )
-        datagram = message.to_datagram()
-        udp_out_logger.debug(datagram)
+        if datagram is None:
+            if not isinstance(
+                message, (str, collections.Iterable, OscBundle, OscMessage)
+            ):
+                raise ValueError(message)
+            if isinstance(message, str):
+                message = OscMessage(message)
+            elif isinstance(message, collections.Iterable):
+                message = OscMessage(*message)
+            datagram = message.to_datagram()
+        elif not isinstance(message, (OscBundle, OscMessage)) and (
+            self.captures or osc_out_logger.isEnabledFor(logging.DEBUG)
+        ):
+            message = message.to_osc()
+        osc_out_logger.debug("%r", message)
+        if self.captures:
+            for capture in tuple(self.captures):
+                capture._record("S", message, datagram=datagram)
+        self.packet_out_logger.debug(datagram)
         return datagram
 
     ### PUBLIC METHODS ###
 
-    def capture(self):
-        return Capture(self)
+    def capture(self, *, addresses=None, maximum_bytes=None, maximum_entries=None):
+        return Capture(
+            self,
+            addresses=addresses,
+            maximum_bytes=maximum_bytes,
+            maximum_entries=maximum_entries,
+        )
 
     def connect(self, ip_address: str, port: int, *, healthcheck: HealthCheck = None):
         ...
@@ -185,21 +239,82 @@ class OscProtocol:
     def send(self, message):
         ...
 
+    def send_raw(self, datagram):
+        """
+        Send an already-encoded ``datagram``.
+
+        Skips type-checking, encoding and logging. Captures still record it.
+        """
+        ...
+
     def unregister(self, callback: OscCallback):
         ...
 
 
-class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
+class BaseAsyncOscProtocol(OscProtocol):
+    """
+    Transport-independent base for asyncio OSC protocols, handling
+    healthchecks and coalescing.
+    """
 
     ### INITIALIZER ###
 
-    def __init__(self):
-        asyncio.DatagramProtocol.__init__(self)
+    def __init__(self, *, coalesce: bool = False, coalesce_window: float = 0.0):
         OscProtocol.__init__(self)
+        self.coalesce = coalesce
+        self.coalesce_window = coalesce_window
+        self.coalescing_statistics = CoalescingStatistics()
         self.loop = None
+        self.pending_datagrams: List[bytes] = []
+        self.pending_flush = None
 
     ### PRIVATE METHODS ###
 
+    def _flush(self):
+        if self.pending_flush is not None:
+            self.pending_flush.cancel()
+            self.pending_flush = None
+        datagrams, self.pending_datagrams = self.pending_datagrams, []
+        if not datagrams:
+            return
+        packets = [
+            datagrams[start:stop]
+            for start, stop in OscBundle._partition_sizes(
+                [4 + len(x) for x in datagrams],
+                self.maximum_packet_size - len(BUNDLE_PREFIX) - 8,
+            )
+        ]
+        statistics = self.coalescing_statistics
+        statistics.flush_count += 1
+        statistics.message_count += len(datagrams)
+        statistics.packet_count += len(packets)
+        statistics.last_flush_message_count = len(datagrams)
+        statistics.last_flush_packet_count = len(packets)
+        for contents in packets:
+            if len(contents) == 1:
+                datagram = contents[0]
+            else:
+                datagram = OscBundle._join_datagrams(contents, IMMEDIATELY)
+            statistics.byte_count += len(datagram)
+            self._send_datagram(datagram)
+
+    def _send_datagram(self, datagram):
+        raise NotImplementedError
+
+    def _send_validated(self, datagram):
+        if not self.coalesce or datagram.startswith(BUNDLE_PREFIX):
+            if self.pending_datagrams:
+                self._flush()
+            return self._send_datagram(datagram)
+        self.pending_datagrams.append(datagram)
+        if self.pending_flush is None:
+            if self.coalesce_window > 0:
+                self.pending_flush = self.loop.call_later(
+                    self.coalesce_window, self._flush
+                )
+            else:
+                self.pending_flush = self.loop.call_soon(self._flush)
+
     async def _run_healthcheck(self):
         while self.is_running:
             sleep_time = self.healthcheck.timeout * pow(
@@ -207,29 +322,22 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
             )
             self.attempts += 1
             if self.attempts >= self.healthcheck.max_attempts:
-                self.exit_future.set_result(True)
-                self._teardown()
-                self.transport.close()
-                obj_ = self.healthcheck.callback()
-                if asyncio.iscoroutine(obj_):
-                    self.loop.create_task(obj_)
+                self._shutdown_and_notify()
                 return
             self.send(OscMessage(*self.healthcheck.request_pattern))
             await asyncio.sleep(sleep_time)
 
-    ### PUBLIC METHODS ###
+    def _shutdown_and_notify(self):
+        self.exit_future.set_result(True)
+        self._teardown()
+        self.transport.close()
+        if self.healthcheck is None:
+            return
+        obj_ = self.healthcheck.callback()
+        if asyncio.iscoroutine(obj_):
+            self.loop.create_task(obj_)
 
-    async def connect(
-        self, ip_address: str, port: int, *, healthcheck: HealthCheck = None
-    ):
-        if self.is_running:
-            raise OscProtocolAlreadyConnected
-        self._setup(ip_address, port, healthcheck)
-        self.loop = asyncio.get_running_loop()
-        self.exit_future = self.loop.create_future()
-        _, protocol = await self.loop.create_datagram_endpoint(
-            lambda: self, remote_addr=(ip_address, port),
-        )
+    ### PUBLIC METHODS ###
 
     def connection_made(self, transport):
         loop = asyncio.get_running_loop()
@@ -238,15 +346,10 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         if self.healthcheck:
             self.healthcheck_task = loop.create_task(self._run_healthcheck())
 
-    def connection_lost(self, exc):
-        pass
-
-    def datagram_received(self, data, addr):
-        self._validate_receive(data)
-
     async def disconnect(self):
         if not self.is_running:
             return
+        self._flush()
         self.exit_future.set_result(True)
         self._teardown()
         if self.loop.is_closed():
@@ -256,9 +359,6 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         if self.healthcheck is not None:
             await self.healthcheck_task
 
-    def error_received(self, exc):
-        osc_out_logger.warning(exc)
-
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False,
     ) -> OscCallback:
@@ -269,40 +369,175 @@ class AsyncOscProtocol(asyncio.DatagramProtocol, OscProtocol):
         return callback
 
     def send(self, message):
-        datagram = self._validate_send(message)
-        return self.transport.sendto(datagram)
+        self._send_validated(self._validate_send(message))
+
+    def send_raw(self, datagram):
+        if not self.is_running:
+            raise OscProtocolOffline
+        if self.captures:
+            self._capture_raw(datagram)
+        if self.pending_datagrams:
+            self._flush()
+        # Transports copy whatever they can't send immediately.
+        return self._send_datagram(datagram)
 
     def unregister(self, callback: OscCallback):
         self._remove_callback(callback)
 
 
-class ThreadedOscServer(socketserver.UDPServer):
-    osc_protocol: "ThreadedOscProtocol"
+class AsyncOscProtocol(BaseAsyncOscProtocol, asyncio.DatagramProtocol):
+    """
+    An asyncio OSC protocol.
+
+    With ``coalesce`` enabled, OSC messages sent during the same event-loop
+    tick, or within ``coalesce_window`` seconds of the first of them, are
+    buffered and flushed together as immediate bundles bounded by
+    ``maximum_packet_size``. Bundles are never coalesced, but flush any
+    buffered messages ahead of themselves to preserve ordering.
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(self, *, coalesce: bool = False, coalesce_window: float = 0.0):
+        BaseAsyncOscProtocol.__init__(
+            self, coalesce=coalesce, coalesce_window=coalesce_window
+        )
+        asyncio.DatagramProtocol.__init__(self)
+
+    ### PRIVATE METHODS ###
+
+    def _send_datagram(self, datagram):
+        return self.transport.sendto(datagram)
+
+    ### PUBLIC METHODS ###
+
+    async def connect(
+        self, ip_address: str, port: int, *, healthcheck: HealthCheck = None
+    ):
+        if self.is_running:
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.loop = asyncio.get_running_loop()
+        self.exit_future = self.loop.create_future()
+        _, protocol = await self.loop.create_datagram_endpoint(
+            lambda: self, remote_addr=(ip_address, port),
+        )
+
+    def connection_lost(self, exc):
+        pass
 
-    def verify_request(self, request, client_address):
-        self.osc_protocol._process_command_queue()
-        return True
+    def datagram_received(self, data, addr):
+        self._validate_receive(data)
 
-    def service_actions(self):
-        self.osc_protocol._run_healthcheck()
+    def error_received(self, exc):
+        osc_out_logger.warning(exc)
 
 
-class ThreadedOscHandler(socketserver.BaseRequestHandler):
-    def handle(self):
-        data = self.request[0]
-        self.server.osc_protocol._validate_receive(data)
+class AsyncTcpOscProtocol(BaseAsyncOscProtocol, asyncio.Protocol):
+    """
+    An asyncio OSC protocol speaking length-prefixed OSC over TCP.
+
+    Packets are not bound by the UDP datagram limit, and delivery is
+    guaranteed. Losing the connection shuts the protocol down as if its
+    healthcheck had failed. Messages coalesce as with ``AsyncOscProtocol``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    maximum_packet_size = 2 ** 31 - 1
+
+    packet_in_logger = tcp_in_logger
+
+    packet_out_logger = tcp_out_logger
+
+    ### INITIALIZER ###
+
+    def __init__(self, *, coalesce: bool = False, coalesce_window: float = 0.0):
+        BaseAsyncOscProtocol.__init__(
+            self, coalesce=coalesce, coalesce_window=coalesce_window
+        )
+        asyncio.Protocol.__init__(self)
+        self.stream = bytearray()
+
+    ### PRIVATE METHODS ###
+
+    def _send_datagram(self, datagram):
+        return self.transport.write(_frame_packet(datagram))
+
+    ### PUBLIC METHODS ###
+
+    async def connect(
+        self, ip_address: str, port: int, *, healthcheck: HealthCheck = None
+    ):
+        if self.is_running:
+            raise OscProtocolAlreadyConnected
+        self._setup(ip_address, port, healthcheck)
+        self.loop = asyncio.get_running_loop()
+        self.exit_future = self.loop.create_future()
+        self.stream = bytearray()
+        await self.loop.create_connection(lambda: self, ip_address, port)
+
+    def connection_lost(self, exc):
+        if self.is_running:
+            osc_in_logger.warning("Connection lost: {!r}".format(exc))
+            self._shutdown_and_notify()
+
+    def data_received(self, data):
+        self.stream.extend(data)
+        for datagram in _unframe_packets(self.stream):
+            self._validate_receive(datagram)
+
+    def eof_received(self):
+        return False
 
 
 class ThreadedOscProtocol(OscProtocol):
+    """
+    A threaded OSC protocol.
+
+    A dedicated receive thread reads datagrams in batches into a preallocated
+    buffer, decodes them and hands each batch to a bounded dispatch queue.
+    A pool of worker threads serves the queue, matching and invoking
+    callbacks.
+
+    With more than one worker, callbacks for different datagrams may run
+    concurrently and out of order.
+    """
+
+    ### CLASS VARIABLES ###
+
+    receive_chunk_size = 65536
+
+    socket_type = socket.SOCK_DGRAM
 
     ### INITIALIZER ###
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        receive_buffer_size: int = None,
+        send_buffer_size: int = None,
+        receive_batch_size: int = 64,
+        dispatch_queue_size: int = 1024,
+        worker_count: int = 1,
+        poll_interval: float = 0.1,
+    ):
         OscProtocol.__init__(self)
-        self.command_queue = queue.Queue()
+        if receive_batch_size < 1 or worker_count < 1:
+            raise ValueError(receive_batch_size, worker_count)
+        self.callback_lock = threading.RLock()
+        self.command_queue: queue.Queue = queue.Queue()
+        self.dispatch_queue: queue.Queue = queue.Queue(maxsize=dispatch_queue_size)
+        self.dispatch_queue_size = dispatch_queue_size
         self.lock = threading.RLock()
-        self.server = None
-        self.server_thread = None
+        self.poll_interval = poll_interval
+        self.receive_batch_size = receive_batch_size
+        self.receive_buffer_size = receive_buffer_size
+        self.receive_thread = None
+        self.send_buffer_size = send_buffer_size
+        self.socket = None
+        self.worker_count = worker_count
+        self.worker_threads: List[threading.Thread] = []
 
     ### SPECIAL METHODS ###
 
@@ -311,10 +546,29 @@ class ThreadedOscProtocol(OscProtocol):
 
     ### PRIVATE METHODS ###
 
+    def _dispatch_loop(self):
+        while self.is_running:
+            try:
+                batch = self.dispatch_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+            if batch is None:
+                return
+            for message, messages, datagram in batch:
+                try:
+                    self._dispatch_receive(message, messages, datagram)
+                except Exception:
+                    osc_in_logger.exception("Failed to dispatch {!r}".format(message))
+
+    def _match_callbacks(self, messages):
+        with self.callback_lock:
+            self._process_command_queue()
+            return super()._match_callbacks(messages)
+
     def _process_command_queue(self):
         while self.command_queue.qsize():
             try:
-                action, callback = self.command_queue.get()
+                action, callback = self.command_queue.get_nowait()
             except queue.Empty:
                 continue
             if action == "add":
@@ -322,8 +576,54 @@ class ThreadedOscProtocol(OscProtocol):
             elif action == "remove":
                 self._remove_callback(callback)
 
+    def _receive_batch(self, buffer, view):
+        batch = []
+        if not select.select([self.socket], [], [], self.poll_interval)[0]:
+            return batch
+        flags = 0
+        while len(batch) < self.receive_batch_size:
+            try:
+                size = self.socket.recv_into(buffer, 0, flags)
+            except BlockingIOError:
+                break
+            if self.packet_in_logger.isEnabledFor(logging.DEBUG):
+                self.packet_in_logger.debug(bytes(view[:size]))
+            try:
+                message, messages = self._decode_datagram(buffer, size)
+            except Exception:
+                osc_in_logger.exception("Failed to decode datagram")
+            else:
+                # The receive buffer is reused, so copy out datagrams for captures.
+                datagram = bytes(view[:size]) if self.captures else None
+                batch.append((message, messages, datagram))
+            if not NONBLOCKING_FLAG:
+                break
+            # Drain whatever else is already waiting, without blocking.
+            flags = NONBLOCKING_FLAG
+        return batch
+
+    def _receive_loop(self):
+        buffer = bytearray(self.receive_chunk_size)
+        view = memoryview(buffer)
+        while self.is_running:
+            try:
+                batch = self._receive_batch(buffer, view)
+            except (OSError, ValueError):
+                if self.is_running:
+                    raise
+                return
+            while batch and self.is_running:
+                try:
+                    self.dispatch_queue.put(batch, timeout=self.poll_interval)
+                    break
+                except queue.Full:
+                    continue
+            self._run_healthcheck()
+
     def _run_healthcheck(self):
-        if self.healthcheck is None or time.time() < self.healthcheck_deadline:
+        if not self.is_running or self.healthcheck is None:
+            return
+        elif time.time() < self.healthcheck_deadline:
             return
         self.healthcheck_deadline += self.healthcheck.timeout * pow(
             self.healthcheck.backoff_factor, self.attempts
@@ -332,41 +632,75 @@ class ThreadedOscProtocol(OscProtocol):
         if self.attempts < self.healthcheck.max_attempts:
             self.send(OscMessage(*self.healthcheck.request_pattern))
             return
-        self._BaseServer__shutdown_request = True
-        with self.lock:
-            self._teardown()
-            self.server = None
-            self.server_thread = None
+        self._shutdown_and_notify()
+
+    def _shutdown_and_notify(self):
+        self.disconnect()
+        if self.healthcheck is not None:
             self.healthcheck.callback()
 
-    def _server_factory(self, ip_address, port):
-        server = ThreadedOscServer(
-            (self.ip_address, self.port), ThreadedOscHandler, bind_and_activate=False
-        )
-        server.osc_protocol = self
-        return server
+    def _send_validated(self, datagram):
+        self.socket.sendto(datagram, (self.ip_address, self.port))
+
+    def _socket_factory(self, ip_address, port):
+        socket_ = socket.socket(socket.AF_INET, self.socket_type)
+        if self.receive_buffer_size:
+            socket_.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+            )
+        if self.send_buffer_size:
+            socket_.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.send_buffer_size
+            )
+        if self.socket_type == socket.SOCK_STREAM:
+            socket_.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            socket_.connect((ip_address, port))
+        else:
+            socket_.bind(("", 0))
+        return socket_
 
     ### PUBLIC METHODS ###
 
     def connect(self, ip_address: str, port: int, *, healthcheck: HealthCheck = None):
-        if self.is_running:
-            raise OscProtocolAlreadyConnected
-        self._setup(ip_address, port, healthcheck)
-        self.healthcheck_deadline = time.time()
-        self.server = self._server_factory(ip_address, port)
-        self.server_thread = threading.Thread(target=self.server.serve_forever)
-        self.server_thread.daemon = True
-        self.server_thread.start()
-        self.is_running = True
+        with self.lock:
+            if self.is_running:
+                raise OscProtocolAlreadyConnected
+            self._setup(ip_address, port, healthcheck)
+            self.healthcheck_deadline = time.time()
+            self.dispatch_queue = queue.Queue(maxsize=self.dispatch_queue_size)
+            self.socket = self._socket_factory(ip_address, port)
+            self.is_running = True
+            self.receive_thread = threading.Thread(
+                target=self._receive_loop, daemon=True
+            )
+            self.worker_threads = [
+                threading.Thread(target=self._dispatch_loop, daemon=True)
+                for _ in range(self.worker_count)
+            ]
+            for thread in (self.receive_thread, *self.worker_threads):
+                thread.start()
 
     def disconnect(self):
         with self.lock:
             if not self.is_running:
                 return
             self._teardown()
-            self.server.shutdown()
-            self.server = None
-            self.server_thread = None
+            threads = [self.receive_thread, *self.worker_threads]
+            for _ in self.worker_threads:
+                try:
+                    self.dispatch_queue.put_nowait(None)
+                except queue.Full:
+                    pass
+            self.receive_thread = None
+            self.worker_threads = []
+        current_thread = threading.current_thread()
+        for thread in threads:
+            if thread is not current_thread:
+                thread.join()
+        with self.lock:
+            if not self.is_running and self.socket is not None:
+                self.socket.close()
+                self.socket = None
 
     def register(
         self, pattern, procedure, *, failure_pattern=None, once=False,
@@ -382,12 +716,14 @@ class ThreadedOscProtocol(OscProtocol):
         return callback
 
     def send(self, message):
-        datagram = self._validate_send(message)
-        try:
-            self.server.socket.sendto(datagram, (self.ip_address, self.port))
-        except OSError:
-            # print(message)
-            raise
+        self._send_validated(self._validate_send(message))
+
+    def send_raw(self, datagram):
+        if not self.is_running:
+            raise OscProtocolOffline
+        if self.captures:
+            self._capture_raw(datagram)
+        self.socket.sendto(datagram, (self.ip_address, self.port))
 
     def unregister(self, callback: OscCallback):
         """
@@ -395,3 +731,80 @@ class ThreadedOscProtocol(OscProtocol):
         """
         # Command queue prevents lock contention.
         self.command_queue.put(("remove", callback))
+
+
+class ThreadedTcpOscProtocol(ThreadedOscProtocol):
+    """
+    A threaded OSC protocol speaking length-prefixed OSC over TCP.
+
+    Packets are not bound by the UDP datagram limit, and delivery is
+    guaranteed. Losing the connection shuts the protocol down as if its
+    healthcheck had failed.
+    """
+
+    ### CLASS VARIABLES ###
+
+    maximum_packet_size = 2 ** 31 - 1
+
+    packet_in_logger = tcp_in_logger
+
+    packet_out_logger = tcp_out_logger
+
+    socket_type = socket.SOCK_STREAM
+
+    ### INITIALIZER ###
+
+    def __init__(self, **kwargs):
+        ThreadedOscProtocol.__init__(self, **kwargs)
+        self.send_lock = threading.Lock()
+        self.stream = bytearray()
+
+    ### PRIVATE METHODS ###
+
+    def _receive_batch(self, buffer, view):
+        if not select.select([self.socket], [], [], self.poll_interval)[0]:
+            return []
+        flags = 0
+        while len(self.stream) < self.receive_batch_size * self.receive_chunk_size:
+            try:
+                size = self.socket.recv_into(buffer, 0, flags)
+            except BlockingIOError:
+                break
+            if not size:
+                osc_in_logger.warning("Connection lost")
+                self._shutdown_and_notify()
+                return []
+            self.stream.extend(view[:size])
+            if not NONBLOCKING_FLAG:
+                break
+            flags = NONBLOCKING_FLAG
+        batch = []
+        for datagram in _unframe_packets(self.stream):
+            self.packet_in_logger.debug(datagram)
+            try:
+                batch.append(
+                    self._decode_datagram(datagram, len(datagram)) + (datagram,)
+                )
+            except Exception:
+                osc_in_logger.exception("Failed to decode packet")
+        return batch
+
+    def _send_validated(self, datagram):
+        datagram = _frame_packet(datagram)
+        with self.send_lock:
+            self.socket.sendall(datagram)
+
+    ### PUBLIC METHODS ###
+
+    def connect(self, ip_address: str, port: int, *, healthcheck: HealthCheck = None):
+        self.stream = bytearray()
+        ThreadedOscProtocol.connect(self, ip_address, port, healthcheck=healthcheck)
+
+    def send_raw(self, datagram):
+        if not self.is_running:
+            raise OscProtocolOffline
+        if self.captures:
+            self._capture_raw(datagram)
+        datagram = _frame_packet(datagram)
+        with self.send_lock:
+            self.socket.sendall(datagram)
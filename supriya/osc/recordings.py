@@ -0,0 +1,269 @@
+import bisect
+import collections
+import dataclasses
+import pathlib
+import struct
+import time
+from typing import List
+
+from .captures import Capture
+from .messages import BUNDLE_PREFIX
+
+_HEADER = b"#oscrec\x00" + struct.pack(">H", 1)
+_ENTRY = struct.Struct(">dcI")
+
+
+@dataclasses.dataclass
+class ReplayReport:
+    """
+    The outcome of replaying a recording.
+
+    Replies are matched to recorded replies by content, in order. Recorded
+    replies never seen are ``missing``, and replies not in the recording
+    are ``unexpected``. Latencies run from sending the datagram which
+    elicited a reply in the recording, or the last one sent before the reply
+    if it now arrives sooner, to its matching reply arriving.
+    """
+
+    duration: float
+    sent_count: int
+    sent_bytes: int
+    received_count: int
+    matched_count: int
+    latencies: List[float]
+    missing: List[bytes]
+    unexpected: List[bytes]
+
+    ### SPECIAL METHODS ###
+
+    def __str__(self):
+        lines = [
+            "sent: {} datagrams, {} bytes in {:.3f}s".format(
+                self.sent_count, self.sent_bytes, self.duration
+            ),
+            "throughput: {:.1f} datagrams/s, {:.1f} bytes/s".format(
+                self.message_rate, self.byte_rate
+            ),
+            "replies: {} received, {} matched, {} missing, {} unexpected".format(
+                self.received_count,
+                self.matched_count,
+                len(self.missing),
+                len(self.unexpected),
+            ),
+        ]
+        if self.latencies:
+            lines.append(
+                "latency: "
+                + ", ".join(
+                    "p{}={:.2f}ms".format(x, self.percentile(x) * 1000)
+                    for x in (50, 90, 99, 100)
+                )
+            )
+        return "\n".join(lines)
+
+    ### PUBLIC METHODS ###
+
+    def percentile(self, percentile):
+        """
+        Get the nearest-rank ``percentile`` of reply latencies, in seconds.
+
+        ::
+
+            >>> report = supriya.osc.ReplayReport(
+            ...     duration=1.0, sent_count=4, sent_bytes=64, received_count=4,
+            ...     matched_count=4, latencies=[0.4, 0.1, 0.3, 0.2],
+            ...     missing=[], unexpected=[],
+            ... )
+            >>> report.percentile(50), report.percentile(90), report.percentile(100)
+            (0.2, 0.4, 0.4)
+
+        """
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        index = max(0, -(-len(latencies) * percentile // 100) - 1)
+        return latencies[int(index)]
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def byte_rate(self):
+        return self.sent_bytes / self.duration if self.duration else 0.0
+
+    @property
+    def message_rate(self):
+        return self.sent_count / self.duration if self.duration else 0.0
+
+    @property
+    def mismatched_count(self):
+        return len(self.missing) + len(self.unexpected)
+
+
+class Recording(Capture):
+    """
+    A recording of raw OSC traffic, for saving and replaying.
+
+    Like a bounded capture, a recording keeps raw datagrams stamped with
+    ``time.time()``, but is unbounded unless ``maximum_entries`` or
+    ``maximum_bytes`` are given. Recordings save to, and load from, a
+    compact binary file: a short header, then per entry a big-endian
+    float64 timestamp, a one-byte ``S`` or ``R`` label, a uint32 length
+    and the datagram itself.
+
+    ::
+
+        >>> from supriya.osc import OscMessage, Recording
+        >>> recording = Recording(None)
+        >>> recording._record("S", OscMessage("/sync", 1))
+        >>> recording._record("R", OscMessage("/synced", 1))
+        >>> for _, label, message in recording:
+        ...     print(label, repr(message))
+        ...
+        S OscMessage('/sync', 1)
+        R OscMessage('/synced', 1)
+
+    Replaying sends the recorded outgoing datagrams through another OSC
+    protocol, or a server's, and compares the replies:
+
+    ::
+
+        >>> from supriya.realtime import Server
+        >>> from supriya.realtime.fakes import FakeScsynth
+        >>> with FakeScsynth() as fake:
+        ...     server = Server().connect(port=fake.port)
+        ...     report = recording.replay(server, speed=None)
+        ...     _ = server.disconnect()
+        ...
+        >>> report.sent_count, report.matched_count, report.mismatched_count
+        (1, 1, 0)
+
+    """
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_address(datagram):
+        if datagram.startswith(BUNDLE_PREFIX):
+            return None
+        return datagram[: datagram.find(b"\x00")].decode("ascii", "replace")
+
+    @classmethod
+    def _get_replies(cls, recording, ignored_addresses):
+        return [
+            (timestamp, datagram)
+            for timestamp, label, datagram in tuple(recording._entries)
+            if label == "R" and cls._get_address(datagram) not in ignored_addresses
+        ]
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a recording saved to ``path``.
+        """
+        data = pathlib.Path(path).read_bytes()
+        if not data.startswith(_HEADER):
+            raise ValueError("Not an OSC recording: {}".format(path))
+        recording = cls(None)
+        offset = len(_HEADER)
+        while offset < len(data):
+            timestamp, label, length = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            datagram = data[offset : offset + length]
+            if len(datagram) != length:
+                raise ValueError("Truncated OSC recording: {}".format(path))
+            offset += length
+            recording._entries.append((timestamp, label.decode("ascii"), datagram))
+            recording.byte_count += length
+        return recording
+
+    def replay(
+        self, target, *, speed=1.0, timeout=1.0, ignored_addresses=("/status.reply",)
+    ):
+        """
+        Replay recorded outgoing datagrams through ``target``.
+
+        ``target`` is a threaded OSC protocol, or a server. Datagrams are
+        sent at their recorded pace scaled by ``speed``, or as fast as
+        possible if ``speed`` is ``None``. Replay then waits up to
+        ``timeout`` seconds for outstanding replies. Replies whose address
+        is in ``ignored_addresses``, such as healthcheck status replies
+        whose contents always vary, aren't compared.
+        """
+        osc_protocol = getattr(target, "osc_protocol", target)
+        ignored_addresses = frozenset(ignored_addresses or ())
+        sent, expected, cause_index = [], [], None
+        for timestamp, label, datagram in tuple(self._entries):
+            if label == "S":
+                cause_index = len(sent)
+                sent.append((timestamp, datagram))
+            elif self._get_address(datagram) not in ignored_addresses:
+                expected.append((cause_index, datagram))
+        send_times = []
+        with Recording(osc_protocol) as replayed:
+            start_time = time.monotonic()
+            for timestamp, datagram in sent:
+                if speed:
+                    delay = (timestamp - sent[0][0]) / speed
+                    delay -= time.monotonic() - start_time
+                    if delay > 0:
+                        time.sleep(delay)
+                # Replies can be recorded before send_raw() returns.
+                send_times.append(time.monotonic())
+                osc_protocol.send_raw(datagram)
+            duration = time.monotonic() - start_time
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline:
+                replies = self._get_replies(replayed, ignored_addresses)
+                if len(replies) >= len(expected):
+                    break
+                time.sleep(0.01)
+        replies = self._get_replies(replayed, ignored_addresses)
+        received = collections.defaultdict(collections.deque)
+        for timestamp, datagram in replies:
+            received[datagram].append(timestamp)
+        latencies, missing = [], []
+        for cause_index, datagram in expected:
+            if not received[datagram]:
+                missing.append(datagram)
+                continue
+            timestamp = received[datagram].popleft()
+            if cause_index is not None:
+                # A reply recorded after some later send may now beat it, and
+                # so was caused by the last send before it at the latest.
+                cause_index = min(
+                    cause_index, bisect.bisect(send_times, timestamp) - 1
+                )
+                latencies.append(timestamp - send_times[max(cause_index, 0)])
+        return ReplayReport(
+            duration=duration,
+            sent_count=len(sent),
+            sent_bytes=sum(len(x[1]) for x in sent),
+            received_count=len(replies),
+            matched_count=len(expected) - len(missing),
+            latencies=latencies,
+            missing=missing,
+            unexpected=[
+                datagram
+                for datagram, timestamps in received.items()
+                for _ in timestamps
+            ],
+        )
+
+    def save(self, path):
+        """
+        Save the recording to ``path``.
+        """
+        parts = [_HEADER]
+        for timestamp, label, datagram in tuple(self._entries):
+            parts.append(_ENTRY.pack(timestamp, label.encode("ascii"), len(datagram)))
+            parts.append(bytes(datagram))
+        pathlib.Path(path).write_bytes(b"".join(parts))
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_bounded(self):
+        # Always keep raw datagrams, whether or not budgets are set.
+        return True
@@ -2,8 +2,6 @@ import itertools
 import time
 from queue import PriorityQueue
 
-from uqbar.objects import new
-
 import supriya.commands
 import supriya.realtime
 import supriya.system
@@ -64,16 +62,17 @@ class RealtimeEventPlayer(EventPlayer):
             node_free_ids = sorted(node_free_ids)
             request = supriya.commands.NodeFreeRequest(node_ids=node_free_ids)
             requests.append(request)
+        if communicate:
+            for bundle in supriya.commands.RequestBundle.partition(
+                requests,
+                timestamp=scheduled_time + self._server.latency,
+                maximum_packet_size=self._server.osc_protocol.maximum_packet_size,
+            ):
+                self._server.send(bundle.to_osc())
+            return delta
         consolidated_bundle = supriya.commands.RequestBundle(
             timestamp=scheduled_time, contents=requests
         )
-        if communicate:
-            osc_bundle = consolidated_bundle.to_osc()
-            osc_bundle = new(
-                osc_bundle, timestamp=osc_bundle.timestamp + self._server.latency
-            )
-            self._server.send(osc_bundle)
-            return delta
         return consolidated_bundle, delta
 
     ### PRIVATE METHODS ###
@@ -168,4 +167,8 @@ class RealtimeEventPlayer(EventPlayer):
         self._iterator = None
         bundle = self._collect_stop_requests()
         if bundle and self._server.is_running:
-            self._server.send(bundle.to_osc())
+            for request_bundle in supriya.commands.RequestBundle.partition(
+                bundle.contents,
+                maximum_packet_size=self._server.osc_protocol.maximum_packet_size,
+            ):
+                self._server.send(request_bundle.to_osc())
@@ -28,6 +28,7 @@ from supriya import commands, nonrealtime, realtime
 from supriya.assets.synthdefs.default import default
 from supriya.enums import AddAction, CalculationRate, ParameterRate
 from supriya.nonrealtime import Session
+from supriya.osc.messages import BUNDLE_PREFIX
 from supriya.realtime import AsyncServer, BaseServer, Server
 from supriya.synthdefs import SynthDef
 
@@ -350,12 +351,14 @@ class ProviderMoment:
         timestamp, request_bundle, synthdefs = results
         server = self.provider.server
         # The underlying asyncio UDP transport will silently drop oversize packets
-        if len(request_bundle.to_datagram()) <= 8192:
+        maximum_packet_size = server.osc_protocol.maximum_packet_size
+        osc_bundle = self._to_single_osc_bundle(request_bundle, maximum_packet_size)
+        if osc_bundle is not None:
             if self.wait:
                 # If waiting, the original ProviderMoment timestamp can be ignored
                 await request_bundle.communicate_async(server=server, sync=True)
             else:
-                server.send(request_bundle.to_osc())
+                server.send(osc_bundle)
         else:
             # If over the UDP packet limit, partition the message
             requests = request_bundle.contents
@@ -367,11 +370,15 @@ class ProviderMoment:
                 await synthdef_request.communicate_async(sync=True, server=server)
             if self.wait:
                 # If waiting, the original ProviderMoment timestamp can be ignored
-                for bundle in commands.RequestBundle.partition(requests):
+                for bundle in commands.RequestBundle.partition(
+                    requests, maximum_packet_size=maximum_packet_size
+                ):
                     await bundle.communicate_async(server=server, sync=True)
             else:
                 for bundle in commands.RequestBundle.partition(
-                    requests, timestamp=timestamp
+                    requests,
+                    timestamp=timestamp,
+                    maximum_packet_size=maximum_packet_size,
                 ):
                     server.send(bundle.to_osc())
 
@@ -387,19 +394,22 @@ class ProviderMoment:
         if not results:
             return
         timestamp, request_bundle, synthdefs = results
-        try:
-            self.provider.server.send(request_bundle.to_osc())
-        except OSError:
-            requests = request_bundle.contents
-            if synthdefs:
-                synthdef_request = requests[0]
-                requests = synthdef_request.callback.contents or []
-                synthdef_request = new(synthdef_request, callback=None)
-                synthdef_request.communicate(sync=True, server=self.provider.server)
-            for bundle in commands.RequestBundle.partition(
-                requests, timestamp=timestamp
-            ):
-                self.provider.server.send(bundle.to_osc())
+        server = self.provider.server
+        maximum_packet_size = server.osc_protocol.maximum_packet_size
+        osc_bundle = self._to_single_osc_bundle(request_bundle, maximum_packet_size)
+        if osc_bundle is not None:
+            server.send(osc_bundle)
+            return
+        requests = request_bundle.contents
+        if synthdefs:
+            synthdef_request = requests[0]
+            requests = synthdef_request.callback.contents or []
+            synthdef_request = new(synthdef_request, callback=None)
+            synthdef_request.communicate(sync=True, server=server)
+        for bundle in commands.RequestBundle.partition(
+            requests, timestamp=timestamp, maximum_packet_size=maximum_packet_size
+        ):
+            server.send(bundle.to_osc())
 
     def _enter(self):
         self.provider._moments.append(self)
@@ -461,7 +471,11 @@ class ProviderMoment:
                 ],
             )
             # check bundle size, write synthdefs to disk and do /d_load
-            if len(request_bundle.to_datagram(with_placeholders=True)) > 8192:
+            maximum_packet_size = self.provider.server.osc_protocol.maximum_packet_size
+            if (
+                len(request_bundle.to_datagram(with_placeholders=True))
+                > maximum_packet_size
+            ):
                 directory_path = pathlib.Path(tempfile.mkdtemp())
                 # directory_path = pathlib.Path("~/Desktop").expanduser()
                 for synthdef in synthdefs:
@@ -488,6 +502,23 @@ class ProviderMoment:
             synthdef._register_with_local_server(server=self.provider.server)
         return timestamp, request_bundle, synthdefs
 
+    def _to_single_osc_bundle(self, request_bundle, maximum_packet_size):
+        # Returns the moment's OSC bundle, encoded once, if it fits in a packet.
+        bundles = commands.RequestBundle.partition(
+            request_bundle.contents,
+            timestamp=request_bundle.timestamp,
+            maximum_packet_size=maximum_packet_size,
+        )
+        if len(bundles) != 1:
+            return None
+        # A lone request can overflow a packet by itself, so check the size
+        # of the datagrams the partition already encoded.
+        datagrams = bundles[0]._datagrams[1]
+        size = len(BUNDLE_PREFIX) + 8 + sum(4 + len(x) for x in datagrams)
+        if size > maximum_packet_size:
+            return None
+        return bundles[0].to_osc()
+
 
 class Provider(metaclass=abc.ABCMeta):
     """
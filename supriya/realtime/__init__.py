@@ -12,6 +12,7 @@ from .buses import (
     BusGroup,
     BusProxy,
 )
+from .flowcontrol import FlowControl, FlowStatistics
 from .interfaces import (
     ControlInterface,
     GroupControl,
@@ -38,6 +39,8 @@ __all__ = [
     "BusGroup",
     "BusProxy",
     "ControlInterface",
+    "FlowControl",
+    "FlowStatistics",
     "Group",
     "GroupControl",
     "GroupInterface",
@@ -0,0 +1,642 @@
+"""
+An in-process stand-in for scsynth, for load and latency testing.
+"""
+import heapq
+import itertools
+import logging
+import random
+import select
+import socket
+import struct
+import threading
+import time
+
+from supriya.enums import AddAction, RequestId
+from supriya.osc.messages import BUNDLE_PREFIX, OscBundle, OscMessage
+
+logger = logging.getLogger("supriya.fake")
+
+
+class _FakeNode:
+
+    __slots__ = (
+        "controls",
+        "head",
+        "next",
+        "node_id",
+        "parent",
+        "previous",
+        "synthdef",
+        "tail",
+    )
+
+    def __init__(self, node_id, synthdef=None):
+        self.controls = list(synthdef.defaults) if synthdef is not None else None
+        self.head = None
+        self.next = None
+        self.node_id = node_id
+        self.parent = None
+        self.previous = None
+        self.synthdef = synthdef
+        self.tail = None
+
+    @property
+    def is_group(self):
+        return self.synthdef is None
+
+
+class _FakeSynthDef:
+
+    __slots__ = ("defaults", "name", "names", "ugen_count")
+
+    def __init__(self, name, defaults, names, ugen_count):
+        self.defaults = defaults
+        self.name = name
+        self.names = names
+        self.ugen_count = ugen_count
+
+
+def _parse_synthdefs(data):
+    """
+    Parse the names, parameters and UGen counts out of compiled SynthDefs.
+
+    Only enough of each graph is walked to count its UGens; variants and
+    UGen inputs are skipped rather than decoded.
+    """
+
+    def unpack(format_):
+        nonlocal offset
+        values = struct.unpack_from(format_, data, offset)
+        offset += struct.calcsize(format_)
+        return values[0] if len(values) == 1 else values
+
+    def unpack_pstring():
+        nonlocal offset
+        length = data[offset]
+        value = data[offset + 1 : offset + 1 + length].decode("ascii")
+        offset += 1 + length
+        return value
+
+    offset = 0
+    if data[:4] != b"SCgf":
+        raise ValueError("Not a compiled SynthDef")
+    offset = 4
+    version = unpack(">i")
+    count = unpack(">h")
+    index_format = ">i" if version >= 2 else ">h"
+    synthdefs = []
+    for _ in range(count):
+        name = unpack_pstring()
+        constant_count = unpack(index_format)
+        offset += constant_count * 4
+        parameter_count = unpack(index_format)
+        defaults = list(unpack(f">{parameter_count}f")) if parameter_count else []
+        names = {}
+        for _ in range(unpack(index_format)):
+            parameter_name = unpack_pstring()
+            names[parameter_name] = unpack(index_format)
+        ugen_count = unpack(index_format)
+        for _ in range(ugen_count):
+            unpack_pstring()
+            offset += 1  # calculation rate
+            input_count = unpack(index_format)
+            output_count = unpack(index_format)
+            offset += 2  # special index
+            offset += input_count * struct.calcsize(index_format) * 2
+            offset += output_count
+        variant_count = unpack(">h")
+        for _ in range(variant_count):
+            unpack_pstring()
+            offset += parameter_count * 4
+        synthdefs.append(_FakeSynthDef(name, defaults, names, ugen_count))
+    return synthdefs
+
+
+class FakeScsynth:
+    """
+    A pure-Python stand-in for scsynth.
+
+    Runs a UDP server on a background thread, speaking the subset of the
+    scsynth OSC protocol supriya's realtime machinery relies on: ``/notify``,
+    ``/g_new``, ``/s_new``, ``/n_set``, ``/n_free``, ``/n_query``, ``/sync``,
+    ``/d_recv``, ``/b_alloc``, ``/b_free``, ``/b_query``, ``/c_set``,
+    ``/c_get``, ``/g_queryTree``, ``/status`` and ``/quit``. It keeps a real
+    node tree, emits ``/n_go`` and ``/n_end`` notifications to notified
+    clients, replies with ``/done``, ``/synced`` and ``/fail`` as scsynth
+    would, and executes completion messages and timestamped bundles.
+
+    ``latency`` (plus up to ``jitter``) seconds of delay is added to every
+    reply, and ``packet_loss`` is the probability of silently dropping each
+    incoming or outgoing packet.
+
+    ::
+
+        >>> import supriya
+        >>> from supriya.realtime.fakes import FakeScsynth
+        >>> with FakeScsynth() as fake:
+        ...     server = supriya.Server().connect(port=fake.port)
+        ...     synth = supriya.Synth(amplitude=0.25).allocate(target_node=server)
+        ...     print(fake.query_tree())
+        ...     _ = server.disconnect()
+        ...
+        NODE TREE 0 group
+            1 group
+                1000 default
+                    out: 0.0, amplitude: 0.25, frequency: 440.0, gate: 1.0, pan: 0.5
+
+    """
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        ip_address="127.0.0.1",
+        port=0,
+        latency=0.0,
+        jitter=0.0,
+        packet_loss=0.0,
+        maximum_logins=1,
+        sample_rate=44100.0,
+        seed=None,
+    ):
+        self.ip_address = ip_address
+        self.jitter = jitter
+        self.latency = latency
+        self.maximum_logins = maximum_logins
+        self.packet_loss = packet_loss
+        self.requested_port = port
+        self.sample_rate = sample_rate
+        self.dropped_count = 0
+        self.received_count = 0
+        self.sent_count = 0
+        self._clients = {}
+        self._lock = threading.RLock()
+        self._random = random.Random(seed)
+        self._scheduled = []
+        self._sequence = itertools.count()
+        self._socket = None
+        self._thread = None
+        self._reset()
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    ### PRIVATE METHODS ###
+
+    def _reset(self):
+        self._auto_node_id = 0
+        self._buffers = {}
+        self._clients.clear()
+        self._control_buses = {}
+        self._nodes = {0: _FakeNode(0)}
+        self._scheduled[:] = []
+        self._synthdefs = {}
+
+    def _add_node(self, node, add_action, target):
+        if add_action == AddAction.REPLACE:
+            if target.node_id == 0:
+                raise ValueError("Cannot replace the root node")
+            parent, previous, next_ = target.parent, target.previous, target.next
+            target.parent = target.previous = target.next = None
+            self._link(node, parent, previous, next_)
+            self._free_node(target)
+        elif add_action in (AddAction.ADD_TO_HEAD, AddAction.ADD_TO_TAIL):
+            if not target.is_group:
+                raise ValueError(f"Node {target.node_id} is not a group")
+            if add_action == AddAction.ADD_TO_HEAD:
+                self._link(node, target, None, target.head)
+            else:
+                self._link(node, target, target.tail, None)
+        elif add_action in (AddAction.ADD_BEFORE, AddAction.ADD_AFTER):
+            if target.parent is None:
+                raise ValueError("Cannot add before or after the root node")
+            if add_action == AddAction.ADD_BEFORE:
+                self._link(node, target.parent, target.previous, target)
+            else:
+                self._link(node, target.parent, target, target.next)
+        else:
+            raise ValueError(f"Invalid add action {add_action}")
+        self._nodes[node.node_id] = node
+        self._notify("/n_go", *self._get_node_info(node))
+
+    def _execute(self, message, address):
+        if isinstance(message, OscBundle):
+            for x in message.contents:
+                self._execute(x, address)
+            return
+        if isinstance(message, (bytes, bytearray)):
+            return
+        command = message.address
+        if isinstance(command, int):
+            command = RequestId(command).request_name.value
+        handler = self._handlers.get(command)
+        if handler is None:
+            logger.warning(f"Command not found: {command}")
+            return
+        try:
+            handler(self, message.contents, address)
+        except Exception as exception:
+            self._send(address, "/fail", command, str(exception))
+
+    def _execute_completion(self, contents, index, address):
+        if len(contents) > index and not isinstance(contents[index], bytes):
+            self._execute(contents[index], address)
+
+    def _free_node(self, node):
+        # Like scsynth, report a node's end from its place in the tree, ahead
+        # of any children.
+        self._notify("/n_end", *self._get_node_info(node))
+        if node.is_group:
+            self._free_children(node)
+        self._unlink(node)
+        self._nodes.pop(node.node_id, None)
+
+    def _free_children(self, group):
+        child = group.head
+        while child is not None:
+            next_ = child.next
+            self._free_node(child)
+            child = next_
+
+    def _get_node(self, node_id, group=False):
+        node = self._nodes.get(int(node_id))
+        if node is None:
+            raise ValueError(f"Node {node_id} not found")
+        if group and not node.is_group:
+            raise ValueError(f"Node {node_id} is not a group")
+        return node
+
+    def _get_node_info(self, node):
+        info = [
+            node.node_id,
+            node.parent.node_id if node.parent is not None else -1,
+            node.previous.node_id if node.previous is not None else -1,
+            node.next.node_id if node.next is not None else -1,
+            int(node.is_group),
+        ]
+        if node.is_group:
+            info.append(node.head.node_id if node.head is not None else -1)
+            info.append(node.tail.node_id if node.tail is not None else -1)
+        return info
+
+    def _get_new_node_id(self, node_id):
+        node_id = int(node_id)
+        if node_id < 0:
+            self._auto_node_id -= 1
+            while self._auto_node_id in self._nodes:
+                self._auto_node_id -= 1
+            return self._auto_node_id
+        if node_id in self._nodes:
+            raise ValueError(f"duplicate node ID {node_id}")
+        return node_id
+
+    def _link(self, node, parent, previous, next_):
+        node.parent, node.previous, node.next = parent, previous, next_
+        if previous is not None:
+            previous.next = node
+        else:
+            parent.head = node
+        if next_ is not None:
+            next_.previous = node
+        else:
+            parent.tail = node
+
+    def _notify(self, *contents):
+        if not self._clients:
+            return
+        datagram = OscMessage(*contents).to_datagram()
+        for address in self._clients:
+            self._send_datagram(address, datagram)
+
+    def _query_tree(self, node, controls, result):
+        result.append(node.node_id)
+        if node.is_group:
+            children = []
+            child = node.head
+            while child is not None:
+                children.append(child)
+                child = child.next
+            result.append(len(children))
+            for child in children:
+                self._query_tree(child, controls, result)
+            return
+        result.append(-1)
+        result.append(node.synthdef.name)
+        if controls:
+            names = {index: name for name, index in node.synthdef.names.items()}
+            result.append(len(node.controls))
+            for index, value in enumerate(node.controls):
+                result.append(names.get(index, index))
+                result.append(value)
+
+    def _run(self):
+        buffer = bytearray(65536)
+        while self._socket is not None:
+            timeout = 0.1
+            with self._lock:
+                now = time.monotonic()
+                while self._scheduled and self._scheduled[0][0] <= now:
+                    _, _, action, arguments = heapq.heappop(self._scheduled)
+                    action(*arguments)
+                if self._scheduled:
+                    timeout = min(timeout, max(self._scheduled[0][0] - now, 0))
+            sock = self._socket
+            if sock is None:
+                return
+            try:
+                if not select.select([sock], [], [], timeout)[0]:
+                    continue
+                size, address = sock.recvfrom_into(buffer)
+            except (OSError, ValueError):
+                return
+            self.received_count += 1
+            if self.packet_loss and self._random.random() < self.packet_loss:
+                self.dropped_count += 1
+                continue
+            datagram = bytes(buffer[:size])
+            try:
+                if datagram.startswith(BUNDLE_PREFIX):
+                    message = OscBundle.from_datagram(datagram)
+                else:
+                    message = OscMessage.from_datagram(datagram)
+            except Exception:
+                logger.exception("Failed to decode datagram")
+                continue
+            with self._lock:
+                if isinstance(message, OscBundle) and message.timestamp:
+                    delay = message.timestamp - time.time()
+                    if delay > 0:
+                        self._schedule(delay, self._execute, message, address)
+                        continue
+                self._execute(message, address)
+
+    def _schedule(self, delay, action, *arguments):
+        heapq.heappush(
+            self._scheduled,
+            (time.monotonic() + delay, next(self._sequence), action, arguments),
+        )
+
+    def _send(self, address, *contents):
+        self._send_datagram(address, OscMessage(*contents).to_datagram())
+
+    def _send_datagram(self, address, datagram):
+        if self.packet_loss and self._random.random() < self.packet_loss:
+            self.dropped_count += 1
+            return
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(0, self.jitter)
+        if delay > 0:
+            self._schedule(delay, self._sendto, address, datagram)
+        else:
+            self._sendto(address, datagram)
+
+    def _sendto(self, address, datagram):
+        if self._socket is None:
+            return
+        try:
+            self._socket.sendto(datagram, address)
+            self.sent_count += 1
+        except OSError:
+            logger.exception("Failed to send datagram")
+
+    def _set_controls(self, node, contents):
+        contents = list(contents)
+        for i in range(0, len(contents) - 1, 2):
+            key, value = contents[i], contents[i + 1]
+            if isinstance(key, str):
+                if key not in node.synthdef.names:
+                    continue
+                key = node.synthdef.names[key]
+            values = value if isinstance(value, list) else [value]
+            for offset, value in enumerate(values):
+                if 0 <= key + offset < len(node.controls):
+                    node.controls[key + offset] = value
+
+    def _unlink(self, node):
+        parent = node.parent
+        if parent is None:
+            return
+        if node.previous is not None:
+            node.previous.next = node.next
+        elif parent.head is node:
+            parent.head = node.next
+        if node.next is not None:
+            node.next.previous = node.previous
+        elif parent.tail is node:
+            parent.tail = node.previous
+        node.parent = node.previous = node.next = None
+
+    ### HANDLERS ###
+
+    def _handle_b_alloc(self, contents, address):
+        buffer_id, frame_count = int(contents[0]), int(contents[1])
+        channel_count = int(contents[2]) if len(contents) > 2 else 1
+        self._buffers[buffer_id] = (frame_count, channel_count)
+        self._execute_completion(contents, 3, address)
+        self._send(address, "/done", "/b_alloc", buffer_id)
+
+    def _handle_b_free(self, contents, address):
+        buffer_id = int(contents[0])
+        self._buffers.pop(buffer_id, None)
+        self._execute_completion(contents, 1, address)
+        self._send(address, "/done", "/b_free", buffer_id)
+
+    def _handle_b_query(self, contents, address):
+        info = []
+        for buffer_id in contents:
+            frame_count, channel_count = self._buffers.get(int(buffer_id), (0, 0))
+            sample_rate = self.sample_rate if frame_count else 0.0
+            info.extend([int(buffer_id), frame_count, channel_count, sample_rate])
+        self._send(address, "/b_info", *info)
+
+    def _handle_c_get(self, contents, address):
+        values = []
+        for index in contents:
+            values.extend([int(index), self._control_buses.get(int(index), 0.0)])
+        self._send(address, "/c_set", *values)
+
+    def _handle_c_set(self, contents, address):
+        for i in range(0, len(contents) - 1, 2):
+            self._control_buses[int(contents[i])] = float(contents[i + 1])
+
+    def _handle_d_recv(self, contents, address):
+        for synthdef in _parse_synthdefs(bytes(contents[0])):
+            self._synthdefs[synthdef.name] = synthdef
+        self._execute_completion(contents, 1, address)
+        self._send(address, "/done", "/d_recv")
+
+    def _handle_g_new(self, contents, address):
+        for i in range(0, len(contents) - 2, 3):
+            node_id = self._get_new_node_id(contents[i])
+            target = self._get_node(contents[i + 2])
+            self._add_node(_FakeNode(node_id), int(contents[i + 1]), target)
+
+    def _handle_g_query_tree(self, contents, address):
+        for i in range(0, len(contents), 2):
+            node = self._get_node(contents[i], group=True)
+            controls = bool(contents[i + 1]) if i + 1 < len(contents) else False
+            result = [int(controls)]
+            self._query_tree(node, controls, result)
+            self._send(address, "/g_queryTree.reply", *result)
+
+    def _handle_n_free(self, contents, address):
+        for node_id in contents:
+            node = self._nodes.get(int(node_id))
+            if node is None:
+                self._send(address, "/fail", "/n_free", f"Node {node_id} not found")
+                continue
+            self._free_node(node)
+
+    def _handle_n_query(self, contents, address):
+        for node_id in contents:
+            self._send(address, "/n_info", *self._get_node_info(self._get_node(node_id)))
+
+    def _handle_n_set(self, contents, address):
+        node = self._get_node(contents[0])
+        if node.is_group:
+            stack = [node]
+            while stack:
+                child = stack.pop().head
+                while child is not None:
+                    if child.is_group:
+                        stack.append(child)
+                    else:
+                        self._set_controls(child, contents[1:])
+                    child = child.next
+        else:
+            self._set_controls(node, contents[1:])
+
+    def _handle_notify(self, contents, address):
+        if contents and contents[0]:
+            if address not in self._clients:
+                client_ids = set(self._clients.values())
+                free_ids = [
+                    x for x in range(self.maximum_logins) if x not in client_ids
+                ]
+                if not free_ids:
+                    self._send(address, "/fail", "/notify", "too many users")
+                    return
+                self._clients[address] = free_ids[0]
+            client_id = self._clients[address]
+            self._send(address, "/done", "/notify", client_id, self.maximum_logins)
+        else:
+            client_id = self._clients.pop(address, 0)
+            self._send(address, "/done", "/notify", client_id)
+
+    def _handle_quit(self, contents, address):
+        self._send(address, "/done", "/quit")
+        self._schedule(self.latency + self.jitter, self._close)
+
+    def _handle_s_new(self, contents, address):
+        synthdef = self._synthdefs.get(contents[0])
+        if synthdef is None:
+            raise ValueError(f"SynthDef {contents[0]} not found")
+        node_id = self._get_new_node_id(contents[1])
+        add_action = int(contents[2]) if len(contents) > 2 else 0
+        target = self._get_node(contents[3] if len(contents) > 3 else 0)
+        node = _FakeNode(node_id, synthdef)
+        self._set_controls(node, contents[4:])
+        self._add_node(node, add_action, target)
+
+    def _handle_status(self, contents, address):
+        synth_count = group_count = ugen_count = 0
+        for node in self._nodes.values():
+            if node.is_group:
+                group_count += 1
+            else:
+                synth_count += 1
+                ugen_count += node.synthdef.ugen_count
+        self._send(
+            address,
+            "/status.reply",
+            1,
+            ugen_count,
+            synth_count,
+            group_count,
+            len(self._synthdefs),
+            0.0,
+            0.0,
+            self.sample_rate,
+            self.sample_rate,
+        )
+
+    def _handle_sync(self, contents, address):
+        self._send(address, "/synced", *contents[:1])
+
+    _handlers = {
+        "/b_alloc": _handle_b_alloc,
+        "/b_free": _handle_b_free,
+        "/b_query": _handle_b_query,
+        "/c_get": _handle_c_get,
+        "/c_set": _handle_c_set,
+        "/d_recv": _handle_d_recv,
+        "/g_new": _handle_g_new,
+        "/g_queryTree": _handle_g_query_tree,
+        "/n_free": _handle_n_free,
+        "/n_query": _handle_n_query,
+        "/n_set": _handle_n_set,
+        "/notify": _handle_notify,
+        "/quit": _handle_quit,
+        "/s_new": _handle_s_new,
+        "/status": _handle_status,
+        "/sync": _handle_sync,
+    }
+
+    def _close(self):
+        sock, self._socket = self._socket, None
+        if sock is not None:
+            sock.close()
+
+    ### PUBLIC METHODS ###
+
+    def query_tree(self, include_controls=True):
+        """
+        Query the fake server's node tree, without going over the network.
+        """
+        from supriya.commands import QueryTreeResponse
+
+        with self._lock:
+            result = [int(include_controls)]
+            self._query_tree(self._nodes[0], include_controls, result)
+        message = OscMessage("/g_queryTree.reply", *result)
+        return QueryTreeResponse.from_osc_message(message).query_tree_group
+
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._reset()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((self.ip_address, self.requested_port))
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        thread, self._thread = self._thread, None
+        with self._lock:
+            self._close()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def is_running(self):
+        return self._socket is not None
+
+    @property
+    def node_count(self):
+        return len(self._nodes)
+
+    @property
+    def port(self):
+        if self._socket is None:
+            return None
+        return self._socket.getsockname()[1]
@@ -0,0 +1,292 @@
+import collections
+import dataclasses
+import logging
+import threading
+import time
+
+from supriya.osc.messages import OscBundle, OscMessage
+from supriya.osc.protocols import BaseAsyncOscProtocol
+from supriya.system import SupriyaObject
+
+logger = logging.getLogger("supriya.server")
+
+
+@dataclasses.dataclass
+class FlowStatistics:
+    sent_count: int = 0
+    sent_bytes: int = 0
+    acknowledged_bytes: int = 0
+    fence_count: int = 0
+    dropped_count: int = 0
+    late_count: int = 0
+    stall_count: int = 0
+    stall_time: float = 0.0
+    throttle_count: int = 0
+    throttle_time: float = 0.0
+    overrun_count: int = 0
+    last_rtt: float = None
+    smoothed_rtt: float = None
+    minimum_rtt: float = None
+    maximum_rtt: float = None
+
+
+class FlowControl(SupriyaObject):
+    """
+    Flow control for a server's outgoing OSC traffic.
+
+    UDP gives no back-pressure: once scsynth's receive buffer fills, further
+    datagrams are dropped silently. Flow control bounds how far the client
+    can run ahead of the server. Every ``fence_interval`` bytes a ``/sync``
+    fence is sent, and bytes sent before a fence count as outstanding until
+    its ``/synced`` reply arrives. Sends which would take outstanding bytes
+    past ``maximum_outstanding_bytes`` wait for replies, and an optional
+    token bucket caps the send ``rate`` in bytes per second, allowing bursts
+    of up to ``burst`` bytes, by default ``maximum_outstanding_bytes``.
+
+    Fence replies measure round-trip time. Replies slower than
+    ``late_threshold`` seconds count as late, and fences unanswered after
+    ``timeout`` seconds count as dropped, likely lost along with the
+    traffic ahead of them, and release their bytes.
+
+    Waiting is only possible with threaded servers, and never on their
+    dispatch threads, which deliver the very replies being waited on. Async
+    servers can't block their event loop either. Sends which can't wait count
+    and warn about overruns instead.
+
+    ::
+
+        >>> flow_control = supriya.realtime.FlowControl(
+        ...     maximum_outstanding_bytes=32768, fence_interval=4096, rate=2 ** 20,
+        ... )
+        >>> flow_control.outstanding_bytes
+        0
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "Server Internals"
+
+    __slots__ = (
+        "_acknowledged_bytes",
+        "_callback",
+        "_condition",
+        "_fenced_bytes",
+        "_fences",
+        "_osc_protocol",
+        "_tokens",
+        "_tokens_time",
+        "burst",
+        "fence_interval",
+        "late_threshold",
+        "maximum_outstanding_bytes",
+        "rate",
+        "statistics",
+        "timeout",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        *,
+        maximum_outstanding_bytes=65536,
+        fence_interval=8192,
+        rate=None,
+        burst=None,
+        late_threshold=0.1,
+        timeout=1.0,
+    ):
+        self.maximum_outstanding_bytes = int(maximum_outstanding_bytes)
+        self.fence_interval = int(fence_interval)
+        self.rate = float(rate) if rate else None
+        self.burst = int(burst) if burst else None
+        self.late_threshold = float(late_threshold)
+        self.timeout = float(timeout)
+        self.statistics = FlowStatistics()
+        self._condition = threading.Condition()
+        self._callback = None
+        self._osc_protocol = None
+        self._reset()
+
+    ### PRIVATE METHODS ###
+
+    def _acknowledge(self, fenced_bytes):
+        if fenced_bytes > self._acknowledged_bytes:
+            delta = fenced_bytes - self._acknowledged_bytes
+            self.statistics.acknowledged_bytes += delta
+            self._acknowledged_bytes = fenced_bytes
+
+    def _attach(self, server):
+        osc_protocol = server.osc_protocol
+        if osc_protocol is self._osc_protocol:
+            return
+        if self._osc_protocol is not None:
+            self._osc_protocol.unregister(self._callback)
+        self._reset()
+        self._osc_protocol = osc_protocol
+        self._callback = osc_protocol.register(
+            pattern=["/synced"], procedure=self._handle_synced
+        )
+
+    def _can_wait(self):
+        if isinstance(self._osc_protocol, BaseAsyncOscProtocol):
+            return False
+        worker_threads = getattr(self._osc_protocol, "worker_threads", ())
+        return threading.current_thread() not in worker_threads
+
+    def _detach(self):
+        with self._condition:
+            if self._osc_protocol is not None:
+                self._osc_protocol.unregister(self._callback)
+            self._osc_protocol = self._callback = None
+            self._reset()
+            self._condition.notify_all()
+
+    def _expire_fences(self, now):
+        while self._fences:
+            sync_id, (sent_time, fenced_bytes) = next(iter(self._fences.items()))
+            if now - sent_time < self.timeout:
+                break
+            del self._fences[sync_id]
+            self.statistics.dropped_count += 1
+            logger.warning(
+                "Flow control fence {} unanswered after {}s".format(
+                    sync_id, self.timeout
+                )
+            )
+            self._acknowledge(fenced_bytes)
+
+    def _handle_synced(self, message):
+        now = time.monotonic()
+        with self._condition:
+            sync_id = message.contents[0] if message.contents else None
+            if sync_id not in self._fences:
+                return
+            # Fences are answered in order, so any earlier fence was lost.
+            while self._fences:
+                fence_id, (sent_time, fenced_bytes) = self._fences.popitem(last=False)
+                if fence_id == sync_id:
+                    break
+                self.statistics.dropped_count += 1
+            self._acknowledge(fenced_bytes)
+            self._record_rtt(now - sent_time)
+            self._condition.notify_all()
+
+    def _record_rtt(self, rtt):
+        statistics = self.statistics
+        statistics.last_rtt = rtt
+        if statistics.smoothed_rtt is None:
+            statistics.smoothed_rtt = statistics.minimum_rtt = rtt
+            statistics.maximum_rtt = rtt
+        else:
+            statistics.smoothed_rtt += (rtt - statistics.smoothed_rtt) / 8
+            statistics.minimum_rtt = min(statistics.minimum_rtt, rtt)
+            statistics.maximum_rtt = max(statistics.maximum_rtt, rtt)
+        if rtt > self.late_threshold:
+            statistics.late_count += 1
+
+    def _reset(self):
+        # Anything sent over a previous connection is written off.
+        self._acknowledged_bytes = self.statistics.sent_bytes
+        self._fenced_bytes = self.statistics.sent_bytes
+        self._fences = collections.OrderedDict()
+        self._tokens = None
+        self._tokens_time = time.monotonic()
+
+    def _send(self, server, message, datagram=None):
+        if datagram is None:
+            if isinstance(message, str):
+                message = OscMessage(message)
+            elif not isinstance(message, (OscBundle, OscMessage)):
+                message = OscMessage(*message)
+            datagram = message.to_datagram()
+        size = len(datagram)
+        with self._condition:
+            self._attach(server)
+            can_wait = self._can_wait()
+            if self.rate:
+                self._throttle(size, can_wait)
+            self._expire_fences(time.monotonic())
+            if self.outstanding_bytes and (
+                self.outstanding_bytes + size > self.maximum_outstanding_bytes
+            ):
+                self._stall(server, size, can_wait)
+            self._osc_protocol._send_encoded(message, datagram)
+            self.statistics.sent_count += 1
+            self.statistics.sent_bytes += size
+            if self.statistics.sent_bytes - self._fenced_bytes >= self.fence_interval:
+                self._send_fence(server)
+
+    def _send_fence(self, server):
+        from supriya.commands import SyncRequest
+
+        sync_id = server.next_sync_id
+        self._fenced_bytes = self.statistics.sent_bytes
+        self._fences[sync_id] = (time.monotonic(), self._fenced_bytes)
+        self.statistics.fence_count += 1
+        request = SyncRequest(sync_id=sync_id)
+        self._osc_protocol._send_encoded(request, request.to_datagram())
+
+    def _stall(self, server, size, can_wait):
+        if self.statistics.sent_bytes > self._fenced_bytes:
+            # Fence everything sent so far, so there's a reply to wait on.
+            self._send_fence(server)
+        if not can_wait:
+            self.statistics.overrun_count += 1
+            logger.warning(
+                "Flow control overrun: {} bytes outstanding".format(
+                    self.outstanding_bytes + size
+                )
+            )
+            return
+        self.statistics.stall_count += 1
+        start_time = time.monotonic()
+        while self.outstanding_bytes and (
+            self.outstanding_bytes + size > self.maximum_outstanding_bytes
+        ):
+            now = time.monotonic()
+            self._expire_fences(now)
+            if not self._fences:
+                break
+            sent_time = next(iter(self._fences.values()))[0]
+            self._condition.wait(max(0.0, sent_time + self.timeout - now))
+        self.statistics.stall_time += time.monotonic() - start_time
+
+    def _throttle(self, size, can_wait):
+        now = time.monotonic()
+        burst = self.burst or self.maximum_outstanding_bytes
+        if self._tokens is None:
+            self._tokens = burst
+        else:
+            self._tokens = min(
+                burst, self._tokens + (now - self._tokens_time) * self.rate
+            )
+        self._tokens_time = now
+        self._tokens -= size
+        if self._tokens >= 0:
+            return
+        delay = -self._tokens / self.rate
+        self.statistics.throttle_count += 1
+        self.statistics.throttle_time += delay
+        if not can_wait:
+            return
+        # Waiting on the condition releases it for fence replies, which may
+        # also wake it early.
+        deadline = now + delay
+        while now < deadline:
+            self._condition.wait(deadline - now)
+            now = time.monotonic()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def outstanding_bytes(self):
+        """
+        Bytes sent but not yet acknowledged by a fence reply.
+        """
+        return self.statistics.sent_bytes - self._acknowledged_bytes
+
+    @property
+    def pending_fence_count(self):
+        return len(self._fences)
@@ -101,11 +101,13 @@ class Node(ServerObject, UniqueTreeNode):
         else:
             request = requests[0]
         requests[:] = [request]
+        maximum_packet_size = server.osc_protocol.maximum_packet_size
         if synthdefs:
             synthdef_request = supriya.commands.SynthDefReceiveRequest(
                 synthdefs=synthdefs, callback=requests[0]
             )
-            if len(synthdef_request.to_datagram(with_placeholders=True)) > 8192:
+            datagram = synthdef_request.to_datagram(with_placeholders=True)
+            if len(datagram) > maximum_packet_size:
                 directory_path = pathlib.Path(tempfile.mkdtemp())
                 synthdef_request = supriya.commands.SynthDefLoadDirectoryRequest(
                     directory_path=directory_path, callback=requests[0]
@@ -115,7 +117,8 @@ class Node(ServerObject, UniqueTreeNode):
                     synthdef_path = directory_path / file_name
                     synthdef_path.write_bytes(synthdef.compile())
             requests[:] = [synthdef_request]
-            if len(requests[0].to_datagram(with_placeholders=True)) > 8192:
+            datagram = requests[0].to_datagram(with_placeholders=True)
+            if len(datagram) > maximum_packet_size:
                 node_allocate_request = requests[0].callback
                 synthdef_request = new(requests[0], callback=None)
                 requests[:] = [node_allocate_request, synthdef_request]
@@ -154,7 +157,9 @@ class Node(ServerObject, UniqueTreeNode):
     def _handle_response(self, response):
         import supriya.commands
 
-        if not isinstance(response, supriya.commands.NodeInfoResponse):
+        if not isinstance(
+            response, (supriya.commands.NodeInfo, supriya.commands.NodeInfoResponse)
+        ):
             return
         if response.action == NodeAction.NODE_REMOVED:
             self._set_parent(None)
@@ -215,6 +220,43 @@ class Node(ServerObject, UniqueTreeNode):
             target_node._set_parent(None)
             target_node._unregister_with_local_server()
 
+    @staticmethod
+    def _move_nodes(moves):
+        """
+        Apply ``(target_node, add_action, node)`` moves in order.
+
+        Nodes already sitting where a move would put them, as when allocating
+        a tree built up before allocation, are left in place rather than
+        detached and reattached. Child indices are cached per parent, and
+        only invalidated by moves which actually happen.
+        """
+        indices = {}
+        for target_node, add_action, node in moves:
+            if add_action in (AddAction.ADD_TO_HEAD, AddAction.ADD_TO_TAIL):
+                parent_node = target_node
+            else:
+                parent_node = target_node._parent
+            if node._parent is parent_node and add_action != AddAction.REPLACE:
+                index_map = indices.get(id(parent_node))
+                if index_map is None:
+                    index_map = indices[id(parent_node)] = {
+                        id(x): i for i, x in enumerate(parent_node._children)
+                    }
+                index = index_map[id(node)]
+                if add_action == AddAction.ADD_TO_HEAD:
+                    is_placed = index == 0
+                elif add_action == AddAction.ADD_TO_TAIL:
+                    is_placed = index == len(parent_node._children) - 1
+                elif add_action == AddAction.ADD_BEFORE:
+                    is_placed = index == index_map[id(target_node)] - 1
+                else:
+                    is_placed = index == index_map[id(target_node)] + 1
+                if is_placed:
+                    continue
+            indices.pop(id(parent_node), None)
+            indices.pop(id(node._parent), None)
+            target_node._move_node(add_action=add_action, node=node)
+
     def _register_with_local_server(
         self, node_id=None, node_id_is_permanent=False, server=None
     ):
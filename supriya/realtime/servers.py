@@ -1,7 +1,13 @@
 import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import itertools
 import logging
+import operator
 import re
 import threading
+import time
 from typing import Set
 
 from uqbar.objects import new
@@ -19,9 +25,11 @@ from supriya.commands import (  # type: ignore
 from supriya.enums import NodeAction
 from supriya.osc.protocols import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
     HealthCheck,
     OscProtocolOffline,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
 )
 from supriya.querytree import QueryTreeGroup, QueryTreeSynth
 from supriya.scsynth import Options
@@ -36,6 +44,16 @@ logger = logging.getLogger("supriya.server")
 DEFAULT_PORT = 57110
 
 
+@dataclasses.dataclass
+class LockStatistics:
+    acquisition_count: int = 0
+    request_count: int = 0
+    hold_time: float = 0.0
+    wait_time: float = 0.0
+    last_hold_time: float = 0.0
+    maximum_hold_time: float = 0.0
+
+
 class BaseServer:
 
     ### INITIALIZER ###
@@ -47,6 +65,7 @@ class BaseServer:
         # process
         self._client_id = None
         self._is_owner = False
+        self._flow_control = None
         self._is_running = False
         self._latency = 0.1
         self._maximum_logins = None
@@ -122,6 +141,79 @@ class BaseServer:
             pattern="/fail", procedure=self._handle_failed_response,
         )
 
+    def _send_many(self, requests, fence, create_future):
+        """
+        Send ``requests`` back to back, returning one future per request.
+
+        Responses are correlated through a registry keyed on response
+        pattern: one callback is registered per distinct pattern in the
+        batch, resolving pending futures in the order their requests were
+        sent, so identical requests pipeline without stealing each other's
+        responses. Requests without a response pattern resolve to ``None``
+        immediately. With ``fence``, a trailing ``/sync`` is sent and its
+        future appended, so the batch only completes once the server has
+        finished all of it. Returns the futures plus a cleanup callable.
+        """
+        from supriya.commands import Response
+
+        def resolve(pending, message):
+            with lock:
+                while pending:
+                    future = pending.popleft()
+                    if not future.done():
+                        break
+                else:
+                    return
+            future.set_result(Response.from_osc_message(message))
+
+        lock = threading.Lock()
+        futures, requestables, registry = [], [], {}
+        if fence:
+            requests = list(requests) + [SyncRequest(sync_id=self.next_sync_id)]
+        for request in requests:
+            (
+                success_pattern,
+                failure_pattern,
+                requestable,
+            ) = request._get_response_patterns_and_requestable(self)
+            future = create_future()
+            futures.append(future)
+            requestables.append(requestable)
+            if success_pattern is None:
+                future.set_result(None)
+                continue
+            for pattern in (success_pattern, failure_pattern):
+                if pattern:
+                    registry.setdefault(tuple(pattern), collections.deque()).append(
+                        future
+                    )
+        callbacks = [
+            self._osc_protocol.register(
+                pattern=pattern,
+                procedure=lambda message, pending=pending: resolve(pending, message),
+            )
+            for pattern, pending in registry.items()
+        ]
+
+        def cleanup():
+            for callback in callbacks:
+                self._osc_protocol.unregister(callback)
+
+        for requestable in requestables:
+            self._send_request(requestable)
+        return futures, cleanup
+
+    def _send_request(self, request):
+        # Requests encode themselves, schema requests without an OscMessage,
+        # which is only built if logging or a capture needs one.
+        if not self.is_running:
+            raise supriya.exceptions.ServerOffline
+        datagram = request.to_datagram()
+        if self._flow_control is not None:
+            self._flow_control._send(self, request, datagram)
+            return
+        self._osc_protocol._send_encoded(request, datagram)
+
     def _teardown_allocators(self):
         self._audio_bus_allocator = None
         self._buffer_allocator = None
@@ -134,7 +226,9 @@ class BaseServer:
     def boot(self, port=DEFAULT_PORT, *, scsynth_path=None, options=None, **kwargs):
         ...
 
-    def connect(self, ip_address="127.0.0.1", port=DEFAULT_PORT):
+    def connect(
+        self, ip_address="127.0.0.1", port=DEFAULT_PORT, *, protocol="udp"
+    ):
         ...
 
     def disconnect(self, force=False):
@@ -148,6 +242,9 @@ class BaseServer:
             raise ValueError
         if not self.is_running:
             raise supriya.exceptions.ServerOffline
+        if self._flow_control is not None:
+            self._flow_control._send(self, message)
+            return
         self._osc_protocol.send(message)
 
     ### PUBLIC PROPERTIES ###
@@ -168,6 +265,19 @@ class BaseServer:
     def control_bus_allocator(self):
         return self._control_bus_allocator
 
+    @property
+    def flow_control(self):
+        """
+        Optional flow control for outgoing OSC traffic, or ``None``.
+        """
+        return self._flow_control
+
+    @flow_control.setter
+    def flow_control(self, flow_control):
+        if self._flow_control is not None:
+            self._flow_control._detach()
+        self._flow_control = flow_control
+
     @property
     def ip_address(self):
         return self._ip_address
@@ -248,7 +358,10 @@ class AsyncServer(BaseServer):
     ### PRIVATE METHODS ###
 
     async def _connect(self):
-        self._osc_protocol = AsyncOscProtocol()
+        if self._options.protocol == "tcp":
+            self._osc_protocol = AsyncTcpOscProtocol()
+        else:
+            self._osc_protocol = AsyncOscProtocol()
         await self._osc_protocol.connect(
             ip_address=self._ip_address,
             port=self._port,
@@ -337,9 +450,12 @@ class AsyncServer(BaseServer):
         await self._connect()
         return self
 
-    async def connect(self, ip_address="127.0.0.1", port=DEFAULT_PORT):
+    async def connect(
+        self, ip_address="127.0.0.1", port=DEFAULT_PORT, *, protocol="udp"
+    ):
         if self._is_running:
             raise supriya.exceptions.ServerOnline
+        self._options = new(self._options, protocol=protocol)
         loop = asyncio.get_running_loop()
         self._boot_future = loop.create_future()
         self._quit_future = loop.create_future()
@@ -359,6 +475,31 @@ class AsyncServer(BaseServer):
         await self._disconnect()
         return self
 
+    async def communicate_many(self, requests, *, fence=False, timeout=1.0):
+        """
+        Send ``requests`` back to back and gather their responses.
+
+        Returns a list holding each request's response, or ``None`` for
+        requests without a response pattern or which time out. ``timeout``
+        bounds the whole batch rather than each request. With ``fence``, a
+        trailing ``/sync`` must also be answered before the batch completes.
+        """
+        if not self._is_running:
+            raise supriya.exceptions.ServerOffline
+        loop = asyncio.get_running_loop()
+        futures, cleanup = self._send_many(requests, fence, loop.create_future)
+        if not futures:
+            cleanup()
+            return []
+        try:
+            _, pending = await asyncio.wait(futures, timeout=timeout)
+        finally:
+            cleanup()
+        if pending:
+            logger.warning(f"Timed out waiting on {len(pending)} responses")
+        results = [x.result() if x.done() else None for x in futures]
+        return results[:-1] if fence else results
+
     async def query(self, include_controls=True):
         request = GroupQueryTreeRequest(node_id=0, include_controls=include_controls)
         response = await request.communicate_async(server=self)
@@ -426,6 +567,7 @@ class Server(BaseServer):
     def __init__(self):
         BaseServer.__init__(self)
         self._lock = threading.RLock()
+        self._lock_statistics = LockStatistics()
         # proxies
         self._audio_input_bus_group = None
         self._audio_output_bus_group = None
@@ -607,11 +749,43 @@ class Server(BaseServer):
 
     ### PRIVATE METHODS ###
 
+    def _apply_local_requests(self, requestables):
+        """
+        Apply ``requestables`` to the local node, buffer and bus mirrors.
+
+        Requests are linearized up front, and runs of consecutive requests
+        sharing a bulk applier are applied together, all under a single
+        acquisition of the server lock.
+        """
+        requests = [
+            request
+            for requestable in requestables
+            for request in requestable._linearize()
+        ]
+        start_time = time.perf_counter()
+        with self._lock:
+            acquired_time = time.perf_counter()
+            for apply_local_bulk, group in itertools.groupby(
+                requests, key=operator.attrgetter("_apply_local_bulk")
+            ):
+                apply_local_bulk(list(group), self)
+            hold_time = time.perf_counter() - acquired_time
+            statistics = self._lock_statistics
+            statistics.acquisition_count += 1
+            statistics.request_count += len(requests)
+            statistics.hold_time += hold_time
+            statistics.wait_time += acquired_time - start_time
+            statistics.last_hold_time = hold_time
+            statistics.maximum_hold_time = max(statistics.maximum_hold_time, hold_time)
+
     def _as_node_target(self):
         return self.default_group
 
     def _connect(self):
-        self._osc_protocol = ThreadedOscProtocol()
+        if self._options.protocol == "tcp":
+            self._osc_protocol = ThreadedTcpOscProtocol()
+        else:
+            self._osc_protocol = ThreadedOscProtocol()
         self._osc_protocol.connect(
             ip_address=self.ip_address,
             port=self.port,
@@ -680,30 +854,29 @@ class Server(BaseServer):
                 buffer_proxy._handle_response(item)
 
     def _handle_control_bus_set_response(self, message):
-        from supriya.commands import Response
-
-        response = Response.from_osc_message(message)
-        for item in response:
-            bus_id = item.bus_id
-            bus_proxy = self._get_control_bus_proxy(bus_id)
-            bus_proxy._value = item.bus_value
+        # Read (bus_id, value) pairs straight off the message's contents.
+        contents = message.contents
+        for i in range(0, len(contents) - 1, 2):
+            bus_proxy = self._get_control_bus_proxy(contents[i])
+            bus_proxy._value = contents[i + 1]
 
     def _handle_control_bus_setn_response(self, message):
-        from supriya.commands import Response
-
-        response = Response.from_osc_message(message)
-        for item in response:
-            starting_bus_id = item.starting_bus_id
-            for i, value in enumerate(item.bus_values):
-                bus_id = starting_bus_id + i
-                bus_proxy = self._get_control_bus_proxy(bus_id)
+        # Read (starting_bus_id, count, *values) runs straight off the contents.
+        contents = message.contents
+        index = 0
+        while index < len(contents) - 1:
+            starting_bus_id, count = contents[index], contents[index + 1]
+            index += 2
+            for i, value in enumerate(contents[index : index + count]):
+                bus_proxy = self._get_control_bus_proxy(starting_bus_id + i)
                 bus_proxy._value = value
+            index += count
 
     def _handle_node_info_response(self, message):
         from supriya.realtime import Group, Synth
-        from supriya.commands import Response
+        from supriya.commands import NodeInfo
 
-        response = Response.from_osc_message(message)
+        response = NodeInfo.from_osc_message(message)
         with self._lock:
             node_id = response.node_id
             node = self._nodes.get(node_id)
@@ -868,9 +1041,12 @@ class Server(BaseServer):
         self._connect()
         return self
 
-    def connect(self, ip_address="127.0.0.1", port=DEFAULT_PORT):
+    def connect(
+        self, ip_address="127.0.0.1", port=DEFAULT_PORT, *, protocol="udp"
+    ):
         if self.is_running:
             raise supriya.exceptions.ServerOnline
+        self._options = new(self._options, protocol=protocol)
         self._ip_address = "127.0.0.1"
         self._is_owner = False
         self._port = port
@@ -909,6 +1085,37 @@ class Server(BaseServer):
         self._disconnect()
         return self
 
+    def communicate_many(
+        self, requests, *, apply_local=True, fence=False, timeout=1.0
+    ):
+        """
+        Send ``requests`` back to back and gather their responses.
+
+        Unlike calling ``communicate()`` on each request in turn, this costs
+        one round trip for the whole batch.
+
+        Returns a list holding each request's response, or ``None`` for
+        requests without a response pattern or which time out. ``timeout``
+        bounds the whole batch rather than each request. With ``fence``, a
+        trailing ``/sync`` must also be answered before the batch completes.
+        """
+        if not self.is_running:
+            raise supriya.exceptions.ServerOffline
+        requests = list(requests)
+        if apply_local:
+            self._apply_local_requests(requests)
+        futures, cleanup = self._send_many(
+            requests, fence, concurrent.futures.Future
+        )
+        try:
+            _, pending = concurrent.futures.wait(futures, timeout=timeout)
+        finally:
+            cleanup()
+        if pending:
+            logger.warning(f"Timed out waiting on {len(pending)} responses")
+        results = [x.result() if x.done() else None for x in futures]
+        return results[:-1] if fence else results
+
     @classmethod
     def default(cls):
         if cls._default_server is None:
@@ -1077,6 +1284,13 @@ class Server(BaseServer):
     def default_group(self):
         return self._default_group
 
+    @property
+    def lock_statistics(self):
+        """
+        Counters for time spent applying requests under the server lock.
+        """
+        return self._lock_statistics
+
     @property
     def meters(self):
         return self._meters
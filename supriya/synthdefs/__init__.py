@@ -9,10 +9,12 @@ from .bases import (
     PureUGen,
     UGen,
     UGenMeta,
+    UGenMethodGenerator,
     UnaryOpUGen,
     WidthFirstUGen,
 )
 from .builders import SynthDefBuilder
+from .caches import SynthDefCache
 from .compilers import SynthDefCompiler, SynthDefDecompiler
 from .controls import (
     AudioControl,
@@ -42,6 +44,7 @@ __all__ = [
     "SuperColliderSynthDef",
     "SynthDef",
     "SynthDefBuilder",
+    "SynthDefCache",
     "SynthDefCompiler",
     "SynthDefDecompiler",
     "SynthDefFactory",
@@ -50,6 +53,7 @@ __all__ = [
     "UGen",
     "UGenArray",
     "UGenMeta",
+    "UGenMethodGenerator",
     "UGenMethodMixin",
     "UGenSortBundle",
     "UnaryOpUGen",
@@ -1,5 +1,6 @@
 import abc
 import collections
+import functools
 import inspect
 from typing import Optional, Tuple
 
@@ -12,6 +13,44 @@ from supriya.typing import UGenInputMap
 from .mixins import UGenMethodMixin
 
 
+class UGenMethodGenerator:
+    """
+    Generates a UGen method, and its source, on first access.
+
+    Replaces itself on the class which defined it with the generated method, so
+    UGens only pay for generating the methods they use.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_attribute_name", "_factory", "_method_name", "_owner")
+
+    ### INITIALIZER ###
+
+    def __init__(self, owner, attribute_name, method_name, factory):
+        self._attribute_name = attribute_name
+        self._factory = factory
+        self._method_name = method_name
+        self._owner = owner
+
+    ### SPECIAL METHODS ###
+
+    def __get__(self, instance, owner):
+        function, string = self._factory()
+        setattr(self._owner, self._method_name, function)
+        setattr(self._owner, self.get_source_name(self._method_name), string)
+        value = vars(self._owner)[self._attribute_name]
+        if hasattr(value, "__get__"):
+            return value.__get__(instance, owner)
+        return value
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def get_source_name(method_name):
+        return "_{}_source".format(method_name.strip("_"))
+
+
 class UGenMeta(abc.ABCMeta):
 
     initializer_template = uqbar.strings.normalize(
@@ -48,6 +87,14 @@ class UGenMeta(abc.ABCMeta):
     '''
     )
 
+    property_doc_template = uqbar.strings.normalize(
+        """
+    Gets ``{input_name}`` of ``{ugen_name}``.
+
+    Returns input.
+    """
+    )
+
     rateless_constructor_template = uqbar.strings.normalize(
         '''
     @classmethod
@@ -75,6 +122,7 @@ class UGenMeta(abc.ABCMeta):
             default_channel_count,
             has_settable_channel_count,
         ) = UGenMeta.get_channel_count(namespace, bases)
+        factories = {}
         if isinstance(ordered_input_names, collections.OrderedDict):
             for name in ordered_input_names:
                 if name in namespace:
@@ -85,16 +133,15 @@ class UGenMeta(abc.ABCMeta):
                     unexpanded=name in unexpanded_input_names,
                 )
             if "__init__" not in namespace:
-                function, string = UGenMeta.make_initializer(
+                factories["__init__"] = functools.partial(
+                    UGenMeta.make_initializer,
                     ugen_name=class_name,
                     bases=bases,
-                    parameters=ordered_input_names.copy(),
+                    parameters=ordered_input_names,
                     has_calculation_rate=bool(valid_calculation_rates),
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace["__init__"] = function
-                namespace["_init_source"] = string
             constructor_rates = {}
             if valid_calculation_rates:
                 for rate in valid_calculation_rates:
@@ -104,17 +151,28 @@ class UGenMeta(abc.ABCMeta):
             elif "new" not in namespace:
                 constructor_rates["new"] = None
             for name, rate in constructor_rates.items():
-                function, string = UGenMeta.make_constructor(
+                factories[name] = functools.partial(
+                    UGenMeta.make_constructor,
                     ugen_name=class_name,
                     bases=bases,
                     rate=rate,
-                    parameters=ordered_input_names.copy(),
+                    parameters=ordered_input_names,
                     default_channel_count=default_channel_count,
                     has_settable_channel_count=has_settable_channel_count,
                 )
-                namespace[name] = function
-                namespace["_{}_source".format(name)] = string
-        return super().__new__(metaclass, class_name, bases, namespace)
+        class_ = super().__new__(metaclass, class_name, bases, namespace)
+        # Initializers and constructors are generated on first access. Their
+        # generators go in after ABCMeta looks for abstract methods, which
+        # would otherwise generate the initializer straight away.
+        for name, factory in factories.items():
+            for attribute_name in (name, UGenMethodGenerator.get_source_name(name)):
+                setattr(
+                    class_,
+                    attribute_name,
+                    UGenMethodGenerator(class_, attribute_name, name, factory),
+                )
+        class_.__abstractmethods__ = class_.__abstractmethods__.difference(factories)
+        return class_
 
     @staticmethod
     def get_channel_count(namespace, bases):
@@ -156,6 +214,7 @@ class UGenMeta(abc.ABCMeta):
         default_channel_count=False,
         has_settable_channel_count=False,
     ):
+        parameters = parameters.copy()
         validators = ""
         if default_channel_count and has_settable_channel_count:
             parameters["channel_count"] = int(default_channel_count)
@@ -203,6 +262,7 @@ class UGenMeta(abc.ABCMeta):
         default_channel_count=False,
         has_settable_channel_count=False,
     ):
+        parameters = parameters.copy()
         if has_calculation_rate:
             new_parameters = collections.OrderedDict([("calculation_rate", None)])
             new_parameters.update(parameters)
@@ -236,13 +296,9 @@ class UGenMeta(abc.ABCMeta):
 
     @staticmethod
     def make_property(ugen_name, input_name, unexpanded=False):
-        doc = uqbar.strings.normalize(
-            """
-        Gets ``{input_name}`` of ``{ugen_name}``.
-
-        Returns input.
-        """
-        ).format(ugen_name=ugen_name, input_name=input_name)
+        doc = UGenMeta.property_doc_template.format(
+            ugen_name=ugen_name, input_name=input_name
+        )
         if unexpanded:
 
             def getter(object_):
@@ -560,6 +616,30 @@ class UGen(UGenMethodMixin, metaclass=UGenMeta):
             return None
         return supriya.DoneAction.from_expr(int(self.done_action))
 
+    def _get_expression_key(self):
+        """
+        Gets a key identifying the computation this ugen performs.
+
+        Pure ugens with equal keys produce identical outputs, and can be merged
+        by common-subexpression elimination. Impure ugens return ``None``.
+        """
+        import supriya.synthdefs
+
+        if not self._is_pure:
+            return None
+        inputs = []
+        for input_ in self._inputs:
+            if isinstance(input_, supriya.synthdefs.OutputProxy):
+                input_ = (input_.source, input_.output_index)
+            inputs.append(input_)
+        return (
+            type(self),
+            int(self.calculation_rate),
+            self.special_index,
+            len(self),
+            tuple(inputs),
+        )
+
     @staticmethod
     def _get_method_for_rate(cls, calculation_rate):
         import supriya.synthdefs
@@ -858,6 +938,8 @@ class PureMultiOutUGen(MultiOutUGen):
 
     __documentation_section__ = None
 
+    _is_pure = True
+
     ### PRIVATE METHODS ###
 
     def _optimize_graph(self, sort_bundles):
@@ -909,6 +991,17 @@ class UnaryOpUGen(PureUGen):
 
     _ordered_input_names = collections.OrderedDict([("source", None)])
 
+    _random_operators = frozenset(
+        [
+            UnaryOperator.BILINRAND,
+            UnaryOperator.COIN,
+            UnaryOperator.LINRAND,
+            UnaryOperator.RAND,
+            UnaryOperator.RAND2,
+            UnaryOperator.SUM3RAND,
+        ]
+    )
+
     ### INITIALIZER ###
 
     def __init__(self, calculation_rate=None, source=None, special_index=None):
@@ -919,6 +1012,14 @@ class UnaryOpUGen(PureUGen):
             special_index=special_index,
         )
 
+    ### PRIVATE METHODS ###
+
+    def _get_expression_key(self):
+        # Random operators draw a new value per instance.
+        if self.special_index in self._random_operators:
+            return None
+        return super()._get_expression_key()
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -964,6 +1065,8 @@ class BinaryOpUGen(PureUGen):
 
     _ordered_input_names = collections.OrderedDict([("left", None), ("right", None)])
 
+    _random_operators = frozenset([BinaryOperator.EXPRANDRANGE, BinaryOperator.RANDRANGE])
+
     ### INITIALIZER ###
 
     def __init__(
@@ -979,6 +1082,12 @@ class BinaryOpUGen(PureUGen):
 
     ### PRIVATE METHODS ###
 
+    def _get_expression_key(self):
+        # Random operators draw a new value per instance.
+        if self.special_index in self._random_operators:
+            return None
+        return super()._get_expression_key()
+
     @classmethod
     def _new_single(
         cls, calculation_rate=None, special_index=None, left=None, right=None
@@ -1,5 +1,4 @@
 import collections
-import copy
 import uuid
 from typing import List
 
@@ -62,7 +61,7 @@ class SynthDefBuilder(SupriyaObject):
         self._name = name
         self._uuid = uuid.uuid4()
         self._parameters = collections.OrderedDict()
-        self._ugens = []
+        self._ugens = collections.OrderedDict()
         for key, value in kwargs.items():
             self._add_parameter(key, value)
 
@@ -96,8 +95,7 @@ class SynthDefBuilder(SupriyaObject):
             if isinstance(ugen, supriya.synthdefs.OutputProxy):
                 ugen = ugen.source
             assert ugen._uuid == self._uuid
-            if ugen not in self._ugens:
-                self._ugens.append(ugen)
+            self._ugens.setdefault(ugen, None)
 
     def _add_parameter(self, *args):
         # TODO: Refactor without *args for clarity
@@ -138,7 +136,7 @@ class SynthDefBuilder(SupriyaObject):
 
     ### PUBLIC METHODS ###
 
-    def build(self, name=None, optimize=True):
+    def build(self, name=None, optimize=True, eliminate_common_subexpressions=False):
         import supriya.synthdefs
         import supriya.ugens
 
@@ -147,15 +145,13 @@ class SynthDefBuilder(SupriyaObject):
         # Control subclasses from being aggregated into SynthDefBuilders in
         # the first place.
 
-        self._ugens[:] = [
-            ugen
-            for ugen in self._ugens
-            if not isinstance(ugen, supriya.synthdefs.Control)
-        ]
+        for ugen in tuple(self._ugens):
+            if isinstance(ugen, supriya.synthdefs.Control):
+                del self._ugens[ugen]
         name = self.name or name
         with self:
             ugens = list(self._parameters.values()) + list(self._ugens)
-            ugens = copy.deepcopy(ugens)
+            ugens = supriya.synthdefs.SynthDef._copy_ugen_graph(ugens)
             ugens, parameters = supriya.synthdefs.SynthDef._extract_parameters(ugens)
             (
                 control_ugens,
@@ -164,7 +160,14 @@ class SynthDefBuilder(SupriyaObject):
             ) = supriya.synthdefs.SynthDef._build_control_mapping(parameters)
             supriya.synthdefs.SynthDef._remap_controls(ugens, control_mapping)
             ugens = control_ugens + ugens
-            synthdef = supriya.synthdefs.SynthDef(ugens, name=name, optimize=optimize)
+            # The SynthDef takes ownership of this build's copies, rather than
+            # copying them again.
+            synthdef = supriya.synthdefs.SynthDef._from_ugens(
+                ugens,
+                name=name,
+                optimize=optimize,
+                eliminate_common_subexpressions=eliminate_common_subexpressions,
+            )
         return synthdef
 
     def poll_ugen(self, ugen, label=None, trigger=None, trigger_id=-1):
@@ -0,0 +1,336 @@
+import enum
+import hashlib
+import json
+import os
+import pathlib
+import tempfile
+import types
+
+import supriya
+from supriya import ParameterRate, Unit
+from supriya.system import SupriyaObject, SupriyaValueObject
+
+from .builders import SynthDefBuilder
+from .controls import Control, Parameter, Range
+from .factories import SynthDefFactory
+from .mixins import OutputProxy
+from .synthdefs import SynthDef
+
+
+class SynthDefCache(SupriyaObject):
+    """
+    A persistent, content-addressed cache of compiled SynthDefs.
+
+    Building a SynthDef from a builder or factory constructs, sorts and
+    compiles its whole UGen graph. The cache keys each build by a stable
+    hash of its inputs, and stores the compiled ``.scsyndef`` bytes plus
+    parameter metadata on disk, by default under ``supriya.output_path``.
+    SynthDefs loaded from the cache can be allocated and played straight
+    away. Their UGens are only decompiled if asked for.
+
+    ::
+
+        >>> import tempfile
+        >>> def signal_block(builder, source, state):
+        ...     return supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        ...
+        >>> factory = (
+        ...     supriya.synthdefs.SynthDefFactory(frequency=440)
+        ...     .with_signal_block(signal_block)
+        ...     .with_output()
+        ... )
+        >>> with tempfile.TemporaryDirectory() as directory_path:
+        ...     cache = supriya.synthdefs.SynthDefCache(directory_path)
+        ...     synthdef = cache.build(factory, name="sine")
+        ...     cached_synthdef = cache.build(factory, name="sine")
+        ...
+        >>> cached_synthdef == synthdef
+        True
+
+    ::
+
+        >>> cached_synthdef.parameter_names
+        ['frequency', 'out']
+
+    Keys cover a builder's UGen graph and parameters, or a factory's
+    configuration and the code, defaults and closures of its block
+    functions, along with build arguments and the supriya version. They
+    don't cover globals read by block functions.
+
+    Entries past ``maximum_bytes`` or ``maximum_entries`` are evicted, least
+    recently used first.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __documentation_section__ = "SynthDef Internals"
+
+    __slots__ = ("_directory_path", "maximum_bytes", "maximum_entries")
+
+    _version = 1
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, directory_path=None, maximum_bytes=32 * 1024 * 1024, maximum_entries=None
+    ):
+        if directory_path is None:
+            directory_path = pathlib.Path(supriya.output_path) / "synthdefs"
+        self._directory_path = pathlib.Path(directory_path)
+        self.maximum_bytes = maximum_bytes
+        self.maximum_entries = maximum_entries
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _canonicalize(cls, value):
+        if value is None or isinstance(value, (bool, bytes, float, int, str)):
+            return value
+        elif isinstance(value, enum.Enum):
+            return (type(value).__name__, value.name)
+        elif isinstance(value, (list, tuple)):
+            return tuple(cls._canonicalize(x) for x in value)
+        elif isinstance(value, (set, frozenset)):
+            return ("set", tuple(sorted(repr(cls._canonicalize(x)) for x in value)))
+        elif isinstance(value, dict):
+            return (
+                "dict",
+                tuple(
+                    sorted((repr(k), cls._canonicalize(v)) for k, v in value.items())
+                ),
+            )
+        elif isinstance(value, types.FunctionType):
+            return (
+                "function",
+                value.__module__,
+                value.__qualname__,
+                cls._canonicalize(value.__code__),
+                cls._canonicalize(value.__defaults__),
+                cls._canonicalize(value.__kwdefaults__),
+                tuple(
+                    cls._canonicalize(x.cell_contents) for x in value.__closure__ or ()
+                ),
+            )
+        elif isinstance(value, types.CodeType):
+            return (
+                "code",
+                value.co_code,
+                cls._canonicalize(value.co_consts),
+                value.co_names,
+                value.co_varnames,
+            )
+        elif isinstance(value, SynthDefBuilder):
+            return cls._canonicalize_builder(value)
+        elif isinstance(value, SynthDefFactory):
+            return (
+                "factory",
+                tuple(
+                    (name, cls._canonicalize(getattr(value, name)))
+                    for name in value.__slots__
+                ),
+            )
+        elif isinstance(value, SupriyaValueObject):
+            return (type(value).__name__, repr(value))
+        elif hasattr(value, "tolist"):
+            return cls._canonicalize(value.tolist())
+        raise ValueError("Can't derive a stable cache key from {!r}".format(value))
+
+    @classmethod
+    def _canonicalize_builder(cls, builder):
+        ugens = [x for x in builder._ugens if not isinstance(x, Control)]
+        indices = {ugen: i for i, ugen in enumerate(ugens)}
+        graph = []
+        for ugen in ugens:
+            inputs = []
+            for input_ in ugen.inputs:
+                if isinstance(input_, OutputProxy):
+                    source = input_.source
+                    if isinstance(source, Parameter):
+                        source = source.name
+                    elif source in indices:
+                        source = indices[source]
+                    else:
+                        raise ValueError(
+                            "Can't derive a stable cache key from {!r}".format(source)
+                        )
+                    input_ = (source, input_.output_index)
+                inputs.append(input_)
+            graph.append(
+                (
+                    type(ugen).__name__,
+                    int(ugen.calculation_rate),
+                    int(ugen.special_index),
+                    tuple(inputs),
+                    tuple(int(x) for x in ugen._get_outputs()),
+                )
+            )
+        parameters = cls._canonicalize(list(builder._parameters.values()))
+        return ("builder", parameters, tuple(graph))
+
+    @staticmethod
+    def _dump_metadata(synthdef):
+        parameters = []
+        for index, parameter in synthdef.indexed_parameters:
+            range_ = parameter.range_
+            unit = parameter.unit
+            value = parameter.value
+            parameters.append(
+                {
+                    "index": index,
+                    "lag": parameter.lag,
+                    "name": parameter.name,
+                    "range": None
+                    if range_ is None
+                    else [range_.minimum, range_.maximum],
+                    "rate": parameter.parameter_rate.name,
+                    "unit": Unit.from_expr(unit).name if unit is not None else None,
+                    "value": list(value) if isinstance(value, tuple) else value,
+                }
+            )
+        return {"name": synthdef.name, "parameters": parameters}
+
+    def _evict(self):
+        entries = []
+        for metadata_path in self._directory_path.glob("*.json"):
+            compiled_path = metadata_path.with_suffix(".scsyndef")
+            try:
+                stat = metadata_path.stat()
+                size = stat.st_size + compiled_path.stat().st_size
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, metadata_path.stem, size))
+        entries.sort()
+        total_bytes = sum(x[2] for x in entries)
+        total_entries = len(entries)
+        for _, key, size in entries:
+            if total_bytes <= self.maximum_bytes and (
+                self.maximum_entries is None or total_entries <= self.maximum_entries
+            ):
+                break
+            self._remove(key)
+            total_bytes -= size
+            total_entries -= 1
+
+    def _get_paths(self, key):
+        return (
+            self._directory_path / "{}.json".format(key),
+            self._directory_path / "{}.scsyndef".format(key),
+        )
+
+    @staticmethod
+    def _load(metadata, compiled_synthdef):
+        if compiled_synthdef[:4] != b"SCgf" or compiled_synthdef[8:10] != b"\x00\x01":
+            raise ValueError("Not a single compiled SynthDef")
+        # Skip the file header and the SynthDef's name to reach its graph.
+        compiled_ugen_graph = compiled_synthdef[11 + compiled_synthdef[10] :]
+        indexed_parameters = []
+        for parameter in metadata["parameters"]:
+            range_ = parameter["range"]
+            unit = parameter["unit"]
+            indexed_parameters.append(
+                (
+                    parameter["index"],
+                    Parameter(
+                        lag=parameter["lag"],
+                        name=parameter["name"],
+                        parameter_rate=ParameterRate[parameter["rate"]],
+                        range_=Range(*range_) if range_ else None,
+                        unit=Unit[unit] if unit is not None else None,
+                        value=parameter["value"],
+                    ),
+                )
+            )
+        return SynthDef._from_compiled(
+            compiled_ugen_graph,
+            name=metadata["name"],
+            indexed_parameters=indexed_parameters,
+        )
+
+    def _remove(self, key):
+        # The metadata goes first, so a half-removed entry is never read.
+        for path in self._get_paths(key):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _write(self, path, data):
+        # Write via a temporary file, so readers never see partial entries.
+        with tempfile.NamedTemporaryFile(
+            dir=str(self._directory_path), delete=False
+        ) as file_pointer:
+            file_pointer.write(data)
+        os.replace(file_pointer.name, str(path))
+
+    ### PUBLIC METHODS ###
+
+    def build(self, source, name=None, **kwargs):
+        """
+        Build a SynthDef from a builder or factory, via the cache.
+
+        ``kwargs`` pass through to the builder or factory's ``build()``.
+        """
+        key = self.get_key(source, name=name, **kwargs)
+        synthdef = self.get(key)
+        if synthdef is None:
+            synthdef = source.build(name=name, **kwargs)
+            self.put(key, synthdef)
+        return synthdef
+
+    def clear(self):
+        """
+        Remove all entries.
+        """
+        for metadata_path in self._directory_path.glob("*.json"):
+            self._remove(metadata_path.stem)
+
+    def get(self, key):
+        """
+        Get the SynthDef cached under ``key``, or ``None``.
+        """
+        metadata_path, compiled_path = self._get_paths(key)
+        try:
+            metadata = json.loads(metadata_path.read_text())
+            synthdef = self._load(metadata, compiled_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (IndexError, KeyError, TypeError, ValueError):
+            self._remove(key)
+            return None
+        try:
+            os.utime(str(metadata_path))
+        except OSError:
+            pass
+        return synthdef
+
+    def get_key(self, source, name=None, **kwargs):
+        """
+        Get the cache key for building a SynthDef from ``source``.
+        """
+        if not isinstance(source, (SynthDefBuilder, SynthDefFactory)):
+            raise ValueError(source)
+        canonical_form = (
+            self._version,
+            supriya.__version__,
+            name,
+            self._canonicalize(kwargs),
+            self._canonicalize(source),
+        )
+        return hashlib.sha256(repr(canonical_form).encode()).hexdigest()
+
+    def put(self, key, synthdef):
+        """
+        Cache ``synthdef`` under ``key``, evicting entries as needed.
+        """
+        metadata = json.dumps(self._dump_metadata(synthdef), sort_keys=True)
+        metadata_path, compiled_path = self._get_paths(key)
+        self._directory_path.mkdir(parents=True, exist_ok=True)
+        self._write(compiled_path, synthdef.compile())
+        self._write(metadata_path, metadata.encode())
+        self._evict()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def directory_path(self):
+        return self._directory_path
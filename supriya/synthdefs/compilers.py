@@ -13,6 +13,19 @@ class SynthDefCompiler(SupriyaObject):
 
     __documentation_section__ = "SynthDef Internals"
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_indices(synthdef):
+        # Map constants and ugens to their first index once per compile,
+        # rather than searching for each input's index.
+        constant_indices, ugen_indices = {}, {}
+        for i, constant in enumerate(synthdef._constants):
+            constant_indices.setdefault(constant, i)
+        for i, ugen in enumerate(synthdef._ugens):
+            ugen_indices.setdefault(ugen, i)
+        return constant_indices, ugen_indices
+
     ### PUBLIC METHODS ###
 
     @staticmethod
@@ -73,7 +86,9 @@ class SynthDefCompiler(SupriyaObject):
         return result
 
     @staticmethod
-    def compile_ugen(ugen, synthdef):
+    def compile_ugen(ugen, synthdef, indices=None):
+        if indices is None:
+            indices = SynthDefCompiler._get_indices(synthdef)
         outputs = ugen._get_outputs()
         result = []
         result.append(SynthDefCompiler.encode_string(type(ugen).__name__))
@@ -84,7 +99,9 @@ class SynthDefCompiler(SupriyaObject):
             SynthDefCompiler.encode_unsigned_int_16bit(int(ugen.special_index))
         )
         for input_ in ugen.inputs:
-            result.append(SynthDefCompiler.compile_ugen_input_spec(input_, synthdef))
+            result.append(
+                SynthDefCompiler.compile_ugen_input_spec(input_, synthdef, indices)
+            )
         for output in outputs:
             result.append(SynthDefCompiler.encode_unsigned_int_8bit(output))
         result = bytes().join(result)
@@ -100,25 +117,29 @@ class SynthDefCompiler(SupriyaObject):
             result.append(SynthDefCompiler.encode_float(constant))
         result.append(SynthDefCompiler.compile_parameters(synthdef))
         result.append(SynthDefCompiler.encode_unsigned_int_32bit(len(synthdef.ugens)))
-        for ugen_index, ugen in enumerate(synthdef.ugens):
-            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef))
+        indices = SynthDefCompiler._get_indices(synthdef)
+        for ugen in synthdef.ugens:
+            result.append(SynthDefCompiler.compile_ugen(ugen, synthdef, indices))
         result.append(SynthDefCompiler.encode_unsigned_int_16bit(0))
         result = bytes().join(result)
         return result
 
     @staticmethod
-    def compile_ugen_input_spec(input_, synthdef):
+    def compile_ugen_input_spec(input_, synthdef, indices=None):
         import supriya.synthdefs
 
+        if indices is None:
+            indices = SynthDefCompiler._get_indices(synthdef)
+        constant_indices, ugen_indices = indices
         result = []
         if isinstance(input_, float):
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(0xFFFFFFFF))
-            constant_index = synthdef._constants.index(input_)
+            constant_index = constant_indices[input_]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(constant_index))
         elif isinstance(input_, supriya.synthdefs.OutputProxy):
             ugen = input_.source
             output_index = input_.output_index
-            ugen_index = synthdef._ugens.index(ugen)
+            ugen_index = ugen_indices[ugen]
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(ugen_index))
             result.append(SynthDefCompiler.encode_unsigned_int_32bit(output_index))
         else:
@@ -366,7 +387,7 @@ class SynthDefDecompiler(SupriyaObject):
                     )
             ugens.append(ugen)
         variants_count, index = sdd._decode_int_16bit(value, index)
-        synthdef = supriya.synthdefs.SynthDef(ugens=ugens, name=name, decompiled=True)
+        synthdef = supriya.synthdefs.SynthDef._from_ugens(ugens, name=name)
         if synthdef.name == synthdef.anonymous_name:
             synthdef._name = None
         return synthdef, index
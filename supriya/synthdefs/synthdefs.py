@@ -19,7 +19,7 @@ from supriya import (
 from supriya.system import SupriyaObject
 
 from .bases import BinaryOpUGen, UGen, UnaryOpUGen, WidthFirstUGen
-from .compilers import SynthDefCompiler
+from .compilers import SynthDefCompiler, SynthDefDecompiler
 from .controls import AudioControl, Control, LagControl, Parameter, TrigControl
 from .grapher import SynthDefGrapher
 from .mixins import OutputProxy, UGenMethodMixin
@@ -89,22 +89,22 @@ class SynthDef:
 
     ### INITIALIZER ###
 
-    def __init__(self, ugens, name=None, optimize=True, parameter_names=None, **kwargs):
+    def __init__(
+        self,
+        ugens,
+        name=None,
+        optimize=True,
+        parameter_names=None,
+        eliminate_common_subexpressions=False,
+        **kwargs,
+    ):
         self._name = name
-        ugens = list(copy.deepcopy(ugens))
-        assert all(isinstance(_, UGen) for _ in ugens)
-        ugens = self._cleanup_pv_chains(ugens)
-        ugens = self._cleanup_local_bufs(ugens)
-        if optimize:
-            ugens = self._optimize_ugen_graph(ugens)
-        ugens = self._sort_ugens_topologically(ugens)
-        self._ugens = tuple(ugens)
-        self._constants = self._collect_constants(self._ugens)
-        self._control_ugens = self._collect_control_ugens(self._ugens)
-        self._indexed_parameters = self._collect_indexed_parameters(
-            self._control_ugens, parameter_names=parameter_names
+        self._initialize_ugen_graph(
+            self._copy_ugen_graph(ugens),
+            optimize=optimize,
+            parameter_names=parameter_names,
+            eliminate_common_subexpressions=eliminate_common_subexpressions,
         )
-        self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
 
     ### SPECIAL METHODS ###
 
@@ -216,10 +216,10 @@ class SynthDef:
         def get_ugen_names():
             grouped_ugens = {}
             named_ugens = {}
-            for ugen in self._ugens:
+            for ugen in self.ugens:
                 key = (type(ugen), ugen.calculation_rate, ugen.special_index)
                 grouped_ugens.setdefault(key, []).append(ugen)
-            for ugen in self._ugens:
+            for ugen in self.ugens:
                 parts = [type(ugen).__name__]
                 if isinstance(ugen, BinaryOpUGen):
                     ugen_op = BinaryOperator.from_expr(ugen.special_index)
@@ -257,7 +257,7 @@ class SynthDef:
 
         ugens = []
         named_ugens = get_ugen_names()
-        for ugen in self._ugens:
+        for ugen in self.ugens:
             ugen_dict = {}
             ugen_name = named_ugens[ugen]
             for i, input_ in enumerate(ugen.inputs):
@@ -306,30 +306,29 @@ class SynthDef:
     def _allocate_synthdefs(synthdefs, server):
         # TODO: Should sync be configurable here?
         import supriya.commands
+        from supriya.osc.messages import OscBundle
 
-        d_recv_synthdef_groups = []
-        d_recv_synth_group = []
-        current_total = 0
+        d_recv_synthdefs = []
+        d_recv_sizes = []
         d_load_synthdefs = []
         if not synthdefs:
             return
+        maximum_packet_size = server.osc_protocol.maximum_packet_size
+        # A /d_recv message spends 16 bytes on its address, type tags and blob
+        # length, and 10 on the blob's SCgf header, leaving the rest for the
+        # padded concatenation of compiled SynthDef bodies.
+        capacity = ((maximum_packet_size - 16) & ~3) - 10
         for synthdef in synthdefs:
             # synthdef._register_with_local_server(server=server)
-            compiled = synthdef.compile()
-            if 8192 < len(compiled):
+            size = len(synthdef.compile()) - 10
+            if capacity < size:
                 d_load_synthdefs.append(synthdef)
-            elif current_total + len(compiled) < 8192:
-                d_recv_synth_group.append(synthdef)
-                current_total += len(compiled)
             else:
-                d_recv_synthdef_groups.append(d_recv_synth_group)
-                d_recv_synth_group = [synthdef]
-                current_total = len(compiled)
-        if d_recv_synth_group:
-            d_recv_synthdef_groups.append(d_recv_synth_group)
-        for d_recv_synth_group in d_recv_synthdef_groups:
+                d_recv_synthdefs.append(synthdef)
+                d_recv_sizes.append(size)
+        for start, stop in OscBundle._partition_sizes(d_recv_sizes, capacity):
             d_recv_request = supriya.commands.SynthDefReceiveRequest(
-                synthdefs=tuple(d_recv_synth_group)
+                synthdefs=tuple(d_recv_synthdefs[start:stop])
             )
             d_recv_request.communicate(server=server, sync=True)
         if d_load_synthdefs:
@@ -491,13 +490,12 @@ class SynthDef:
 
     @staticmethod
     def _collect_constants(ugens):
-        constants = []
+        constants = collections.OrderedDict()
         for ugen in ugens:
             for input_ in ugen._inputs:
                 if not isinstance(input_, float):
                     continue
-                if input_ not in constants:
-                    constants.append(input_)
+                constants.setdefault(input_, None)
         return tuple(constants)
 
     @staticmethod
@@ -521,6 +519,62 @@ class SynthDef:
         indexed_parameters = tuple(indexed_parameters)
         return indexed_parameters
 
+    @staticmethod
+    def _copy_ugen_graph(ugens):
+        """
+        Copy ``ugens``, and any ugens or parameters they refer to.
+
+        Each node is copied shallowly, once, and its inputs repointed at the
+        copies, so copying takes linear time and nothing else is duplicated.
+        """
+        copies = {}
+        for ugen in ugens:
+            if id(ugen) not in copies:
+                copies[id(ugen)] = copy.copy(ugen)
+        pending = list(copies.values())
+        while pending:
+            ugen = pending.pop()
+            if not isinstance(ugen, UGen):
+                continue
+            inputs = list(ugen._inputs)
+            for i, input_ in enumerate(inputs):
+                if not isinstance(input_, OutputProxy):
+                    continue
+                source = copies.get(id(input_.source))
+                if source is None:
+                    source = copies[id(input_.source)] = copy.copy(input_.source)
+                    pending.append(source)
+                inputs[i] = OutputProxy(source=source, output_index=input_.output_index)
+            ugen._inputs = tuple(inputs)
+        return [copies[id(ugen)] for ugen in ugens]
+
+    def _decompile_ugen_graph(self):
+        synthdef = SynthDefDecompiler.decompile_synthdef(self.compile())
+        self._ugens = synthdef._ugens
+        self._constants = synthdef._constants
+        self._control_ugens = synthdef._control_ugens
+
+    @staticmethod
+    def _eliminate_common_subexpressions(ugens):
+        # Visit ugens in topological order, so their inputs are already merged
+        # when their keys are taken, and whole identical subgraphs collapse.
+        expressions = {}
+        replacements = {}
+        for ugen in SynthDef._sort_ugens_topologically(ugens):
+            inputs = list(ugen._inputs)
+            for i, input_ in enumerate(inputs):
+                if isinstance(input_, OutputProxy) and input_.source in replacements:
+                    inputs[i] = replacements[input_.source][input_.output_index]
+            ugen._inputs = tuple(inputs)
+            key = ugen._get_expression_key()
+            if key is None:
+                continue
+            elif key in expressions:
+                replacements[ugen] = expressions[key]
+            else:
+                expressions[key] = ugen
+        return tuple(ugen for ugen in ugens if ugen not in replacements)
+
     @staticmethod
     def _extract_parameters(ugens):
         parameters = set()
@@ -531,23 +585,84 @@ class SynthDef:
         parameters = tuple(sorted(parameters, key=lambda x: x.name))
         return ugens, parameters
 
+    @classmethod
+    def _from_compiled(cls, compiled_ugen_graph, name=None, indexed_parameters=()):
+        """
+        Make a SynthDef from its compiled UGen graph, without building UGens.
+
+        Its UGens are decompiled from the graph when first needed.
+        """
+        synthdef = cls.__new__(cls)
+        synthdef._compiled_ugen_graph = bytes(compiled_ugen_graph)
+        synthdef._name = name
+        synthdef._indexed_parameters = tuple(indexed_parameters)
+        synthdef._ugens = synthdef._constants = synthdef._control_ugens = None
+        return synthdef
+
+    @classmethod
+    def _from_ugens(
+        cls,
+        ugens,
+        name=None,
+        optimize=True,
+        parameter_names=None,
+        eliminate_common_subexpressions=False,
+    ):
+        """
+        Make a SynthDef which takes ownership of ``ugens``.
+
+        Unlike the initializer, this doesn't copy ``ugens`` first, but rewrites
+        them in place. Callers mustn't reuse them afterwards.
+        """
+        synthdef = cls.__new__(cls)
+        synthdef._name = name
+        synthdef._initialize_ugen_graph(
+            list(ugens),
+            optimize=optimize,
+            parameter_names=parameter_names,
+            eliminate_common_subexpressions=eliminate_common_subexpressions,
+        )
+        return synthdef
+
     @staticmethod
     def _initialize_topological_sort(ugens):
-        ugens = list(ugens)
         sort_bundles = collections.OrderedDict()
         width_first_antecedents = []
         for ugen in ugens:
+            if ugen in sort_bundles:
+                continue
             sort_bundles[ugen] = UGenSortBundle(ugen, width_first_antecedents)
             if isinstance(ugen, WidthFirstUGen):
                 width_first_antecedents.append(ugen)
-        for ugen in ugens:
-            sort_bundle = sort_bundles[ugen]
+        # Bundles initialize in ugen order, each adding its ugen to its
+        # antecedents' descendants, so descendants come out sorted by index.
+        for sort_bundle in sort_bundles.values():
             sort_bundle._initialize_topological_sort(sort_bundles)
-            sort_bundle.descendants[:] = sorted(
-                sort_bundles[ugen].descendants, key=lambda x: ugens.index(ugen)
-            )
         return sort_bundles
 
+    def _initialize_ugen_graph(
+        self,
+        ugens,
+        optimize=True,
+        parameter_names=None,
+        eliminate_common_subexpressions=False,
+    ):
+        assert all(isinstance(_, UGen) for _ in ugens)
+        ugens = self._cleanup_pv_chains(ugens)
+        ugens = self._cleanup_local_bufs(ugens)
+        if optimize:
+            ugens = self._optimize_ugen_graph(ugens)
+        if eliminate_common_subexpressions:
+            ugens = self._eliminate_common_subexpressions(ugens)
+        ugens = self._sort_ugens_topologically(ugens)
+        self._ugens = tuple(ugens)
+        self._constants = self._collect_constants(self._ugens)
+        self._control_ugens = self._collect_control_ugens(self._ugens)
+        self._indexed_parameters = self._collect_indexed_parameters(
+            self._control_ugens, parameter_names=parameter_names
+        )
+        self._compiled_ugen_graph = SynthDefCompiler.compile_ugen_graph(self)
+
     @staticmethod
     def _optimize_ugen_graph(ugens):
         sort_bundles = SynthDef._initialize_topological_sort(ugens)
@@ -564,12 +679,19 @@ class SynthDef:
 
     @staticmethod
     def _remap_controls(ugens, control_mapping):
+        # Match parameters by identity, as hashing them by value is slow.
+        control_mapping = {
+            (id(key.source), key.output_index): value
+            for key, value in control_mapping.items()
+        }
         for ugen in ugens:
             inputs = list(ugen.inputs)
             for i, input_ in enumerate(inputs):
-                if input_ in control_mapping:
-                    output_proxy = control_mapping[input_]
-                    inputs[i] = output_proxy
+                if not isinstance(input_, OutputProxy):
+                    continue
+                key = (id(input_.source), input_.output_index)
+                if key in control_mapping:
+                    inputs[i] = control_mapping[key]
             ugen._inputs = tuple(inputs)
 
     @staticmethod
@@ -814,10 +936,14 @@ class SynthDef:
 
     @property
     def constants(self):
+        if self._constants is None:
+            self._decompile_ugen_graph()
         return self._constants
 
     @property
     def control_ugens(self):
+        if self._control_ugens is None:
+            self._decompile_ugen_graph()
         return self._control_ugens
 
     @property
@@ -949,6 +1075,8 @@ class SynthDef:
 
     @property
     def ugens(self):
+        if self._ugens is None:
+            self._decompile_ugen_graph()
         return self._ugens
 
 
@@ -963,33 +1091,37 @@ class UGenSortBundle(SupriyaObject):
     def __init__(self, ugen, width_first_antecedents):
         self.antecedents = []
         self.descendants = []
+        self.is_available = False
         self.ugen = ugen
         self.width_first_antecedents = tuple(width_first_antecedents)
 
     ### PRIVATE METHODS ###
 
     def _initialize_topological_sort(self, sort_bundles):
+        # A ugen is among an antecedent's descendants exactly when the
+        # antecedent is among its antecedents, so one set guards both lists.
+        antecedents = set(self.antecedents)
         for input_ in self.ugen.inputs:
             if isinstance(input_, OutputProxy):
                 input_ = input_.source
             elif not isinstance(input_, UGen):
                 continue
             input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
+            if input_ not in antecedents:
+                antecedents.add(input_)
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
                 input_sort_bundle.descendants.append(self.ugen)
         for input_ in self.width_first_antecedents:
             input_sort_bundle = sort_bundles[input_]
-            if input_ not in self.antecedents:
+            if input_ not in antecedents:
+                antecedents.add(input_)
                 self.antecedents.append(input_)
-            if self.ugen not in input_sort_bundle.descendants:
                 input_sort_bundle.descendants.append(self.ugen)
 
     def _make_available(self, available_ugens):
-        if not self.antecedents:
-            if self.ugen not in available_ugens:
-                available_ugens.append(self.ugen)
+        if not self.antecedents and not self.is_available:
+            self.is_available = True
+            available_ugens.append(self.ugen)
 
     def _schedule(self, available_ugens, out_stack, sort_bundles):
         for ugen in reversed(self.descendants):
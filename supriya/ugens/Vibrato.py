@@ -43,3 +43,12 @@ class Vibrato(PureUGen):
     )
 
     _valid_calculation_rates = (CalculationRate.AUDIO, CalculationRate.CONTROL)
+
+    ### PRIVATE METHODS ###
+
+    def _get_expression_key(self):
+        # Rate and depth variation are randomized per instance.
+        for variation in (self.rate_variation, self.depth_variation):
+            if not isinstance(variation, float) or variation:
+                return None
+        return super()._get_expression_key()
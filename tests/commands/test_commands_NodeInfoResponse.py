@@ -0,0 +1,31 @@
+from supriya.commands import NodeInfo, NodeInfoResponse, Response
+from supriya.enums import NodeAction
+from supriya.osc import OscMessage
+
+
+def test_lazy_response():
+    message = OscMessage("/n_go", 1001, 1, 1000, -1, 0, "default", 1, "amplitude", 0.5)
+    response = Response.from_osc_message(message)
+    assert isinstance(response, NodeInfoResponse)
+    assert "_node_id" not in vars(response)
+    assert response == NodeInfoResponse(
+        action="/n_go",
+        node_id=1001,
+        parent_id=1,
+        previous_node_id=1000,
+        next_node_id=-1,
+        is_group=0,
+        synthdef_name="default",
+        synthdef_controls=(("amplitude", 0.5),),
+    )
+    assert "_osc_message" not in vars(response)
+
+
+def test_node_info():
+    message = OscMessage("/n_end", 1000, 1, -1, -1, 1, 1001, 1002)
+    node_info = NodeInfo.from_osc_message(message)
+    assert isinstance(node_info, tuple)
+    assert node_info.action == NodeAction.NODE_REMOVED
+    assert (node_info.head_node_id, node_info.tail_node_id) == (1001, 1002)
+    response = NodeInfoResponse.from_osc_message(message)
+    assert tuple(getattr(response, field) for field in NodeInfo._fields) == node_info
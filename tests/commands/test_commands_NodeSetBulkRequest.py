@@ -0,0 +1,226 @@
+import copy
+
+import numpy
+import pytest
+import uqbar.strings
+
+import supriya
+from supriya.commands import NodeSetBulkRequest, NodeSetRequest, RequestBundle
+from supriya.enums import RequestId
+from supriya.realtime import Server
+from supriya.realtime.fakes import FakeScsynth
+
+
+def test_to_osc():
+    node_ids = numpy.arange(1000, 1100)
+    values = numpy.linspace(0.0, 1.0, 100)
+    request = NodeSetBulkRequest(node_ids=node_ids, control="amplitude", values=values)
+    assert request.request_id == RequestId.NODE_SET
+    assert request.to_osc().contents == tuple(
+        NodeSetRequest(node_id=node_id, amplitude=value).to_osc()
+        for node_id, value in zip(node_ids.tolist(), values.tolist())
+    )
+    with pytest.raises(ValueError):
+        NodeSetBulkRequest(node_ids=node_ids, control="amplitude", values=values[:-1])
+
+
+@pytest.mark.parametrize(
+    "node_ids, control, values",
+    [
+        ([1000, 1001], "amplitude", [0.5]),
+        ([1000, 1001], "amplitude", numpy.zeros((3, 2))),
+        ([1000, 1001], None, [0.5, 0.25]),
+        ([1000, 1001], 1.5, [0.5, 0.25]),
+        ([1000, 1001], "amplitude", numpy.zeros((2, 2, 2))),
+    ],
+)
+def test_invalid(node_ids, control, values):
+    with pytest.raises(ValueError):
+        NodeSetBulkRequest(node_ids=node_ids, control=control, values=values)
+    with pytest.raises(TypeError):
+        NodeSetBulkRequest()
+
+
+def test_value_object():
+    requests = [
+        NodeSetBulkRequest(
+            node_ids=numpy.arange(1000, 1002),
+            control=2,
+            values=numpy.array([[0.5, 0.25], [1.0, 0.75]]),
+        ),
+        NodeSetBulkRequest(
+            node_ids=[1000, 1001], control=2, values=[[0.5, 0.25], [1.0, 0.75]]
+        ),
+    ]
+    assert requests[0] == requests[1]
+    assert hash(requests[0]) == hash(requests[1])
+    assert requests[0] != NodeSetBulkRequest(
+        node_ids=[1000, 1001], control=2, values=[[0.5, 0.25], [1.0, 0.5]]
+    )
+    assert repr(requests[1]) == uqbar.strings.normalize(
+        """
+        NodeSetBulkRequest(
+            (1000, 1001),
+            2,
+            (
+                (0.5, 0.25),
+                (1.0, 0.75),
+                ),
+            )
+        """
+    )
+    for request in requests:
+        assert copy.copy(request) == request
+    values = numpy.zeros(2)
+    request = NodeSetBulkRequest(node_ids=[1000, 1001], control="gate", values=values)
+    with pytest.raises(ValueError):
+        request.values[0] = 1.0
+    values[0] = 1.0
+    assert values.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "control, values",
+    [
+        ("frequency", numpy.random.random(5000)),
+        (3, numpy.random.random(5000).tolist()),
+        ("amplitude", numpy.random.random((5000, 7))),
+        (0, numpy.random.random((5000, 3)).tolist()),
+    ],
+)
+def test_to_osc_bundles(control, values):
+    request = NodeSetBulkRequest(
+        node_ids=list(range(1000, 6000)), control=control, values=values
+    )
+    bundles = request.to_osc_bundles(maximum_packet_size=1024, timestamp=1.5)
+    assert len(bundles) > 1
+    assert all(len(x.to_datagram()) <= 1024 for x in bundles)
+    # Packing is tight: no bundle could have fit the next bundle's first message.
+    for bundle, next_bundle in zip(bundles, bundles[1:]):
+        datagram = next_bundle.contents[0].to_datagram()
+        assert len(bundle.to_datagram()) + 4 + len(datagram) > 1024
+    assert all(x.timestamp == 1.5 for x in bundles)
+    messages = [message for bundle in bundles for message in bundle.contents]
+    assert [x.to_datagram() for x in messages] == [
+        x.to_datagram() for x in request.to_osc().contents
+    ]
+    requests = request.partition(maximum_packet_size=1024)
+    assert [x.to_osc().to_datagram() for x in requests] == [
+        supriya.osc.OscBundle(contents=x.contents).to_datagram() for x in bundles
+    ]
+
+
+def test_to_osc_bundles_bus_values():
+    # Bus-mapping strings encode larger than numbers, and grow with the index.
+    values = ["c0", "a1", "c100000", 0.5, None, True] * 500
+    request = NodeSetBulkRequest(
+        node_ids=list(range(1000, 4000)), control="frequency", values=values
+    )
+    bundles = request.to_osc_bundles(maximum_packet_size=1024)
+    assert all(len(x.to_datagram()) <= 1024 for x in bundles)
+    messages = [message for bundle in bundles for message in bundle.contents]
+    assert messages == list(request.to_osc().contents)
+    requests = request.partition(maximum_packet_size=1024)
+    assert all(len(x.to_osc().to_datagram()) <= 1024 for x in requests)
+    bundles = RequestBundle.partition([request], maximum_packet_size=1024)
+    assert all(len(x.to_datagram()) <= 1024 for x in bundles)
+    assert sum(len(x.to_osc().contents) for x in bundles) == 3000
+
+
+def test_RequestBundle():
+    request = NodeSetBulkRequest(node_ids=[1000, 1001], control="gate", values=[0, 0])
+    request_bundle = RequestBundle(timestamp=2.0, contents=[request])
+    assert request_bundle.to_list() == [
+        2.0,
+        [["/n_set", 1000, "gate", 0], ["/n_set", 1001, "gate", 0]],
+    ]
+    request = NodeSetBulkRequest(
+        node_ids=numpy.arange(5000), control="gate", values=numpy.zeros(5000)
+    )
+    bundles = RequestBundle.partition([request], timestamp=2.0)
+    assert len(bundles) > 1
+    assert all(len(x.to_datagram()) <= 8192 for x in bundles)
+    assert sum(len(x.to_osc().contents) for x in bundles) == 5000
+
+
+def test_Server_send():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            group = supriya.Group().allocate(target_node=server)
+            synths = [supriya.Synth().allocate(target_node=group) for _ in range(20)]
+            node_ids = numpy.array([x.node_id for x in synths])
+            NodeSetBulkRequest(
+                node_ids=node_ids,
+                control="frequency",
+                values=numpy.arange(20) * 100.0,
+            ).communicate(server=server, sync=False)
+            server.sync()
+            tree = fake.query_tree()
+            frequencies = {
+                synth.node_id: control.control_value
+                for synth in tree.children[0].children[0]
+                for control in synth
+                if control.control_name_or_index == "frequency"
+            }
+            assert frequencies == {x.node_id: i * 100.0 for i, x in enumerate(synths)}
+            assert [x["frequency"] for x in synths] == [i * 100.0 for i in range(20)]
+        finally:
+            server.disconnect()
+
+
+def test_apply_local():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            synths = [supriya.Synth().allocate(target_node=server) for _ in range(3)]
+            node_ids = [x.node_id for x in synths]
+            NodeSetBulkRequest(
+                node_ids=node_ids + [server.default_group.node_id],
+                control="amplitude",
+                values=["c3", 0.25, None, 0.0],
+            ).communicate(server=server, sync=False)
+            assert str(synths[0]["amplitude"]) == "c3"
+            assert synths[0]["amplitude"].server is server
+            assert synths[1]["amplitude"] == 0.25
+            assert synths[2]["amplitude"] == 0.1
+            frequency_index = synths[0].controls["frequency"].index
+            NodeSetBulkRequest(
+                node_ids=node_ids,
+                control=frequency_index,
+                values=numpy.array([[110.0, 0.5], [220.0, 0.5], [330.0, 0.5]]),
+            ).communicate(server=server, sync=False)
+            assert [x["frequency"] for x in synths] == [110.0, 220.0, 330.0]
+            (name,) = [
+                x.name
+                for x in synths[0].controls._synth_controls
+                if x.index == frequency_index + 1
+            ]
+            assert [x[name] for x in synths] == [0.5, 0.5, 0.5]
+        finally:
+            server.disconnect()
+
+
+def test_Session():
+    session = supriya.Session()
+    with session.at(0):
+        synths = [session.add_synth(duration=2) for _ in range(3)]
+        group = session.add_group(duration=2)
+    with session.at(1):
+        for i, synth in enumerate(synths):
+            synth["frequency"] = 440.0 + i
+        group["gate"] = 0
+    request_bundle = session._to_non_xrefd_request_bundles()[1]
+    assert [type(x) for x in request_bundle.contents] == [
+        NodeSetRequest,
+        NodeSetBulkRequest,
+    ]
+    assert session.to_lists()[1] == [
+        1.0,
+        [
+            ["/n_set", 1003, "gate", 0.0],
+            ["/n_set", 1002, "frequency", 442.0],
+            ["/n_set", 1001, "frequency", 441.0],
+            ["/n_set", 1000, "frequency", 440.0],
+        ],
+    ]
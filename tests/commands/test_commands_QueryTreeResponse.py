@@ -0,0 +1,57 @@
+from supriya.commands import QueryTreeResponse
+from supriya.osc import OscMessage
+
+
+def test_deep_tree():
+    # A chain of nested groups deeper than the default recursion limit.
+    depth = 5000
+    contents = [0]
+    for node_id in range(depth):
+        contents.extend([node_id, 1])
+    contents.extend([depth, -1, "default"])
+    message = OscMessage("/g_queryTree.reply", *contents)
+    response = QueryTreeResponse.from_osc_message(message)
+    node = response.query_tree_group
+    assert response.node_id == 0
+    for node_id in range(depth):
+        assert node.node_id == node_id
+        assert len(node.children) == 1
+        node = node.children[0]
+    assert node.node_id == depth
+    assert node.synthdef_name == "default"
+
+
+def test_controls():
+    message = OscMessage(
+        "/g_queryTree.reply",
+        1,
+        0,
+        3,
+        1,
+        0,
+        1000,
+        -1,
+        "default",
+        2,
+        "amplitude",
+        0.5,
+        3,
+        "c0",
+        1001,
+        2,
+        1002,
+        -1,
+        "test",
+        0,
+        1003,
+        0,
+    )
+    group = QueryTreeResponse.from_osc_message(message).query_tree_group
+    assert [x.node_id for x in group.children] == [1, 1000, 1001]
+    synth = group.children[1]
+    assert [(x.control_name_or_index, x.control_value) for x in synth.controls] == [
+        ("amplitude", 0.5),
+        (3, "c0"),
+    ]
+    assert [x.node_id for x in group.children[2].children] == [1002, 1003]
+    assert group.children[2].children[0].controls == ()
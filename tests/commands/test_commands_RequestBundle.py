@@ -0,0 +1,33 @@
+import numpy
+
+from supriya.commands import (
+    NodeFreeRequest,
+    NodeSetBulkRequest,
+    NodeSetRequest,
+    RequestBundle,
+)
+
+
+def test_partition():
+    requests = [NodeSetRequest(node_id=1000 + i, amplitude=0.5) for i in range(1000)]
+    requests.insert(500, RequestBundle(contents=[NodeFreeRequest(node_ids=[1])]))
+    requests.insert(
+        750,
+        NodeSetBulkRequest(
+            node_ids=numpy.arange(3000), control="gate", values=numpy.zeros(3000)
+        ),
+    )
+    bundles = RequestBundle.partition(
+        requests, timestamp=2.5, maximum_packet_size=1024
+    )
+    osc_bundles = [x.to_osc() for x in bundles]
+    assert all(x.timestamp == 2.5 for x in osc_bundles)
+    assert all(len(x.to_datagram()) <= 1024 for x in osc_bundles)
+    assert [x for bundle in osc_bundles for x in bundle.contents] == list(
+        RequestBundle(contents=requests).to_osc().contents
+    )
+    # Cached datagrams match a fresh encoding.
+    assert [x.to_datagram() for x in osc_bundles] == [
+        RequestBundle(timestamp=2.5, contents=x.contents).to_datagram()
+        for x in bundles
+    ]
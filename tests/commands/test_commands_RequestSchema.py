@@ -0,0 +1,126 @@
+import pytest
+
+import supriya
+from supriya.assets.synthdefs import default
+from supriya.commands import (
+    NodeFreeRequest,
+    NodeSetRequest,
+    RequestSchema,
+    SyncRequest,
+    SynthNewRequest,
+)
+from supriya.realtime.fakes import FakeScsynth
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        NodeFreeRequest(node_ids=1000),
+        NodeFreeRequest(node_ids=[1000, 1001, 1002]),
+        NodeSetRequest(node_id=1000),
+        NodeSetRequest(node_id=1000, frequency=443.0, gate=0, out="c3"),
+        SyncRequest(sync_id=23),
+        SynthNewRequest(synthdef=default, node_id=1000, target_node_id=1),
+        SynthNewRequest(
+            add_action="ADD_BEFORE",
+            amplitude=0.5,
+            node_id=1000,
+            synthdef="default",
+            target_node_id=1001,
+        ),
+        # Non-scalar values fall back to encoding via OscMessage.
+        SynthNewRequest(
+            node_id=1000, synthdef="default", target_node_id=1, pitch=[60, 64, 67]
+        ),
+        NodeSetRequest(node_id=1000, gate=True),
+    ],
+)
+def test_to_datagram(request_):
+    assert request_.to_datagram() == request_.to_osc().to_datagram()
+
+
+def test_to_datagram_with_placeholders():
+    synth = supriya.Synth()
+    request = SynthNewRequest(synthdef=default, node_id=synth, target_node_id=1)
+    assert request.to_osc(with_placeholders=True) == supriya.osc.OscMessage(
+        "/s_new", "default", -1, 0, 1
+    )
+    assert (
+        request.to_datagram(with_placeholders=True)
+        == request.to_osc(with_placeholders=True).to_datagram()
+    )
+
+
+def test_equality():
+    request_a = NodeSetRequest(node_id=1000, frequency=443.0, gate=0)
+    request_b = NodeSetRequest(gate=0, frequency=443.0, node_id=1000)
+    request_c = NodeSetRequest(node_id=1000, frequency=443.0)
+    assert request_a == request_b
+    assert hash(request_a) == hash(request_b)
+    assert request_a != request_c
+    assert NodeFreeRequest(node_ids=1000) == NodeFreeRequest(node_ids=[1000])
+    assert NodeFreeRequest(node_ids=[1000]) != SyncRequest(sync_id=1000)
+
+
+def test_fields():
+    assert SynthNewRequest(synthdef="default", node_id=1000, gate=0).kwargs == (
+        ("gate", 0),
+    )
+    assert NodeSetRequest(node_id=1000, gate=0).gate == 0
+    with pytest.raises(AttributeError):
+        NodeSetRequest(node_id=1000).gate
+    with pytest.raises(ValueError):
+        RequestSchema(("kwargs", "pairs"), ("node_id", "node_id"))
+    with pytest.raises(ValueError):
+        RequestSchema(("node_id", "uuid"))
+
+
+def test_NodeSetRequest_kwargs():
+    # Control settings are stored as sorted pairs, like SynthNewRequest's,
+    # rather than as a dict.
+    request = NodeSetRequest(node_id=1000, gate=0, frequency=443.0)
+    assert request._kwargs == (("frequency", 443.0), ("gate", 0))
+    assert request.kwargs == request._kwargs
+    assert request.frequency == 443.0
+
+
+def test_SyncRequest_sync_id():
+    assert SyncRequest(sync_id="23").sync_id == 23
+    with pytest.raises(TypeError):
+        SyncRequest()
+
+
+def test_SynthNewRequest_synthdef():
+    # Invalid SynthDefs raise ValueError, rather than failing an assertion.
+    with pytest.raises(ValueError):
+        SynthNewRequest(synthdef=None)
+    with pytest.raises(ValueError):
+        SynthNewRequest(synthdef=1000)
+
+
+def test_send_without_to_osc(monkeypatch):
+    # Schema requests are sent as datagrams, only built as OscMessages when
+    # out-logging or a capture needs one.
+    with FakeScsynth() as fake:
+        server = supriya.Server().connect(port=fake.port)
+        try:
+            synth = supriya.Synth().allocate(target_node=server)
+            with monkeypatch.context() as context:
+                context.setattr(NodeSetRequest, "to_osc", None)
+                NodeSetRequest(node_id=synth, amplitude=0.25).communicate(
+                    server=server, sync=False
+                )
+            with server.osc_protocol.capture() as transcript:
+                NodeSetRequest(node_id=synth, frequency=443.0).communicate(
+                    server=server, sync=False
+                )
+            server.sync()
+            controls = fake.query_tree().children[0].children[0].controls
+            assert {x.control_name_or_index: x.control_value for x in controls}[
+                "amplitude"
+            ] == 0.25
+            assert [x.message for x in transcript] == [
+                supriya.osc.OscMessage("/n_set", 1000, "frequency", 443.0)
+            ]
+        finally:
+            server.disconnect()
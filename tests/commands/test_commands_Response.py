@@ -0,0 +1,43 @@
+import pytest
+
+from supriya.commands import (
+    ControlBusSetContiguousResponse,
+    ControlBusSetResponse,
+    Response,
+    TriggerResponse,
+)
+from supriya.osc import OscMessage
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        (OscMessage("/tr", 1000, 3, 0.5), TriggerResponse(1000, 3, 0.5)),
+        (
+            OscMessage("/c_set", 0, 0.5, 1, 0.25),
+            ControlBusSetResponse(
+                items=(
+                    ControlBusSetResponse.Item(0, 0.5),
+                    ControlBusSetResponse.Item(1, 0.25),
+                )
+            ),
+        ),
+        (
+            OscMessage("/c_setn", 0, 2, 0.5, 0.25, 8, 1, 1.0),
+            ControlBusSetContiguousResponse(
+                items=(
+                    ControlBusSetContiguousResponse.Item((0.5, 0.25), 0),
+                    ControlBusSetContiguousResponse.Item((1.0,), 8),
+                )
+            ),
+        ),
+    ],
+)
+def test_lazy_response(message, expected):
+    response = Response.from_osc_message(message)
+    assert type(response) is type(expected)
+    assert vars(response) == {"_osc_message": message}
+    assert response == expected
+    assert "_osc_message" not in vars(response)
+    with pytest.raises(AttributeError):
+        Response.from_osc_message(message).missing
@@ -0,0 +1,43 @@
+import random
+
+import pytest
+
+from supriya.osc import OscBundle, OscMessage
+
+
+@pytest.mark.parametrize("maximum_packet_size", [96, 512, 8192])
+def test_partition(maximum_packet_size):
+    random.seed(0)
+    messages = [
+        OscMessage(
+            "/test", i, "x" * random.randint(0, 40), *range(random.randint(0, 8))
+        )
+        for i in range(500)
+    ]
+    bundles = OscBundle.partition(
+        messages, timestamp=1.5, maximum_packet_size=maximum_packet_size
+    )
+    assert [x for bundle in bundles for x in bundle.contents] == messages
+    assert all(x.timestamp == 1.5 for x in bundles)
+    for bundle in bundles:
+        datagram = bundle.to_datagram()
+        assert len(datagram) <= maximum_packet_size or len(bundle.contents) == 1
+        # Cached datagrams encode identically to a fresh bundle.
+        fresh_bundle = OscBundle(timestamp=1.5, contents=bundle.contents)
+        assert datagram == fresh_bundle.to_datagram()
+    # Packing is tight: no bundle could have taken the next bundle's first message.
+    for bundle, next_bundle in zip(bundles, bundles[1:]):
+        datagram = next_bundle.contents[0].to_datagram()
+        assert len(bundle.to_datagram()) + 4 + len(datagram) > maximum_packet_size
+
+
+def test_partition_oversize():
+    messages = [OscMessage("/a", b"x" * 100), OscMessage("/b", 1), OscMessage("/c", 2)]
+    bundles = OscBundle.partition(messages, maximum_packet_size=64)
+    assert [x.contents for x in bundles] == [tuple(messages[:1]), tuple(messages[1:])]
+
+
+def test_partition_cache_invalidation():
+    (bundle,) = OscBundle.partition([OscMessage("/a", 1)])
+    bundle.contents = (OscMessage("/b", 2),)
+    assert OscBundle.from_datagram(bundle.to_datagram()).contents == bundle.contents
@@ -0,0 +1,94 @@
+import pytest
+
+from supriya.osc import OscMessage
+from supriya.osc.callbacks import (
+    OscCallback,
+    OscCallbackIndex,
+    compile_address_pattern,
+)
+
+
+@pytest.mark.parametrize(
+    "pattern, address, expected",
+    [
+        ("/n_go", "/n_go", True),
+        ("/n_?o", "/n_go", True),
+        ("/n_*", "/n_end", True),
+        ("/*", "/n_end/foo", False),
+        ("/*/foo", "/n_end/foo", True),
+        ("/b_[a-s]*", "/b_info", True),
+        ("/b_[a-s]*", "/b_zero", False),
+        ("/b_[!a-s]*", "/b_zero", True),
+        ("/[-x]", "/-", True),
+        ("/{n_go,n_end}", "/n_end", True),
+        ("/{n_go,n_end}", "/n_off", False),
+        ("/status.reply", "/statusXreply", False),
+    ],
+)
+def test_compile_address_pattern(pattern, address, expected):
+    assert bool(compile_address_pattern(pattern).fullmatch(address)) == expected
+
+
+def test_compile_address_pattern_unterminated():
+    with pytest.raises(ValueError):
+        compile_address_pattern("/b_[a-z")
+    with pytest.raises(ValueError):
+        compile_address_pattern("/{n_go,n_end")
+
+
+def test_match():
+    index = OscCallbackIndex()
+    callbacks = {
+        name: OscCallback(pattern=pattern, procedure=print)
+        for name, pattern in [
+            ("address", ("/n_end",)),
+            ("node", ("/n_end", 1000)),
+            ("other_node", ("/n_end", 1001)),
+            ("wildcard", ("/n_*",)),
+            ("wildcard_node", ("/{n_go,n_end}", 1000)),
+            ("trigger", ("/tr", 1000, 7)),
+        ]
+    }
+    for callback in callbacks.values():
+        index.add(callback)
+    assert len(index) == len(callbacks)
+
+    def match(*message):
+        return [
+            name
+            for callback in index.match(OscMessage(*message))
+            for name, x in callbacks.items()
+            if x is callback
+        ]
+
+    assert match("/n_end", 1000, 0) == ["address", "node", "wildcard", "wildcard_node"]
+    assert match("/n_go", 1001) == ["wildcard"]
+    assert match("/n_end", [1000]) == ["address", "wildcard"]
+    assert match("/tr", 1000, 7, 0.5) == ["trigger"]
+    assert match("/tr", 1000, 8) == []
+    index.remove(callbacks["wildcard"])
+    index.remove(callbacks["node"])
+    assert match("/n_end", 1000, 0) == ["address", "wildcard_node"]
+    assert callbacks["node"] not in index
+    assert len(index) == len(callbacks) - 2
+
+
+def test_remove_prunes():
+    index = OscCallbackIndex()
+    callbacks = [
+        OscCallback(
+            pattern=("/done", "/b_alloc", i),
+            failure_pattern=("/fail", "/b_alloc"),
+            procedure=print,
+        )
+        for i in range(100)
+    ] + [OscCallback(pattern=("/n_*", i), procedure=print) for i in range(100)]
+    for callback in callbacks:
+        index.add(callback)
+    assert len(list(index.match(OscMessage("/fail", "/b_alloc")))) == 100
+    for callback in callbacks:
+        index.remove(callback)
+    assert len(index) == 0
+    assert not index._root.children
+    assert not index._wildcards
+    assert not list(index.match(OscMessage("/n_end", 1)))
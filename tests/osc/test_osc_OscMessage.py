@@ -1,3 +1,4 @@
+import pytest
 import uqbar.strings
 
 import supriya
@@ -51,3 +52,128 @@ def test():
         ), ['a', 'b', ['c', 'd']])
     """
     )
+
+
+def test_from_datagram_large():
+    contents = []
+    for i in range(256):
+        contents.extend([i, float(i) / 2, "c{}".format(i)])
+    osc_message = supriya.osc.OscMessage("/c_setn", *contents)
+    datagram = osc_message.to_datagram()
+    assert len(datagram) > 4096
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(memoryview(datagram)) == osc_message
+    assert supriya.osc.OscMessage.from_datagram(bytearray(datagram)) == osc_message
+
+
+def test_from_datagram_blob():
+    osc_message = supriya.osc.OscMessage("/d_recv", b"SCgf\x00\x00\x00\x02\xff")
+    datagram = osc_message.to_datagram()
+    new_osc_message = supriya.osc.OscMessage.from_datagram(datagram)
+    assert new_osc_message.contents == (b"SCgf\x00\x00\x00\x02\xff",)
+    # Blob lengths are unsigned, so a high bit overruns rather than rewinds.
+    datagram = b"/foo\x00\x00\x00\x00,b\x00\x00\xff\xff\xff\xfc" + b"\x00" * 8
+    with pytest.raises(ValueError):
+        supriya.osc.OscMessage.from_datagram(datagram)
+
+
+def test_from_datagram_integer_address():
+    osc_message = supriya.osc.OscMessage(9, "default", 1000, 0, 1)
+    datagram = osc_message.to_datagram()
+    assert supriya.osc.OscMessage.from_datagram(datagram) == osc_message
+    bundle = supriya.osc.OscBundle(contents=[osc_message])
+    assert supriya.osc.OscBundle.from_datagram(bundle.to_datagram()) == bundle
+    # Integer-addressed completion messages decode from blobs too.
+    osc_message = supriya.osc.OscMessage(5, b"SCgf", osc_message)
+    assert supriya.osc.OscMessage.from_datagram(osc_message.to_datagram()) == (
+        osc_message
+    )
+    # An empty string address is all zeros, and stays a string.
+    osc_message = supriya.osc.OscMessage("", 1)
+    assert supriya.osc.OscMessage.from_datagram(osc_message.to_datagram()) == (
+        osc_message
+    )
+
+
+def test_from_datagram_truncated():
+    datagram = supriya.osc.OscMessage("/foo", 1, 2.5, "bar").to_datagram()
+    with pytest.raises(Exception):
+        supriya.osc.OscMessage.from_datagram(datagram[:-8])
+    bundle = supriya.osc.OscBundle(contents=[supriya.osc.OscMessage("/foo", 1, 2)])
+    datagram = bundle.to_datagram()
+    with pytest.raises(ValueError):
+        supriya.osc.OscBundle.from_datagram(datagram[:-4])
+
+
+@pytest.mark.parametrize(
+    "osc_message",
+    [
+        supriya.osc.OscMessage("/s_new", "default", 1000, 0, 1, "amplitude", 0.5),
+        supriya.osc.OscMessage("/n_set", 1000, "frequency", 443.0, "gate", 0),
+        supriya.osc.OscMessage("/foo", True, False, None, "", "abc", "abcd"),
+        supriya.osc.OscMessage("/d_recv", b"SCgf", b"SCgf\x00", bytearray(b"xy")),
+        supriya.osc.OscMessage(
+            "/foo", supriya.AddAction.ADD_TO_TAIL, supriya.osc.OscMessage("/bar", 1)
+        ),
+        supriya.osc.OscMessage(48, 1, 2.5),
+        supriya.osc.OscMessage("/foo", [1, [2.5, "three"]], 4),
+    ],
+)
+def test_to_datagram_compiled(osc_message):
+    type_tags, encoded_contents = ",", b""
+    for value in osc_message.contents:
+        sub_type_tags, sub_encoded_contents = osc_message._encode_value(value)
+        type_tags += sub_type_tags
+        encoded_contents += sub_encoded_contents
+    if isinstance(osc_message.address, str):
+        encoded_address = osc_message._encode_string(osc_message.address)
+    else:
+        encoded_address = osc_message.address.to_bytes(4, "big")
+    expected = encoded_address + osc_message._encode_string(type_tags)
+    expected += encoded_contents
+    assert osc_message.to_datagram() == expected
+    bundle = supriya.osc.OscBundle(contents=[osc_message, osc_message])
+    datagram = bundle.to_datagram()
+    assert datagram[16:20] == len(expected).to_bytes(4, "big")
+    assert datagram[20 : 20 + len(expected)] == expected
+    assert datagram[-len(expected) :] == expected
+
+
+def test_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+    values = [x / 8 for x in range(512)]
+    for array in (
+        numpy.array(values, dtype="float32"),
+        numpy.array(values, dtype=">f4"),
+        numpy.array(values, dtype="float64"),
+        numpy.array(values, dtype="float32")[::-1][::-1],
+    ):
+        osc_message = supriya.osc.OscMessage("/b_setn", 1, 0, 512, array)
+        expected = supriya.osc.OscMessage("/b_setn", 1, 0, 512, *values)
+        assert osc_message.to_datagram() == expected.to_datagram()
+    ints = numpy.arange(16, dtype="int32")
+    osc_message = supriya.osc.OscMessage("/foo", ints, "bar", [ints[:2]])
+    expected = supriya.osc.OscMessage("/foo", *range(16), "bar", [0, 1])
+    assert osc_message.to_datagram() == expected.to_datagram()
+    for dtype in ("int64", "uint32", "uint64"):
+        ints = numpy.array([0, 2 ** 31 - 1], dtype=dtype)
+        osc_message = supriya.osc.OscMessage("/foo", ints)
+        expected = supriya.osc.OscMessage("/foo", 0, 2 ** 31 - 1)
+        assert osc_message.to_datagram() == expected.to_datagram()
+        with pytest.raises(ValueError):
+            supriya.osc.OscMessage("/foo", ints + 1).to_datagram()
+    with pytest.raises(ValueError):
+        supriya.osc.OscMessage("/foo", -numpy.arange(3) - 2 ** 31).to_datagram()
+    # Long runs decode into big-endian arrays viewing the datagram
+    datagram = supriya.osc.OscMessage("/c_setn", 0, 512, *values).to_datagram()
+    decoded = supriya.osc.OscMessage.from_datagram(datagram, arrays=True)
+    assert decoded.contents[:2] == (0, 512)
+    assert isinstance(decoded.contents[2], numpy.ndarray)
+    assert decoded.contents[2].dtype == numpy.dtype(">f4")
+    assert decoded.contents[2].tolist() == values
+    assert decoded.to_datagram() == datagram
+    assert supriya.osc.OscMessage.from_datagram(datagram).contents[2:] == tuple(
+        values
+    )
+    with pytest.raises(ValueError):
+        supriya.osc.OscMessage.from_datagram(datagram[:-8], arrays=True)
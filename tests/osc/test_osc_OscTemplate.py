@@ -0,0 +1,59 @@
+import pytest
+
+from supriya.osc import OscBundle, OscMessage, OscTemplate
+
+
+def test_message():
+    message = OscMessage("/n_set", 1000, "amplitude", 0.5, "frequency", 440.0)
+    template = OscTemplate(message, {"node_id": 0, "frequency": 4})
+    assert template.slots == ("frequency", "node_id")
+    assert template.to_datagram() == message.to_datagram()
+    assert template.size == len(message.to_datagram())
+    for i in range(3):
+        datagram = template.patch(node_id=1000 + i, frequency=440.0 * i)
+        assert bytes(datagram) == (
+            OscMessage(
+                "/n_set", 1000 + i, "amplitude", 0.5, "frequency", 440.0 * i
+            ).to_datagram()
+        )
+    # Unpatched slots keep their last value.
+    template.patch(node_id=2000)
+    assert OscMessage.from_datagram(template.to_datagram()) == OscMessage(
+        "/n_set", 2000, "amplitude", 0.5, "frequency", 880.0
+    )
+
+
+def test_bundle():
+    bundle = OscBundle(
+        timestamp=10.0,
+        contents=[
+            OscMessage("/s_new", "default", 1000, 0, 1, "frequency", 440.0),
+            OscMessage(21, 1000, "gate", b"blob", 1),
+        ],
+    )
+    template = OscTemplate(bundle, {"node_id": [(0, 1), (1, 0)], "gate": (1, 3)})
+    assert template.slots == ("gate", "node_id", "timestamp")
+    assert template.to_datagram() == bundle.to_datagram()
+    datagram = template.patch(node_id=1001, gate=0, timestamp=12.5)
+    assert bytes(datagram) == (
+        OscBundle(
+            timestamp=12.5,
+            contents=[
+                OscMessage("/s_new", "default", 1001, 0, 1, "frequency", 440.0),
+                OscMessage(21, 1001, "gate", b"blob", 0),
+            ],
+        ).to_datagram()
+    )
+    template.patch(timestamp=None)
+    assert OscBundle.from_datagram(template.to_datagram()).timestamp is None
+
+
+def test_errors():
+    message = OscMessage("/s_new", "default", 1000)
+    with pytest.raises(ValueError):
+        OscTemplate(message, {"synthdef": 0})
+    bundle = OscBundle(contents=[OscBundle(contents=[message])])
+    with pytest.raises(ValueError):
+        OscTemplate(bundle, {"node_id": (0, 1)})
+    with pytest.raises(KeyError):
+        OscTemplate(message, {"node_id": 1}).patch(frequency=440.0)
@@ -0,0 +1,79 @@
+import pytest
+
+from supriya.osc import OscMessage, Recording
+from supriya.realtime import Server
+from supriya.realtime.fakes import FakeScsynth
+
+
+def record(fake):
+    server = Server().connect(port=fake.port)
+    try:
+        with Recording(server.osc_protocol) as recording:
+            for i in range(8):
+                server.send(["/c_set", i, i * 0.5])
+            for i in range(8):
+                server.send(["/c_get", i])
+            server.sync()
+    finally:
+        server.disconnect()
+    return recording
+
+
+def test_save_load(tmp_path):
+    with FakeScsynth() as fake:
+        recording = record(fake)
+    labels = [label for _, label, _ in recording]
+    assert labels.count("S") == 17
+    assert labels.count("R") >= 9
+    path = tmp_path / "traffic.oscrec"
+    recording.save(path)
+    loaded = Recording.load(path)
+    assert list(loaded._entries) == list(recording._entries)
+    assert loaded.byte_count == recording.byte_count
+    path.write_bytes(path.read_bytes()[:-3])
+    with pytest.raises(ValueError):
+        Recording.load(path)
+    path.write_bytes(b"not a recording")
+    with pytest.raises(ValueError):
+        Recording.load(path)
+
+
+@pytest.mark.parametrize("speed", [None, 1.0, 4.0])
+def test_replay(speed):
+    with FakeScsynth() as fake:
+        recording = record(fake)
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            # Replay stops waiting as soon as every reply is in, so a generous
+            # timeout costs nothing unless the machine is under load.
+            report = recording.replay(server, speed=speed, timeout=10.0)
+        finally:
+            server.disconnect()
+    if speed:
+        timestamps = [timestamp for timestamp, label, _ in recording if label == "S"]
+        assert report.duration >= (timestamps[-1] - timestamps[0]) / speed
+    assert report.sent_count == 17
+    assert report.matched_count >= 9
+    assert report.mismatched_count == 0
+    assert len(report.latencies) == report.matched_count
+    assert all(x >= 0 for x in report.latencies)
+    assert report.message_rate > 0
+    assert "latency: p50=" in str(report)
+
+
+def test_replay_mismatch():
+    recording = Recording(None)
+    recording._record("S", OscMessage("/c_get", 0))
+    recording._record("R", OscMessage("/c_set", 0, 1.0))
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            report = recording.replay(server, speed=None, timeout=0.25)
+        finally:
+            server.disconnect()
+    assert report.matched_count == 0
+    assert report.missing == [OscMessage("/c_set", 0, 1.0).to_datagram()]
+    assert report.unexpected == [OscMessage("/c_set", 0, 0.0).to_datagram()]
+    assert report.latencies == []
+    assert report.percentile(50) is None
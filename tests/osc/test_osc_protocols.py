@@ -1,14 +1,24 @@
 import asyncio
+import socket
+import socketserver
+import threading
 import time
 
 import pytest
 
 from supriya.osc import (
     AsyncOscProtocol,
+    AsyncTcpOscProtocol,
+    CaptureEntry,
     HealthCheck,
+    OscBundle,
+    OscMessage,
+    OscTemplate,
     ThreadedOscProtocol,
+    ThreadedTcpOscProtocol,
     find_free_port,
 )
+from supriya.osc.protocols import OscProtocolOffline
 from supriya.realtime.protocols import (
     AsyncProcessProtocol,
     SyncProcessProtocol,
@@ -71,3 +81,400 @@ def test_ThreadedOscProtocol():
             break
     assert not osc_protocol.is_running
     assert healthcheck_failed
+
+
+def test_OscProtocol_receive_bundle():
+    def procedure(message):
+        received.append(message)
+
+    received = []
+    osc_protocol = AsyncOscProtocol()
+    osc_protocol.register(pattern="/n_go", procedure=procedure)
+    osc_protocol.register(pattern="/n_end", procedure=procedure, once=True)
+    osc_bundle = OscBundle(
+        contents=(
+            OscMessage("/n_go", 1000),
+            OscBundle(contents=(OscMessage("/n_end", 1000), OscMessage("/n_go", 1001))),
+            OscMessage("/n_end", 1001),
+        )
+    )
+    with osc_protocol.capture() as transcript:
+        osc_protocol._validate_receive(osc_bundle.to_datagram())
+        osc_protocol._validate_receive(OscMessage("/n_go", 1002).to_datagram())
+        osc_protocol._validate_receive(OscMessage("/n_end", 1002).to_datagram())
+    assert received == [
+        OscMessage("/n_go", 1000),
+        OscMessage("/n_end", 1000),
+        OscMessage("/n_go", 1001),
+        OscMessage("/n_go", 1002),
+    ]
+    assert [entry.message for entry in transcript] == [
+        osc_bundle,
+        OscMessage("/n_go", 1002),
+        OscMessage("/n_end", 1002),
+    ]
+    assert [label for _, label, _ in transcript] == ["R", "R", "R"]
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_receive_burst():
+    def procedure(message):
+        received.append(message.contents[0])
+
+    received = []
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol(
+        receive_buffer_size=2 ** 20, receive_batch_size=16, dispatch_queue_size=4
+    )
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        osc_protocol.register(pattern="/n_go", procedure=procedure)
+        osc_protocol.send(OscMessage("/notify", 1))
+        _, address = peer.recvfrom(1024)
+        for i in range(500):
+            if i % 50:
+                datagram = OscMessage("/n_go", i).to_datagram()
+            else:
+                datagram = OscBundle(contents=[OscMessage("/n_go", i)]).to_datagram()
+            peer.sendto(datagram, address)
+        for _ in range(100):
+            if len(received) == 500:
+                break
+            time.sleep(0.05)
+        assert received == list(range(500))
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+    assert not osc_protocol.is_running
+    assert osc_protocol.socket is None
+    assert osc_protocol.receive_thread is None
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_healthcheck_failed():
+    def on_healthcheck_failed():
+        healthcheck_failed.append(True)
+
+    healthcheck_failed = []
+    healthcheck = HealthCheck(
+        ["/status"],
+        ["/status.reply"],
+        on_healthcheck_failed,
+        timeout=0.1,
+        backoff_factor=1.0,
+        max_attempts=3,
+    )
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.connect("127.0.0.1", find_free_port(), healthcheck=healthcheck)
+    for _ in range(50):
+        if healthcheck_failed:
+            break
+        time.sleep(0.1)
+    assert healthcheck_failed
+    assert not osc_protocol.is_running
+
+
+class _TcpEchoServer(socketserver.ThreadingTCPServer):
+    """
+    Echo length-prefixed OSC packets back to their sender.
+    """
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        socketserver.ThreadingTCPServer.__init__(
+            self, ("127.0.0.1", 0), _TcpEchoHandler
+        )
+        self.connections = []
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        for connection in self.connections:
+            connection.shutdown(socket.SHUT_RDWR)
+
+
+class _TcpEchoHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.server.connections.append(self.request)
+        while True:
+            prefix = self.rfile.read(4)
+            if len(prefix) < 4:
+                return
+            packet = self.rfile.read(int.from_bytes(prefix, "big"))
+            self.wfile.write(prefix + packet)
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedTcpOscProtocol():
+    def procedure(message):
+        received.append(message)
+
+    def on_healthcheck_failed():
+        healthcheck_failed.append(True)
+
+    received = []
+    healthcheck_failed = []
+    healthcheck = HealthCheck(["/status"], ["/status"], on_healthcheck_failed)
+    server = _TcpEchoServer()
+    osc_protocol = ThreadedTcpOscProtocol()
+    osc_protocol.connect(
+        "127.0.0.1", server.server_address[1], healthcheck=healthcheck
+    )
+    try:
+        assert osc_protocol.maximum_packet_size > 8192
+        osc_protocol.register(pattern="/d_recv", procedure=procedure)
+        blob = bytes(range(256)) * 256
+        osc_protocol.send(OscMessage("/d_recv", blob))
+        osc_protocol.send(OscBundle(contents=[OscMessage("/d_recv", b"abc")] * 3))
+        for _ in range(100):
+            if len(received) == 4:
+                break
+            time.sleep(0.05)
+        assert received == [OscMessage("/d_recv", blob)] + [
+            OscMessage("/d_recv", b"abc")
+        ] * 3
+        assert osc_protocol.is_running
+    finally:
+        server.stop()
+    for _ in range(100):
+        if healthcheck_failed:
+            break
+        time.sleep(0.05)
+    assert healthcheck_failed
+    assert not osc_protocol.is_running
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_AsyncTcpOscProtocol():
+    def procedure(message):
+        received.append(message)
+
+    async def handle(reader, writer):
+        while True:
+            try:
+                prefix = await reader.readexactly(4)
+                packet = await reader.readexactly(int.from_bytes(prefix, "big"))
+            except asyncio.IncompleteReadError:
+                break
+            writer.write(prefix + packet)
+        writer.close()
+
+    received = []
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    osc_protocol = AsyncTcpOscProtocol()
+    await osc_protocol.connect("127.0.0.1", server.sockets[0].getsockname()[1])
+    assert osc_protocol.is_running
+    osc_protocol.register(pattern="/d_recv", procedure=procedure)
+    blob = bytes(range(256)) * 256
+    osc_protocol.send(OscMessage("/d_recv", blob))
+    osc_protocol.send(OscBundle(contents=[OscMessage("/d_recv", b"abc")] * 3))
+    for _ in range(100):
+        if len(received) == 4:
+            break
+        await asyncio.sleep(0.05)
+    assert received == [OscMessage("/d_recv", blob)] + [
+        OscMessage("/d_recv", b"abc")
+    ] * 3
+    await osc_protocol.disconnect()
+    assert not osc_protocol.is_running
+    server.close()
+    await server.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_AsyncTcpOscProtocol_coalesce(caplog):
+    async def handle(reader, writer):
+        while True:
+            try:
+                prefix = await reader.readexactly(4)
+                packets.append(await reader.readexactly(int.from_bytes(prefix, "big")))
+            except asyncio.IncompleteReadError:
+                break
+        writer.close()
+
+    packets = []
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    osc_protocol = AsyncTcpOscProtocol(coalesce=True)
+    assert isinstance(osc_protocol, asyncio.Protocol)
+    assert not isinstance(osc_protocol, asyncio.DatagramProtocol)
+    await osc_protocol.connect("127.0.0.1", server.sockets[0].getsockname()[1])
+    try:
+        with caplog.at_level("DEBUG", logger="supriya"):
+            for i in range(10):
+                osc_protocol.send(OscMessage("/n_set", i, "frequency", 440.0))
+            for _ in range(100):
+                if packets:
+                    break
+                await asyncio.sleep(0.05)
+        assert len(packets) == 1
+        assert OscBundle.from_datagram(packets[0]).contents == tuple(
+            OscMessage("/n_set", i, "frequency", 440.0) for i in range(10)
+        )
+        assert osc_protocol.coalescing_statistics.message_count == 10
+        assert {x.name for x in caplog.records} == {
+            "supriya.osc.out",
+            "supriya.tcp.out",
+        }
+    finally:
+        await osc_protocol.disconnect()
+        server.close()
+        await server.wait_closed()
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_AsyncOscProtocol_coalesce():
+    class Receiver(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            datagrams.append(data)
+
+    datagrams = []
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        Receiver, local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info("sockname")[1]
+    osc_protocol = AsyncOscProtocol(coalesce=True)
+    osc_protocol.maximum_packet_size = 512
+    await osc_protocol.connect("127.0.0.1", port)
+    try:
+        for i in range(100):
+            osc_protocol.send(OscMessage("/n_set", i, "frequency", 440.0))
+        assert not datagrams
+        await asyncio.sleep(0.1)
+        messages = []
+        for datagram in datagrams:
+            assert len(datagram) <= 512
+            if datagram.startswith(b"#bundle"):
+                messages.extend(OscBundle.from_datagram(datagram).contents)
+            else:
+                messages.append(OscMessage.from_datagram(datagram))
+        assert [message.contents[0] for message in messages] == list(range(100))
+        statistics = osc_protocol.coalescing_statistics
+        assert statistics.flush_count == 1
+        assert statistics.message_count == 100
+        assert statistics.packet_count == len(datagrams) < 100
+        # Bundles flush pending messages ahead of themselves.
+        datagrams[:] = []
+        osc_protocol.send(OscMessage("/a"))
+        osc_protocol.send(OscBundle(contents=[OscMessage("/b")]))
+        await asyncio.sleep(0.1)
+        assert [x[:2] for x in datagrams] == [b"/a", b"#b"]
+    finally:
+        await osc_protocol.disconnect()
+        transport.close()
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_bounded_capture():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol()
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        with osc_protocol.capture(
+            addresses=["/n_*", "/done"], maximum_entries=10, maximum_bytes=1024
+        ) as transcript:
+            osc_protocol.send(OscMessage("/notify", 1))
+            _, address = peer.recvfrom(1024)
+            for i in range(100):
+                peer.sendto(OscMessage("/n_go", i).to_datagram(), address)
+                peer.sendto(OscMessage("/status.reply", i).to_datagram(), address)
+            for _ in range(100):
+                if transcript.dropped_count == 90:
+                    break
+                time.sleep(0.05)
+            osc_protocol.send(OscMessage("/n_free", 1000))
+        assert transcript.dropped_count == 91
+        assert len(transcript) == 10
+        assert transcript.byte_count == 10 * 16
+        assert [message for _, message in transcript.received_messages] == [
+            OscMessage("/n_go", i) for i in range(91, 100)
+        ]
+        assert [message for _, message in transcript.sent_messages] == [
+            OscMessage("/n_free", 1000)
+        ]
+        assert transcript[-1].label == "S"
+        assert transcript.messages == list(transcript)
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+def test_Capture_messages():
+    osc_protocol = ThreadedOscProtocol()
+    for capture in (
+        osc_protocol.capture(),
+        osc_protocol.capture(maximum_entries=10),
+    ):
+        start_time = time.time()
+        capture._record("S", OscMessage("/sync", 1))
+        assert start_time <= capture[0].timestamp <= time.time()
+    capture = osc_protocol.capture()
+    entry = CaptureEntry(timestamp=0.0, label="R", message=OscMessage("/synced", 1))
+    capture.messages.append(entry)
+    assert list(capture) == [entry]
+    capture.messages.clear()
+    assert len(capture) == 0
+
+
+@pytest.mark.timeout(30)
+def test_ThreadedOscProtocol_send_raw():
+    peer = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", 0))
+    osc_protocol = ThreadedOscProtocol()
+    template = OscTemplate(OscMessage("/n_set", 1000, "gate", 1), {"node_id": 0})
+    with pytest.raises(OscProtocolOffline):
+        osc_protocol.send_raw(template.patch(node_id=1000))
+    osc_protocol.connect("127.0.0.1", peer.getsockname()[1])
+    try:
+        with osc_protocol.capture() as transcript:
+            for i in range(3):
+                osc_protocol.send_raw(template.patch(node_id=1000 + i))
+        datagrams = [peer.recvfrom(1024)[0] for _ in range(3)]
+        assert [OscMessage.from_datagram(x) for x in datagrams] == [
+            OscMessage("/n_set", 1000 + i, "gate", 1) for i in range(3)
+        ]
+        assert [message for _, message in transcript.sent_messages] == [
+            OscMessage("/n_set", 1000 + i, "gate", 1) for i in range(3)
+        ]
+    finally:
+        osc_protocol.disconnect()
+        peer.close()
+
+
+@pytest.mark.asyncio
+async def test_AsyncOscProtocol_send_raw():
+    class Receiver(asyncio.DatagramProtocol):
+        def datagram_received(self, data, addr):
+            datagrams.append(data)
+
+    datagrams = []
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        Receiver, local_addr=("127.0.0.1", 0)
+    )
+    port = transport.get_extra_info("sockname")[1]
+    osc_protocol = AsyncOscProtocol(coalesce=True)
+    await osc_protocol.connect("127.0.0.1", port)
+    try:
+        template = OscTemplate(OscMessage("/n_free", 1000), {"node_id": 0})
+        osc_protocol.send(OscMessage("/a"))
+        # Raw datagrams flush pending messages ahead of themselves.
+        osc_protocol.send_raw(template.patch(node_id=1001))
+        template.patch(node_id=1002)
+        await asyncio.sleep(0.1)
+        assert datagrams == [
+            OscMessage("/a").to_datagram(),
+            OscMessage("/n_free", 1001).to_datagram(),
+        ]
+    finally:
+        await osc_protocol.disconnect()
+        transport.close()
@@ -0,0 +1,202 @@
+import socket
+import time
+
+import pytest
+import uqbar.strings
+
+import supriya
+from supriya.assets.synthdefs import default
+from supriya.commands import (
+    BufferAllocateRequest,
+    BufferQueryRequest,
+    ControlBusGetRequest,
+    ControlBusSetRequest,
+    NodeQueryRequest,
+    StatusRequest,
+    SynthDefReceiveRequest,
+    SynthNewRequest,
+)
+from supriya.realtime import AsyncServer, Server
+from supriya.enums import RequestId
+from supriya.osc import OscMessage
+from supriya.realtime.fakes import FakeScsynth
+
+pytestmark = pytest.mark.timeout(15)
+
+
+@pytest.fixture
+def fake():
+    with FakeScsynth() as fake:
+        yield fake
+
+
+def test_node_tree(fake):
+    server = Server().connect(port=fake.port)
+    try:
+        group = supriya.Group().allocate(target_node=server)
+        synth_a = supriya.Synth(frequency=443).allocate(target_node=group)
+        synth_b = supriya.Synth().allocate(target_node=synth_a, add_action="ADD_BEFORE")
+        synth_a["amplitude"] = 0.5
+        server.sync()
+        assert str(fake.query_tree()) == uqbar.strings.normalize(
+            """
+            NODE TREE 0 group
+                1 group
+                    1000 group
+                        1002 default
+                            out: 0.0, amplitude: 0.1, frequency: 440.0, gate: 1.0, pan: 0.5
+                        1001 default
+                            out: 0.0, amplitude: 0.5, frequency: 443.0, gate: 1.0, pan: 0.5
+            """
+        )
+        assert str(server.query_remote_nodes(True)) == str(fake.query_tree())
+        with server.osc_protocol.capture() as transcript:
+            group.free()
+            server.sync()
+        assert [
+            message
+            for _, message in transcript.received_messages
+            if message.address == "/n_end"
+        ] == [
+            OscMessage("/n_end", 1000, 1, -1, -1, 1, 1002, 1001),
+            OscMessage("/n_end", 1002, 1000, -1, 1001, 0),
+            OscMessage("/n_end", 1001, 1000, -1, -1, 0),
+        ]
+        assert not synth_a.is_allocated and not synth_b.is_allocated
+        assert fake.node_count == 2
+    finally:
+        server.disconnect()
+
+
+def test_requests(fake):
+    server = Server().connect(port=fake.port)
+    try:
+        response = BufferAllocateRequest(
+            buffer_id=3, frame_count=512, channel_count=1
+        ).communicate(server=server)
+        assert response.action == ("/b_alloc", 3)
+        ControlBusSetRequest(index_value_pairs=[(4, 0.5)]).communicate(server=server)
+        response = ControlBusGetRequest(indices=[4, 5]).communicate(server=server)
+        assert [(x.bus_id, x.bus_value) for x in response] == [(4, 0.5), (5, 0.0)]
+        response = StatusRequest().communicate(server=server)
+        assert response.group_count == 2
+        assert response.synth_count == 0
+        assert response.synthdef_count > 0
+    finally:
+        server.disconnect()
+
+
+def test_integer_addresses(fake):
+    client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    client.settimeout(5.0)
+    try:
+        for message in [
+            OscMessage(int(RequestId.NOTIFY), 1),
+            OscMessage(
+                int(RequestId.SYNTHDEF_RECEIVE),
+                default.compile(),
+                OscMessage(int(RequestId.SYNTH_NEW), "default", 1000, 0, 0),
+            ),
+        ]:
+            client.sendto(message.to_datagram(), ("127.0.0.1", fake.port))
+        replies = []
+        while not replies or replies[-1].address != "/n_go":
+            datagram, _ = client.recvfrom(65536)
+            replies.append(OscMessage.from_datagram(datagram))
+        assert replies[-1].contents[:2] == (1000, 0)
+        assert fake.node_count == 2
+        for message in [
+            OscMessage(int(RequestId.NODE_FREE), 1000),
+            OscMessage(int(RequestId.SYNC), 1),
+        ]:
+            client.sendto(message.to_datagram(), ("127.0.0.1", fake.port))
+        while replies[-1].address != "/synced":
+            datagram, _ = client.recvfrom(65536)
+            replies.append(OscMessage.from_datagram(datagram))
+        assert replies[-2] == OscMessage("/n_end", 1000, 0, -1, -1, 0)
+        assert fake.node_count == 1
+    finally:
+        client.close()
+
+
+def test_latency():
+    with FakeScsynth(latency=0.05) as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            start_time = time.monotonic()
+            server.sync()
+            assert time.monotonic() - start_time >= 0.05
+        finally:
+            server.disconnect()
+
+
+def test_packet_loss():
+    with FakeScsynth(packet_loss=1.0) as fake:
+        server = Server()
+        with pytest.raises(Exception):
+            server.connect(port=fake.port)
+        assert fake.received_count > 0
+        assert fake.dropped_count == fake.received_count
+        assert fake.sent_count == 0
+
+
+def test_communicate_many():
+    with FakeScsynth(latency=0.05) as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            requests = [
+                BufferAllocateRequest(buffer_id=i, frame_count=64, channel_count=1)
+                for i in range(50)
+            ]
+            requests.extend(BufferQueryRequest(buffer_ids=[i]) for i in range(50))
+            requests.extend(StatusRequest() for _ in range(3))
+            requests.append(SynthDefReceiveRequest(synthdefs=[default]))
+            requests.append(
+                SynthNewRequest(node_id=1000, synthdef=default, target_node_id=1)
+            )
+            requests.append(NodeQueryRequest(node_id=1000))
+            start_time = time.monotonic()
+            responses = server.communicate_many(requests, fence=True)
+            # One round trip for the whole batch, rather than one per request.
+            assert time.monotonic() - start_time < 1.0
+            assert len(responses) == len(requests)
+            assert [x.action for x in responses[:50]] == [
+                ("/b_alloc", i) for i in range(50)
+            ]
+            assert [x.items[0].buffer_id for x in responses[50:100]] == list(range(50))
+            assert [x.group_count for x in responses[100:103]] == [2, 2, 2]
+            assert responses[103].action == ("/d_recv",)
+            assert responses[104].node_id == 1000
+            assert responses[105].node_id == 1000
+            # Timeouts resolve to None
+            fake.latency = 2.0
+            responses = server.communicate_many([StatusRequest()], timeout=0.1)
+            assert responses == [None]
+        finally:
+            fake.latency = 0.0
+            server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_AsyncServer_communicate_many(fake):
+    server = await AsyncServer().connect(port=fake.port)
+    try:
+        responses = await server.communicate_many(
+            [BufferQueryRequest(buffer_ids=[i]) for i in range(10)], fence=True
+        )
+        assert [x.items[0].buffer_id for x in responses] == list(range(10))
+        assert await server.communicate_many([]) == []
+    finally:
+        await server.disconnect()
+    with pytest.raises(supriya.exceptions.ServerOffline):
+        await server.communicate_many([StatusRequest()])
+
+
+@pytest.mark.asyncio
+async def test_AsyncServer(fake):
+    server = await AsyncServer().connect(port=fake.port)
+    try:
+        tree = await server.query()
+        assert [x.node_id for x in tree.children] == [1]
+    finally:
+        await server.disconnect()
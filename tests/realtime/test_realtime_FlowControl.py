@@ -0,0 +1,157 @@
+import time
+
+import pytest
+
+from supriya.osc import OscMessage
+from supriya.realtime import AsyncServer, FlowControl, Server
+from supriya.realtime.fakes import FakeScsynth
+
+pytestmark = pytest.mark.timeout(15)
+
+
+def _send_bus_sets(server, count):
+    for i in range(count):
+        server.send(OscMessage("/c_set", i, float(i)))
+
+
+def test_fences():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(fence_interval=256)
+            _send_bus_sets(server, 100)
+            statistics = flow_control.statistics
+            assert statistics.sent_count == 100
+            assert statistics.sent_bytes == 100 * 20
+            # A fence follows every 13th 20-byte message, at 260 bytes.
+            assert statistics.fence_count == 7
+            server.sync()
+            assert flow_control.pending_fence_count == 0
+            assert statistics.acknowledged_bytes == 7 * 260
+            assert flow_control.outstanding_bytes == 2000 + 16 - 7 * 260
+            assert statistics.minimum_rtt <= statistics.smoothed_rtt
+            assert statistics.smoothed_rtt <= statistics.maximum_rtt
+            assert statistics.dropped_count == statistics.late_count == 0
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+def test_stall():
+    with FakeScsynth(latency=0.05) as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(
+                maximum_outstanding_bytes=512, fence_interval=128, late_threshold=0.01
+            )
+            start_time = time.monotonic()
+            _send_bus_sets(server, 100)
+            assert time.monotonic() - start_time >= 0.05
+            statistics = flow_control.statistics
+            assert statistics.stall_count > 0
+            assert statistics.late_count > 0
+            assert statistics.last_rtt >= 0.05
+            assert flow_control.outstanding_bytes <= 512
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+def test_dispatch_thread():
+    with FakeScsynth(latency=0.05) as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(
+                maximum_outstanding_bytes=512, fence_interval=128, timeout=5.0
+            )
+            durations = []
+
+            def procedure(message):
+                start_time = time.monotonic()
+                _send_bus_sets(server, 100)
+                durations.append(time.monotonic() - start_time)
+
+            server.osc_protocol.register(
+                pattern=["/c_set", 0], procedure=procedure, once=True
+            )
+            server.send(OscMessage("/c_get", 0))
+            server.sync()
+            # Replies arrive on the dispatch thread, so it never stalls.
+            assert durations and durations[0] < 1.0
+            assert flow_control.statistics.overrun_count > 0
+            assert flow_control.statistics.stall_count == 0
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+def test_capture():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(fence_interval=256)
+            with server.osc_protocol.capture() as transcript:
+                _send_bus_sets(server, 20)
+            sent = [x.message.address for x in transcript if x.label == "S"]
+            assert sent.count("/c_set") == 20
+            assert sent.count("/sync") == flow_control.statistics.fence_count == 1
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+def test_dropped():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(
+                maximum_outstanding_bytes=256, fence_interval=64, timeout=0.1
+            )
+            fake.packet_loss = 1.0
+            _send_bus_sets(server, 20)
+            fake.packet_loss = 0.0
+            statistics = flow_control.statistics
+            # Stalls only end once unanswered fences expire as dropped.
+            assert statistics.stall_count > 0
+            assert statistics.dropped_count > 0
+            assert statistics.dropped_count == (
+                statistics.fence_count - flow_control.pending_fence_count
+            )
+            assert flow_control.outstanding_bytes <= 256
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+def test_throttle():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(rate=10000, burst=500)
+            start_time = time.monotonic()
+            _send_bus_sets(server, 100)
+            # 2000 bytes, less a 500 byte burst, at 10000 bytes per second
+            assert time.monotonic() - start_time >= 0.14
+            assert flow_control.statistics.throttle_count > 0
+        finally:
+            server.flow_control = None
+            server.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_AsyncServer():
+    with FakeScsynth(latency=0.05) as fake:
+        server = await AsyncServer().connect(port=fake.port)
+        try:
+            flow_control = server.flow_control = FlowControl(
+                maximum_outstanding_bytes=512, fence_interval=128
+            )
+            start_time = time.monotonic()
+            _send_bus_sets(server, 100)
+            # Async servers never block, only count overruns.
+            assert time.monotonic() - start_time < 0.05
+            assert flow_control.statistics.overrun_count > 0
+            assert flow_control.statistics.stall_count == 0
+        finally:
+            server.flow_control = None
+            await server.disconnect()
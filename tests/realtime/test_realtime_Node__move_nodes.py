@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+from supriya import AddAction
+from supriya.commands import GroupNewRequest, RequestBundle, SynthNewRequest
+from supriya.realtime import Group, Server, Synth
+from supriya.realtime.fakes import FakeScsynth
+from supriya.realtime.nodes import Node
+
+
+def _make_tree():
+    return Group(
+        [Group([Synth(), Synth(name="a")], name="b"), Synth(), Group(name="c")],
+        name="root",
+    )
+
+
+def _structure(group):
+    return [
+        (node.name, _structure(node) if isinstance(node, Group) else None)
+        for node in group
+    ]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_move_node(seed):
+    structures = []
+    for bulk in (False, True):
+        rng = random.Random(seed)
+        root = Group(name="root")
+        nodes = [
+            (Group if rng.random() < 0.3 else Synth)(name=str(i)) for i in range(30)
+        ]
+        groups = [root] + [x for x in nodes if isinstance(x, Group)]
+        moves = []
+        for _ in range(100):
+            node = rng.choice(nodes)
+            target_node = rng.choice(groups)
+            add_action = rng.choice(list(AddAction)[:4])
+            if target_node is node or node in target_node.parentage:
+                continue
+            moves.append((target_node, add_action, node))
+        moves = [(root, AddAction.ADD_TO_TAIL, x) for x in nodes] + moves
+
+        def iterate_moves():
+            for target_node, add_action, node in moves:
+                if add_action in (AddAction.ADD_BEFORE, AddAction.ADD_AFTER):
+                    if target_node._parent is None:
+                        continue
+                if isinstance(node, Group) and node in target_node.parentage:
+                    continue
+                yield target_node, add_action, node
+
+        if bulk:
+            Node._move_nodes(iterate_moves())
+        else:
+            for target_node, add_action, node in iterate_moves():
+                target_node._move_node(add_action=add_action, node=node)
+        structures.append(_structure(root))
+    assert structures[0] == structures[1]
+
+
+def test_Server_apply_local_requests():
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            group = _make_tree()
+            synth = group["b"][0]
+            expected = _structure(group)
+            control_names = sorted(group.controls.as_dict())
+            statistics = server.lock_statistics
+            acquisition_count = statistics.acquisition_count
+            group.allocate(target_node=server)
+            server.sync()
+            assert statistics.acquisition_count > acquisition_count
+            assert statistics.request_count > 0
+            assert statistics.maximum_hold_time >= statistics.last_hold_time > 0
+            assert _structure(group) == expected
+            assert sorted(group.controls.as_dict()) == control_names
+            assert all(server._nodes[x.node_id] is x for x in group.depth_first())
+            assert synth.parent is group["b"]
+            assert str(server.query_local_nodes()) == str(server.query_remote_nodes())
+            # Runs of node-creating requests are placed together.
+            new_group = Group(name="d")
+            request = RequestBundle(
+                contents=[
+                    GroupNewRequest(
+                        items=[
+                            GroupNewRequest.Item(
+                                add_action=AddAction.ADD_BEFORE,
+                                node_id=new_group,
+                                target_node_id=group["c"],
+                            )
+                        ]
+                    ),
+                    SynthNewRequest(
+                        add_action=AddAction.ADD_TO_HEAD,
+                        node_id=Synth(name="e"),
+                        synthdef="default",
+                        target_node_id=new_group,
+                    ),
+                ]
+            )
+            server._apply_local_requests([request])
+            assert [x.name for x in group] == ["b", None, "d", "c"]
+            assert [x.name for x in new_group] == ["e"]
+        finally:
+            server.disconnect()
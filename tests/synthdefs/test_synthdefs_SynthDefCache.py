@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+import supriya
+import supriya.synthdefs
+import supriya.ugens
+from supriya.realtime import Server
+from supriya.realtime.fakes import FakeScsynth
+from supriya.synthdefs import (
+    Parameter,
+    Range,
+    SynthDefBuilder,
+    SynthDefCache,
+    SynthDefFactory,
+)
+
+
+def signal_block(builder, source, state):
+    return supriya.ugens.SinOsc.ar(frequency=builder["frequency"]) * state.get(
+        "scale", 1.0
+    )
+
+
+def make_factory():
+    return (
+        SynthDefFactory(
+            frequency=Parameter(
+                lag=0.1,
+                range_=Range(20, 20000),
+                unit=supriya.Unit.HERTZ,
+                value=440,
+            ),
+            offsets=[0.0, 0.5],
+        )
+        .with_signal_block(signal_block)
+        .with_gate()
+        .with_output()
+    )
+
+
+def make_builder(frequency=443):
+    with SynthDefBuilder(amplitude=0.1) as builder:
+        source = supriya.ugens.SinOsc.ar(frequency=frequency)
+        supriya.ugens.Out.ar(bus=0, source=source * builder["amplitude"])
+    return builder
+
+
+@pytest.mark.parametrize("name", [None, "cached"])
+def test_build(tmp_path, name):
+    cache = SynthDefCache(tmp_path)
+    factory = make_factory()
+    synthdef = cache.build(factory, name=name, scale=0.5)
+    assert len(list(tmp_path.iterdir())) == 2
+    cached_synthdef = cache.build(factory, name=name, scale=0.5)
+    assert cached_synthdef is not synthdef
+    assert cached_synthdef._ugens is None
+    assert cached_synthdef == synthdef
+    assert cached_synthdef.name == synthdef.name
+    assert cached_synthdef.actual_name == synthdef.actual_name
+    assert cached_synthdef.compile() == synthdef.compile()
+    assert cached_synthdef.indexed_parameters == synthdef.indexed_parameters
+    assert cached_synthdef.to_dict() == synthdef.to_dict()
+    assert cached_synthdef._ugens is None
+    # UGens are decompiled on demand, with single-precision constants.
+    decompiled_synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+        synthdef.compile()
+    )
+    assert str(cached_synthdef) == str(decompiled_synthdef)
+    assert cached_synthdef.constants == decompiled_synthdef.constants
+    assert cached_synthdef.has_gate and cached_synthdef.done_actions == [2]
+
+
+def test_get_key(tmp_path):
+    cache = SynthDefCache(tmp_path)
+    factory = make_factory()
+    key = cache.get_key(factory)
+    assert key == cache.get_key(make_factory())
+    assert key != cache.get_key(factory, name="named")
+    assert key != cache.get_key(factory, scale=0.5)
+    assert key != cache.get_key(factory.with_gate(attack_time=0.5))
+    assert key != cache.get_key(factory.with_parameters(offsets=[0.0, 0.25]))
+    assert cache.get_key(make_builder()) == cache.get_key(make_builder())
+    assert cache.get_key(make_builder()) != cache.get_key(make_builder(442))
+    assert cache.get_key(make_builder()) != cache.get_key(
+        make_builder(), optimize=False
+    )
+    with pytest.raises(ValueError):
+        cache.get_key(factory, scale=object())
+    with pytest.raises(ValueError):
+        cache.get_key(make_builder().build())
+
+
+def test_evict(tmp_path):
+    cache = SynthDefCache(tmp_path, maximum_entries=2)
+    keys = []
+    for i, frequency in enumerate([440, 441, 442]):
+        builder = make_builder(frequency)
+        keys.append(cache.get_key(builder))
+        cache.put(keys[-1], builder.build())
+        # Age entries explicitly, rather than relying on timestamp resolution.
+        os.utime(str(tmp_path / "{}.json".format(keys[-1])), (i, i))
+        if i == 1:
+            assert cache.get(keys[0]) is not None
+            os.utime(str(tmp_path / "{}.json".format(keys[0])), (2, 2))
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert len(list(tmp_path.iterdir())) == 4
+    cache.maximum_bytes = 0
+    cache.put(keys[1], make_builder(441).build())
+    assert not list(tmp_path.iterdir())
+
+
+def test_corrupt(tmp_path):
+    cache = SynthDefCache(tmp_path)
+    builder = make_builder()
+    synthdef = cache.build(builder)
+    key = cache.get_key(builder)
+    (tmp_path / "{}.json".format(key)).write_text("{")
+    assert cache.get(key) is None
+    assert not list(tmp_path.iterdir())
+    assert cache.build(builder) == synthdef
+    (tmp_path / "{}.scsyndef".format(key)).write_bytes(b"garbage")
+    assert cache.get(key) is None
+    cache.build(builder)
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+
+def test_allocate(tmp_path):
+    cache = SynthDefCache(tmp_path)
+    factory = make_factory()
+    cache.build(factory)
+    synthdef = cache.build(factory)
+    with FakeScsynth() as fake:
+        server = Server().connect(port=fake.port)
+        try:
+            synthdef.allocate(server=server)
+            synth = supriya.Synth(synthdef, frequency=550).allocate(
+                target_node=server, sync=True
+            )
+            assert synthdef._ugens is None
+            tree = fake.query_tree()
+            synth_node = tree.children[0].children[0]
+            assert synth_node.synthdef_name == synthdef.actual_name
+            assert {
+                control.control_name_or_index: control.control_value
+                for control in synth_node
+            }["frequency"] == 550.0
+            synth.free()
+        finally:
+            server.disconnect()
@@ -0,0 +1,63 @@
+import supriya.synthdefs
+import supriya.ugens
+from supriya.synthdefs import Control, OutputProxy, SynthDef
+
+
+def make_ugens():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.PinkNoise.ar()
+        local_buf = supriya.ugens.LocalBuf(2048)
+        pv_chain = supriya.ugens.FFT(buffer_id=local_buf, source=source)
+        pv_chain = supriya.ugens.PV_BinScramble(pv_chain=pv_chain)
+        ifft = supriya.ugens.IFFT.ar(pv_chain=pv_chain)
+        supriya.ugens.Out.ar(bus=0, source=ifft)
+    return list(builder._ugens)
+
+
+def get_graph(ugens):
+    indices = {id(ugen): i for i, ugen in enumerate(ugens)}
+    return [
+        [
+            (indices[id(x.source)], x.output_index)
+            if isinstance(x, OutputProxy)
+            else x
+            for x in ugen.inputs
+        ]
+        for ugen in ugens
+    ]
+
+
+def test_copy_ugen_graph():
+    ugens = make_ugens()
+    # Forward references and duplicates are copied once each.
+    ugens = ugens[::-1] + ugens[:1]
+    copied_ugens = SynthDef._copy_ugen_graph(ugens)
+    assert not {id(x) for x in ugens} & {id(x) for x in copied_ugens}
+    assert copied_ugens[0] is not copied_ugens[-2]
+    assert copied_ugens[-1] is copied_ugens[-2]
+    assert get_graph(copied_ugens) == get_graph(ugens)
+    assert [type(x) for x in copied_ugens] == [type(x) for x in ugens]
+    assert [x.calculation_rate for x in copied_ugens] == [
+        x.calculation_rate for x in ugens
+    ]
+
+
+def test_initializer_copies():
+    ugens = make_ugens()
+    graph = get_graph(ugens)
+    synthdef = SynthDef(ugens)
+    # Local buffer cleanup rewrote the SynthDef's copies, not the originals.
+    assert get_graph(ugens) == graph
+    assert not {id(x) for x in ugens} & {id(x) for x in synthdef.ugens}
+    assert SynthDef(ugens) == synthdef
+
+
+def test_builder_copies():
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        source = supriya.ugens.SinOsc.ar(frequency=builder["frequency"])
+        supriya.ugens.Out.ar(bus=0, source=source)
+    synthdef = builder.build()
+    ugens = [x for x in builder._ugens if not isinstance(x, Control)]
+    assert not {id(x) for x in ugens} & {id(x) for x in synthdef.ugens}
+    assert ugens[0].inputs[0].source is builder["frequency"]
+    assert builder.build() == synthdef
@@ -0,0 +1,119 @@
+import collections
+
+import pytest
+
+import supriya.synthdefs
+import supriya.ugens
+
+
+class PurePan2(supriya.synthdefs.PureMultiOutUGen):
+    _default_channel_count = 2
+    _has_settable_channel_count = False
+    _ordered_input_names = collections.OrderedDict(
+        [("source", None), ("position", 0.0), ("level", 1.0)]
+    )
+    _valid_calculation_rates = (supriya.CalculationRate.AUDIO,)
+
+
+def count_ugens(synthdef, name):
+    return sum(1 for ugen in synthdef.ugens if type(ugen).__name__ == name)
+
+
+def test_merge_duplicates():
+    with supriya.synthdefs.SynthDefBuilder(frequency=440) as builder:
+        lfo_a = supriya.ugens.SinOsc.kr(frequency=0.25)
+        lfo_b = supriya.ugens.SinOsc.kr(frequency=0.25)
+        source_a = supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * lfo_a)
+        source_b = supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * lfo_b)
+        supriya.ugens.Out.ar(bus=0, source=[source_a, source_b])
+    unoptimized_synthdef = builder.build(optimize=False)
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert len(unoptimized_synthdef.ugens) == 8
+    # Elimination is opt-in, so default builds keep their duplicates.
+    assert builder.build().compile() == unoptimized_synthdef.compile()
+    assert len(synthdef.ugens) == 5
+    assert count_ugens(synthdef, "SinOsc") == 2
+    assert count_ugens(synthdef, "BinaryOpUGen") == 1
+    out = synthdef.ugens[-1]
+    assert out.inputs[1] == out.inputs[2]
+    decompiled_synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+        synthdef.compile()
+    )
+    assert str(decompiled_synthdef) == str(synthdef)
+
+
+def test_keep_distinct():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        sources = [
+            supriya.ugens.SinOsc.ar(frequency=440),
+            supriya.ugens.SinOsc.ar(frequency=443),
+            supriya.ugens.SinOsc.kr(frequency=440),
+            supriya.ugens.SinOsc.ar(frequency=440, phase=0.5),
+        ]
+        supriya.ugens.Out.ar(bus=0, source=sources)
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert count_ugens(synthdef, "SinOsc") == 4
+
+
+@pytest.mark.parametrize(
+    "operator, operator_class",
+    [
+        (supriya.UnaryOperator.BILINRAND, supriya.synthdefs.UnaryOpUGen),
+        (supriya.UnaryOperator.COIN, supriya.synthdefs.UnaryOpUGen),
+        (supriya.UnaryOperator.LINRAND, supriya.synthdefs.UnaryOpUGen),
+        (supriya.UnaryOperator.RAND, supriya.synthdefs.UnaryOpUGen),
+        (supriya.UnaryOperator.RAND2, supriya.synthdefs.UnaryOpUGen),
+        (supriya.UnaryOperator.SUM3RAND, supriya.synthdefs.UnaryOpUGen),
+        (supriya.BinaryOperator.EXPRANDRANGE, supriya.synthdefs.BinaryOpUGen),
+        (supriya.BinaryOperator.RANDRANGE, supriya.synthdefs.BinaryOpUGen),
+    ],
+)
+def test_keep_random_operators(operator, operator_class):
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.DC.ar(source=0.5)
+        if operator_class is supriya.synthdefs.UnaryOpUGen:
+            random_a = source._compute_unary_op(source, operator)
+            random_b = source._compute_unary_op(source, operator)
+        else:
+            random_a = source._compute_binary_op(source, 1.0, operator)
+            random_b = source._compute_binary_op(source, 1.0, operator)
+        supriya.ugens.Out.ar(bus=0, source=[random_a, random_b])
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert count_ugens(synthdef, operator_class.__name__) == 2
+    assert [x.special_index for x in synthdef.ugens[1:3]] == [operator] * 2
+
+
+def test_keep_impure():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        noise_a = supriya.ugens.WhiteNoise.ar()
+        noise_b = supriya.ugens.WhiteNoise.ar()
+        supriya.ugens.Out.ar(bus=0, source=[noise_a * 0.5, noise_b * 0.5])
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert count_ugens(synthdef, "WhiteNoise") == 2
+    assert count_ugens(synthdef, "BinaryOpUGen") == 2
+
+
+def test_vibrato():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        sources = [
+            supriya.ugens.Vibrato.ar(),
+            supriya.ugens.Vibrato.ar(),
+            supriya.ugens.Vibrato.ar(depth_variation=0, rate_variation=0),
+            supriya.ugens.Vibrato.ar(depth_variation=0, rate_variation=0),
+        ]
+        supriya.ugens.Out.ar(bus=0, source=sources)
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert count_ugens(synthdef, "Vibrato") == 3
+
+
+def test_multiple_outputs():
+    with supriya.synthdefs.SynthDefBuilder() as builder:
+        source = supriya.ugens.SinOsc.ar()
+        pan_a = PurePan2.ar(source=source)
+        pan_b = PurePan2.ar(source=source)
+        supriya.ugens.Out.ar(bus=0, source=[pan_a[0], pan_b[1]])
+    synthdef = builder.build(eliminate_common_subexpressions=True)
+    assert count_ugens(synthdef, "PurePan2") == 1
+    pan = synthdef.ugens[1]
+    out = synthdef.ugens[-1]
+    assert out.inputs[1:] == (pan[0], pan[1])
@@ -0,0 +1,36 @@
+import supriya.synthdefs
+import supriya.ugens
+
+
+def build_additive_bank(partial_count):
+    with supriya.synthdefs.SynthDefBuilder(frequency=440, amplitude=0.1) as builder:
+        partials = []
+        for i in range(partial_count):
+            sin_osc = supriya.ugens.SinOsc.ar(frequency=builder["frequency"] * (i + 1))
+            partials.append(sin_osc * (builder["amplitude"] / (i + 1.5)))
+        # Unused ugens are eliminated.
+        supriya.ugens.SinOsc.ar(frequency=0.25) * 0.5
+        supriya.ugens.Out.ar(bus=0, source=supriya.ugens.Mix.new(partials))
+    return builder.build()
+
+
+def test_topological_sort():
+    synthdef = build_additive_bank(500)
+    assert len(synthdef.ugens) == 2168
+    assert len(synthdef.constants) == 1000
+    indices = {ugen: i for i, ugen in enumerate(synthdef.ugens)}
+    for i, ugen in enumerate(synthdef.ugens):
+        for input_ in ugen.inputs:
+            if isinstance(input_, supriya.synthdefs.OutputProxy):
+                assert indices[input_.source] < i
+    assert 0.25 not in synthdef.constants and 0.5 not in synthdef.constants
+
+
+def test_round_trip():
+    synthdef = build_additive_bank(500)
+    compiled_synthdef = synthdef.compile()
+    decompiled_synthdef = supriya.synthdefs.SynthDefDecompiler.decompile_synthdef(
+        compiled_synthdef
+    )
+    assert decompiled_synthdef.compile() == compiled_synthdef
+    assert str(decompiled_synthdef) == str(synthdef)
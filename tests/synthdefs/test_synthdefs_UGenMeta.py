@@ -0,0 +1,78 @@
+import collections
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import supriya.synthdefs
+import supriya.ugens
+from supriya.synthdefs import UGen, UGenMethodGenerator
+
+
+def make_ugen_class():
+    class Stub(UGen):
+        _ordered_input_names = collections.OrderedDict(
+            [("frequency", 440.0), ("phase", 0.0)]
+        )
+        _valid_calculation_rates = (
+            supriya.CalculationRate.AUDIO,
+            supriya.CalculationRate.CONTROL,
+        )
+
+    return Stub
+
+
+def test_lazy_methods():
+    ugen_class = make_ugen_class()
+    for name in ["__init__", "_init_source", "ar", "_ar_source", "kr", "_kr_source"]:
+        assert isinstance(vars(ugen_class)[name], UGenMethodGenerator)
+    ugen = ugen_class.ar(frequency=443)
+    assert (
+        ugen.frequency == 443 and ugen.calculation_rate == supriya.CalculationRate.AUDIO
+    )
+    assert "def ar(" in vars(ugen_class)["_ar_source"]
+    assert "def __init__(" in vars(ugen_class)["_init_source"]
+    assert isinstance(vars(ugen_class)["kr"], UGenMethodGenerator)
+    assert "def kr(" in ugen_class._kr_source
+    assert not isinstance(vars(ugen_class)["kr"], UGenMethodGenerator)
+
+
+def test_lazy_methods_subclass():
+    ugen_class = make_ugen_class()
+
+    class SubStub(ugen_class):
+        pass
+
+    ugen = SubStub.kr()
+    assert type(ugen) is SubStub
+    assert not isinstance(vars(ugen_class)["kr"], UGenMethodGenerator)
+    assert "kr" not in vars(SubStub)
+
+
+def test_ugens_module():
+    assert "SinOsc" in dir(supriya.ugens)
+    assert "SinOsc" in supriya.ugens.__all__
+    with pytest.raises(AttributeError):
+        supriya.ugens.NotAUGen
+    # Importing a module directly still binds its class to the package.
+    module = importlib.import_module("supriya.ugens.XFade2")
+    assert supriya.ugens.XFade2 is module.XFade2
+    assert (
+        supriya.ugens.Filter is importlib.import_module("supriya.ugens.Filter").Filter
+    )
+
+
+def test_ugens_module_lazy():
+    script = "; ".join(
+        [
+            "import sys",
+            "import supriya.ugens",
+            "assert 'supriya.ugens.Warp1' not in sys.modules",
+            "assert supriya.ugens.Warp1.__name__ == 'Warp1'",
+            "assert 'supriya.ugens.Warp1' in sys.modules",
+            "from supriya.ugens import *",
+            "assert ZeroCrossing is supriya.ugens.ZeroCrossing",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)